@@ -9,6 +9,8 @@ from typing import Any
 from anthropic import Anthropic
 from anthropic.types import Message, ToolResultBlockParam, ToolUseBlock
 
+from argent.prompts import USER_TOKEN_BUDGETS, trim_json_to_budget
+
 
 class FinancialAgentType(str, Enum):
     """Types of financial analysis agents."""
@@ -166,17 +168,33 @@ class BaseAgent(ABC):
         # Build initial message
         user_message = task
         if context:
-            user_message += f"\n\nContext:\n```json\n{json.dumps(context, default=str)}\n```"
+            budget = USER_TOKEN_BUDGETS.get(self.agent_type.value)
+            if budget is not None:
+                context_json = trim_json_to_budget(context, budget)
+            else:
+                context_json = json.dumps(context, default=str)
+            user_message += f"\n\nContext:\n```json\n{context_json}\n```"
 
         messages: list[dict[str, Any]] = [{"role": "user", "content": user_message}]
         tools = self._build_tools_schema()
 
+        # The system prompt is static per agent and all per-request data goes in
+        # the user message, so tools + system form an identical prefix on every
+        # turn. Mark it as a cache breakpoint so repeat turns reuse the prefill.
+        system = [
+            {
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
         for turn in range(self.max_turns):
             # Call Claude API
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=8192,
-                system=self.system_prompt,
+                system=system,
                 tools=tools if tools else None,
                 messages=messages,
             )
@@ -75,21 +75,24 @@ class RiskAnalysisAgent:
 
         results = {"symbols": {}}
 
+        market_prices = self._price_cache.get("SPY", [])
+        market = calculations.PricesCache.from_prices(market_prices) if market_prices else None
+
         for symbol in symbols:
             prices = self._price_cache.get(symbol, [])
             if not prices or len(prices) < 30:
                 continue
 
-            # Calculate all risk metrics
-            volatility = calculations.calculate_volatility(prices)
-            var_result = calculations.calculate_var(prices, confidence=0.95, horizon=1)
+            # Calculate all risk metrics from one set of log returns
+            cache = calculations.PricesCache.from_prices(prices)
+            volatility = calculations.calculate_volatility(cache)
+            var_result = calculations.calculate_var(cache, confidence=0.95, horizon=1)
             drawdown = calculations.calculate_max_drawdown(prices)
-            sharpe = calculations.calculate_sharpe_ratio(prices, risk_free_rate=0.05)
-            sortino = calculations.calculate_sortino_ratio(prices, risk_free_rate=0.05)
+            sharpe = calculations.calculate_sharpe_ratio(cache, risk_free_rate=0.05)
+            sortino = calculations.calculate_sortino_ratio(cache, risk_free_rate=0.05)
 
             # Calculate beta if we have market data
-            market_prices = self._price_cache.get("SPY", [])
-            beta = calculations.calculate_beta(prices, market_prices) if market_prices else None
+            beta = calculations.calculate_beta(cache, market) if market is not None else None
 
             # Risk score
             risk_score = self._calculate_risk_score(volatility, drawdown["max_drawdown"], var_result["var"])
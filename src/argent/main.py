@@ -224,6 +224,24 @@ def config():
         console.print("\nMake sure you have a .env file with ANTHROPIC_API_KEY set.")
 
 
+@cli.command()
+def init_db():
+    """Create the database schema.
+
+    Run once per deployment so short-lived processes can open the
+    repository without schema checks.
+    """
+    from argent.storage import Repository
+
+    settings = get_settings()
+    repository = Repository(settings.database_url, create_schema=False)
+    try:
+        repository.create_schema()
+    finally:
+        repository.close()
+    console.print(f"[green]Schema ready at {settings.database_url}[/green]")
+
+
 @cli.command()
 @click.argument("symbol")
 def price(symbol: str):
@@ -53,6 +53,7 @@ def get_crypto_client() -> CryptoDataClient:
     global _crypto_client
     if _crypto_client is None:
         _crypto_client = CryptoDataClient()
+        _crypto_client.warm()
     return _crypto_client
 
 
@@ -62,6 +63,8 @@ def get_econ_client() -> EconomicDataClient:
     if _econ_client is None:
         api_key = os.environ.get("FRED_API_KEY")
         _econ_client = EconomicDataClient(api_key=api_key)
+        if api_key:
+            _econ_client.warm()
     return _econ_client
 
 
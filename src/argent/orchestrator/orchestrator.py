@@ -1,6 +1,8 @@
 """Main orchestrator for financial analysis workflow."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, List, Optional
 
 from rich.console import Console
@@ -35,45 +37,52 @@ class FinancialAdvisorOrchestrator:
     settings: Settings = field(default_factory=get_settings)
     console: Console = field(default_factory=Console)
 
-    # Clients
-    _market_client: Optional[MarketDataClient] = field(default=None, init=False)
-    _crypto_client: Optional[CryptoDataClient] = field(default=None, init=False)
-    _economic_client: Optional[EconomicDataClient] = field(default=None, init=False)
-    _news_client: Optional[NewsClient] = field(default=None, init=False)
+    # Clients and agents are built on first use so that narrow entry points
+    # (e.g. run_quick_analysis) only pay for what they touch.
+
+    @cached_property
+    def _market_client(self) -> MarketDataClient:
+        return MarketDataClient(alpha_vantage_api_key=self.settings.alpha_vantage_api_key)
+
+    @cached_property
+    def _crypto_client(self) -> CryptoDataClient:
+        return CryptoDataClient()
+
+    @cached_property
+    def _news_client(self) -> NewsClient:
+        return NewsClient()
+
+    @cached_property
+    def _economic_client(self) -> Optional[EconomicDataClient]:
+        if not self.settings.fred_api_key:
+            return None
+        return EconomicDataClient(api_key=self.settings.fred_api_key)
 
     # Agents (computational, no API calls)
-    _macro_agent: Optional[MacroAnalysisAgent] = field(default=None, init=False)
-    _technical_agent: Optional[TechnicalAnalysisAgent] = field(default=None, init=False)
-    _fundamental_agent: Optional[FundamentalAnalysisAgent] = field(default=None, init=False)
-    _risk_agent: Optional[RiskAnalysisAgent] = field(default=None, init=False)
-    _sentiment_agent: Optional[SentimentAnalysisAgent] = field(default=None, init=False)
-    _report_agent: Optional[ReportAgent] = field(default=None, init=False)
-
-    def __post_init__(self) -> None:
-        """Initialize clients and agents."""
-        self._initialize_clients()
-        self._initialize_agents()
-
-    def _initialize_clients(self) -> None:
-        """Initialize data clients."""
-        self._market_client = MarketDataClient(
-            alpha_vantage_api_key=self.settings.alpha_vantage_api_key
-        )
-        self._crypto_client = CryptoDataClient()
-        self._news_client = NewsClient()
-        if self.settings.fred_api_key:
-            self._economic_client = EconomicDataClient(api_key=self.settings.fred_api_key)
-
-    def _initialize_agents(self) -> None:
-        """Initialize analysis agents (all computational, no AI API calls)."""
-        self._macro_agent = MacroAnalysisAgent()
-        self._technical_agent = TechnicalAnalysisAgent()
-        self._fundamental_agent = FundamentalAnalysisAgent(
-            market_client=self._market_client,
-        )
-        self._risk_agent = RiskAnalysisAgent()
-        self._sentiment_agent = SentimentAnalysisAgent()
-        self._report_agent = ReportAgent()
+
+    @cached_property
+    def _macro_agent(self) -> MacroAnalysisAgent:
+        return MacroAnalysisAgent()
+
+    @cached_property
+    def _technical_agent(self) -> TechnicalAnalysisAgent:
+        return TechnicalAnalysisAgent()
+
+    @cached_property
+    def _fundamental_agent(self) -> FundamentalAnalysisAgent:
+        return FundamentalAnalysisAgent(market_client=self._market_client)
+
+    @cached_property
+    def _risk_agent(self) -> RiskAnalysisAgent:
+        return RiskAnalysisAgent()
+
+    @cached_property
+    def _sentiment_agent(self) -> SentimentAnalysisAgent:
+        return SentimentAnalysisAgent()
+
+    @cached_property
+    def _report_agent(self) -> ReportAgent:
+        return ReportAgent()
 
     def run_analysis(
         self,
@@ -108,6 +117,11 @@ class FinancialAdvisorOrchestrator:
         self.console.print(f"Symbols: {', '.join(state.symbols)}")
         self.console.print(f"Time horizon: {state.time_horizon.value}\n")
 
+        # Fetch the macro snapshot in the background while stock data is
+        # collected; the collection phase joins it instead of fetching again
+        if self._economic_client:
+            self._economic_client.warm()
+
         try:
             # Phase 1: Data Collection
             self._run_data_collection(state, show_progress)
@@ -268,13 +282,20 @@ class FinancialAdvisorOrchestrator:
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
             disable=not show_progress,
-        ) as progress:
+        ) as progress, ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            # The analyses only read collected data and each writes its own
+            # result field, so they can run side by side; the fundamental
+            # agent's network calls overlap with the computational ones.
+            futures = {}
             for phase, description, run_fn in analyses:
                 task = progress.add_task(f"Running {description}...", total=None)
                 state.start_phase(phase)
+                futures[executor.submit(run_fn, state)] = (phase, description, task)
 
+            for future in as_completed(futures):
+                phase, description, task = futures[future]
                 try:
-                    run_fn(state)
+                    future.result()
                     state.complete_phase(phase)
                     progress.update(task, description=f"[green]✓ {description} complete[/green]")
                 except Exception as e:
@@ -1,5 +1,27 @@
-"""Agent system prompts."""
+"""Agent system prompts.
 
+Each prompt is a single module-level constant shared by every request.
+Send it as the ``system`` parameter on its own and put per-request data
+(symbols, prices, news) in the user message; never concatenate request
+data onto a prompt, so the prefix stays byte-identical for prompt caching.
+
+Each prompt module also sets MAX_USER_TOKENS, the budget for that user
+message; use trim_json_to_budget (or trim_to_budget for plain text) to
+keep request context within it.
+"""
+
+from types import MappingProxyType
+
+from argent.prompts import (
+    data_collection,
+    fundamental_analysis,
+    macro_analysis,
+    report,
+    risk_analysis,
+    sentiment_analysis,
+    technical_analysis,
+)
+from argent.prompts._budget import estimate_tokens, trim_json_to_budget, trim_to_budget
 from argent.prompts.data_collection import DATA_COLLECTION_SYSTEM_PROMPT
 from argent.prompts.fundamental_analysis import FUNDAMENTAL_ANALYSIS_SYSTEM_PROMPT
 from argent.prompts.macro_analysis import MACRO_ANALYSIS_SYSTEM_PROMPT
@@ -8,7 +30,39 @@ from argent.prompts.risk_analysis import RISK_ANALYSIS_SYSTEM_PROMPT
 from argent.prompts.sentiment_analysis import SENTIMENT_ANALYSIS_SYSTEM_PROMPT
 from argent.prompts.technical_analysis import TECHNICAL_ANALYSIS_SYSTEM_PROMPT
 
+# Read-only registry keyed by agent type value (see FinancialAgentType).
+# The prompts are static, so they are resolved once at import time.
+SYSTEM_PROMPTS = MappingProxyType(
+    {
+        "data_collection": DATA_COLLECTION_SYSTEM_PROMPT,
+        "macro_analysis": MACRO_ANALYSIS_SYSTEM_PROMPT,
+        "technical_analysis": TECHNICAL_ANALYSIS_SYSTEM_PROMPT,
+        "fundamental_analysis": FUNDAMENTAL_ANALYSIS_SYSTEM_PROMPT,
+        "risk_analysis": RISK_ANALYSIS_SYSTEM_PROMPT,
+        "sentiment_analysis": SENTIMENT_ANALYSIS_SYSTEM_PROMPT,
+        "report": REPORT_SYSTEM_PROMPT,
+    }
+)
+
+# User context token budgets, keyed like SYSTEM_PROMPTS.
+USER_TOKEN_BUDGETS = MappingProxyType(
+    {
+        "data_collection": data_collection.MAX_USER_TOKENS,
+        "macro_analysis": macro_analysis.MAX_USER_TOKENS,
+        "technical_analysis": technical_analysis.MAX_USER_TOKENS,
+        "fundamental_analysis": fundamental_analysis.MAX_USER_TOKENS,
+        "risk_analysis": risk_analysis.MAX_USER_TOKENS,
+        "sentiment_analysis": sentiment_analysis.MAX_USER_TOKENS,
+        "report": report.MAX_USER_TOKENS,
+    }
+)
+
 __all__ = [
+    "SYSTEM_PROMPTS",
+    "USER_TOKEN_BUDGETS",
+    "estimate_tokens",
+    "trim_json_to_budget",
+    "trim_to_budget",
     "DATA_COLLECTION_SYSTEM_PROMPT",
     "MACRO_ANALYSIS_SYSTEM_PROMPT",
     "TECHNICAL_ANALYSIS_SYSTEM_PROMPT",
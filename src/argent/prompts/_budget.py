@@ -0,0 +1,113 @@
+"""Token budgets for per-request user context."""
+
+import json
+from typing import Any
+
+# Rough characters-per-token ratio for English prose and JSON. This is an
+# estimate, not a tokenizer: budgets are set with enough headroom for it.
+CHARS_PER_TOKEN = 4
+
+TRUNCATION_MARKER = "\n...[truncated]...\n"
+
+# Strings in JSON context are never cut shorter than this many characters
+MIN_JSON_STRING_CHARS = 64
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in text."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def trim_to_budget(text: str, max_tokens: int) -> str:
+    """
+    Trim text to roughly max_tokens, keeping its head and tail.
+
+    The middle is dropped and replaced with TRUNCATION_MARKER, so both the
+    start of the context and its most recent items survive.
+
+    Args:
+        text: Text to trim
+        max_tokens: Token budget
+
+    Returns:
+        The original text if it fits the budget, the trimmed text otherwise
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    keep = max(max_chars - len(TRUNCATION_MARKER), 0)
+    head = keep // 2
+    tail = keep - head
+    return text[:head] + TRUNCATION_MARKER + (text[-tail:] if tail else "")
+
+
+def _shrink_json(obj: Any, max_items: int, max_chars: int) -> Any:
+    """Copy decoded JSON, keeping at most max_items per container and max_chars per string."""
+    if isinstance(obj, str):
+        if len(obj) <= max_chars:
+            return obj
+        head = max_chars // 2
+        return obj[:head] + TRUNCATION_MARKER.strip() + obj[len(obj) - (max_chars - head):]
+    if isinstance(obj, list):
+        if len(obj) <= max_items:
+            return [_shrink_json(item, max_items, max_chars) for item in obj]
+        # Keep the first and most recent items, noting how many were dropped
+        head = -(-max_items // 2)
+        tail = max_items - head
+        kept = obj[:head] + [f"...[{len(obj) - max_items} items truncated]..."]
+        if tail:
+            kept += obj[-tail:]
+        return [_shrink_json(item, max_items, max_chars) for item in kept]
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        shrunk = {k: _shrink_json(v, max_items, max_chars) for k, v in items[:max_items]}
+        if len(items) > max_items:
+            shrunk["..."] = f"[{len(items) - max_items} fields truncated]"
+        return shrunk
+    return obj
+
+
+def _largest_json(obj: Any) -> tuple[int, int]:
+    """Largest container length and longest string in decoded JSON."""
+    if isinstance(obj, str):
+        return 0, len(obj)
+    if isinstance(obj, (list, dict)):
+        values = obj.values() if isinstance(obj, dict) else obj
+        items, chars = len(obj), 0
+        for value in values:
+            value_items, value_chars = _largest_json(value)
+            items = max(items, value_items)
+            chars = max(chars, value_chars)
+        return items, chars
+    return 0, 0
+
+
+def trim_json_to_budget(data: Any, max_tokens: int) -> str:
+    """
+    Encode data as JSON of roughly max_tokens, trimming it at the data level.
+
+    Unlike trim_to_budget on the encoded text, the result always parses.
+    The longest lists and strings are halved first, keeping their first and
+    most recent items with a note of what was dropped, and large objects
+    keep their leading fields. Values json cannot encode are stringified.
+
+    Args:
+        data: JSON-compatible context data
+        max_tokens: Token budget
+
+    Returns:
+        Compact JSON text for data, trimmed if it does not fit the budget
+    """
+    text = json.dumps(data, default=str)
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    plain = json.loads(text)
+    max_items, max_string = _largest_json(plain)
+    while len(text) > max_chars and (max_items > 1 or max_string > MIN_JSON_STRING_CHARS):
+        max_items = max(max_items // 2, 1)
+        max_string = max(max_string // 2, MIN_JSON_STRING_CHARS)
+        text = json.dumps(_shrink_json(plain, max_items, max_string))
+    return text
@@ -1,5 +1,8 @@
 """Data collection agent system prompt."""
 
+# Token budget for the per-request user context sent alongside this prompt
+MAX_USER_TOKENS = 8192
+
 DATA_COLLECTION_SYSTEM_PROMPT = """You are a Financial Data Collection Specialist. Your role is to gather comprehensive market and economic data for investment analysis.
 
 ## Your Responsibilities
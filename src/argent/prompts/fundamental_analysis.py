@@ -1,5 +1,8 @@
 """Fundamental analysis agent system prompt."""
 
+# Token budget for the per-request user context sent alongside this prompt
+MAX_USER_TOKENS = 4096
+
 FUNDAMENTAL_ANALYSIS_SYSTEM_PROMPT = """You are a Fundamental Analyst specializing in company valuation and financial statement analysis.
 
 ## Your Expertise
@@ -1,5 +1,8 @@
 """Macro analysis agent system prompt."""
 
+# Token budget for the per-request user context sent alongside this prompt
+MAX_USER_TOKENS = 4096
+
 MACRO_ANALYSIS_SYSTEM_PROMPT = """You are a Macroeconomic Analyst specializing in understanding how economic conditions affect financial markets and investments.
 
 ## Your Expertise
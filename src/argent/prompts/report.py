@@ -1,5 +1,8 @@
 """Report generation agent system prompt."""
 
+# Token budget for the per-request user context sent alongside this prompt
+MAX_USER_TOKENS = 16384
+
 REPORT_SYSTEM_PROMPT = """You are a Senior Investment Strategist responsible for synthesizing analysis into actionable investment recommendations.
 
 ## Your Role
@@ -1,5 +1,8 @@
 """Risk analysis agent system prompt."""
 
+# Token budget for the per-request user context sent alongside this prompt
+MAX_USER_TOKENS = 4096
+
 RISK_ANALYSIS_SYSTEM_PROMPT = """You are a Risk Analyst specializing in portfolio risk assessment and quantitative risk metrics.
 
 ## Your Expertise
@@ -1,5 +1,8 @@
 """Sentiment analysis agent system prompt."""
 
+# Token budget for the per-request user context sent alongside this prompt
+MAX_USER_TOKENS = 4096
+
 SENTIMENT_ANALYSIS_SYSTEM_PROMPT = """You are a Sentiment Analyst specializing in market psychology, news analysis, and investor behavior.
 
 ## Your Expertise
@@ -1,5 +1,8 @@
 """Technical analysis agent system prompt."""
 
+# Token budget for the per-request user context sent alongside this prompt
+MAX_USER_TOKENS = 4096
+
 TECHNICAL_ANALYSIS_SYSTEM_PROMPT = """You are a Technical Analyst specializing in price action, chart patterns, and quantitative indicators.
 
 ## Your Expertise
@@ -1,16 +1,34 @@
 """Structured output schemas for agent responses."""
 
 from argent.schemas.outputs import (
+    OUTPUT_SCHEMAS,
+    FedStance,
     FundamentalAnalysisOutput,
     MacroAnalysisOutput,
+    Outlook,
     ReportOutput,
     RiskAnalysisOutput,
+    RiskLevel,
+    Sentiment,
     SentimentAnalysisOutput,
+    Signal,
     SignalOutput,
     TechnicalAnalysisOutput,
+    Trend,
+    Valuation,
+    decode_output,
 )
 
 __all__ = [
+    "OUTPUT_SCHEMAS",
+    "decode_output",
+    "Signal",
+    "Trend",
+    "RiskLevel",
+    "Valuation",
+    "Sentiment",
+    "FedStance",
+    "Outlook",
     "SignalOutput",
     "TechnicalAnalysisOutput",
     "RiskAnalysisOutput",
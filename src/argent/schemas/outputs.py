@@ -4,25 +4,114 @@ These Pydantic models define the contract between agents, ensuring
 consistent data formats for inter-agent communication and final reports.
 """
 
+import time
 from datetime import datetime
+from enum import StrEnum
+from types import MappingProxyType
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+# Resolution of the shared timestamp used for per-analysis outputs
+_NOW_RESOLUTION = 0.1
+_last_now: tuple[float, datetime] = (float("-inf"), datetime.min)
 
-class SignalOutput(BaseModel):
+
+def _now_coarse() -> datetime:
+    """Wall-clock time, refreshed at most every _NOW_RESOLUTION seconds."""
+    global _last_now
+    tick = time.monotonic()
+    if tick - _last_now[0] > _NOW_RESOLUTION:
+        _last_now = (tick, datetime.now())
+    return _last_now[1]
+
+
+class Signal(StrEnum):
+    """Trading signal / recommended action."""
+
+    STRONG_BUY = "strong_buy"
+    BUY = "buy"
+    HOLD = "hold"
+    SELL = "sell"
+    STRONG_SELL = "strong_sell"
+
+
+class Trend(StrEnum):
+    """Price trend classification."""
+
+    STRONG_UPTREND = "strong_uptrend"
+    UPTREND = "uptrend"
+    SIDEWAYS = "sideways"
+    DOWNTREND = "downtrend"
+    STRONG_DOWNTREND = "strong_downtrend"
+
+
+class RiskLevel(StrEnum):
+    """Risk classification."""
+
+    LOW = "low"
+    MODERATE = "moderate"
+    HIGH = "high"
+    VERY_HIGH = "very_high"
+
+
+class Valuation(StrEnum):
+    """Valuation assessment."""
+
+    DEEPLY_UNDERVALUED = "deeply_undervalued"
+    UNDERVALUED = "undervalued"
+    FAIR = "fair"
+    OVERVALUED = "overvalued"
+    DEEPLY_OVERVALUED = "deeply_overvalued"
+
+
+class Sentiment(StrEnum):
+    """Market sentiment classification."""
+
+    EXTREMELY_BEARISH = "extremely_bearish"
+    BEARISH = "bearish"
+    NEUTRAL = "neutral"
+    BULLISH = "bullish"
+    EXTREMELY_BULLISH = "extremely_bullish"
+
+
+class FedStance(StrEnum):
+    """Monetary policy stance."""
+
+    VERY_HAWKISH = "very_hawkish"
+    HAWKISH = "hawkish"
+    NEUTRAL = "neutral"
+    DOVISH = "dovish"
+    VERY_DOVISH = "very_dovish"
+
+
+class Outlook(StrEnum):
+    """Asset class outlook."""
+
+    BULLISH = "bullish"
+    NEUTRAL = "neutral"
+    BEARISH = "bearish"
+
+
+class _OutputModel(BaseModel):
+    """Base for output schemas. Instances are immutable once validated."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class SignalOutput(_OutputModel):
     """Trading signal with confidence level."""
 
-    signal: Literal["strong_buy", "buy", "hold", "sell", "strong_sell"]
+    signal: Signal
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence level 0.0-1.0")
     rationale: str | None = Field(default=None, description="Brief explanation")
 
 
-class TechnicalAnalysisOutput(BaseModel):
+class TechnicalAnalysisOutput(_OutputModel):
     """Output schema for technical analysis."""
 
     symbol: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_coarse)
     signal: SignalOutput
 
     # Price data
@@ -36,7 +125,7 @@ class TechnicalAnalysisOutput(BaseModel):
     )
 
     # Trend analysis
-    trend: Literal["strong_uptrend", "uptrend", "sideways", "downtrend", "strong_downtrend"]
+    trend: Trend
     trend_strength: float = Field(ge=0.0, le=1.0)
 
     # Key levels
@@ -47,15 +136,15 @@ class TechnicalAnalysisOutput(BaseModel):
     interpretation: str = Field(description="Human-readable analysis summary")
 
 
-class RiskAnalysisOutput(BaseModel):
+class RiskAnalysisOutput(_OutputModel):
     """Output schema for risk analysis."""
 
     symbol: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_coarse)
     signal: SignalOutput
 
     # Risk classification
-    risk_level: Literal["low", "moderate", "high", "very_high"]
+    risk_level: RiskLevel
 
     # Key risk metrics
     key_metrics: dict[str, float] = Field(
@@ -84,15 +173,15 @@ class RiskAnalysisOutput(BaseModel):
     interpretation: str = Field(description="Human-readable risk assessment")
 
 
-class FundamentalAnalysisOutput(BaseModel):
+class FundamentalAnalysisOutput(_OutputModel):
     """Output schema for fundamental analysis (stocks only)."""
 
     symbol: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_coarse)
     signal: SignalOutput
 
     # Valuation assessment
-    valuation: Literal["deeply_undervalued", "undervalued", "fair", "overvalued", "deeply_overvalued"]
+    valuation: Valuation
 
     # Key fundamental metrics
     key_metrics: dict[str, float | None] = Field(
@@ -128,17 +217,15 @@ class FundamentalAnalysisOutput(BaseModel):
     interpretation: str = Field(description="Human-readable fundamental analysis")
 
 
-class SentimentAnalysisOutput(BaseModel):
+class SentimentAnalysisOutput(_OutputModel):
     """Output schema for sentiment analysis."""
 
     symbol: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_coarse)
     signal: SignalOutput
 
     # Sentiment classification
-    sentiment: Literal[
-        "extremely_bearish", "bearish", "neutral", "bullish", "extremely_bullish"
-    ]
+    sentiment: Sentiment
 
     # Sentiment score (-100 to +100)
     sentiment_score: float = Field(ge=-100.0, le=100.0)
@@ -166,10 +253,10 @@ class SentimentAnalysisOutput(BaseModel):
     interpretation: str = Field(description="Human-readable sentiment analysis")
 
 
-class MacroAnalysisOutput(BaseModel):
+class MacroAnalysisOutput(_OutputModel):
     """Output schema for macroeconomic analysis."""
 
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_coarse)
     signal: SignalOutput
 
     # Economic cycle
@@ -177,7 +264,7 @@ class MacroAnalysisOutput(BaseModel):
     cycle_confidence: float = Field(ge=0.0, le=1.0)
 
     # Monetary policy
-    fed_stance: Literal["very_hawkish", "hawkish", "neutral", "dovish", "very_dovish"]
+    fed_stance: FedStance
 
     # Key metrics
     key_metrics: dict[str, float | None] = Field(
@@ -197,9 +284,9 @@ class MacroAnalysisOutput(BaseModel):
     vix: float | None = None
 
     # Asset class implications
-    stock_outlook: Literal["bullish", "neutral", "bearish"]
-    bond_outlook: Literal["bullish", "neutral", "bearish"]
-    crypto_outlook: Literal["bullish", "neutral", "bearish"]
+    stock_outlook: Outlook
+    bond_outlook: Outlook
+    crypto_outlook: Outlook
 
     # Risk factors
     risk_factors: list[str] = Field(default_factory=list)
@@ -208,11 +295,11 @@ class MacroAnalysisOutput(BaseModel):
     interpretation: str = Field(description="Human-readable macro analysis")
 
 
-class RecommendationEntry(BaseModel):
+class RecommendationEntry(_OutputModel):
     """Single recommendation entry for the report."""
 
     symbol: str
-    action: Literal["strong_buy", "buy", "hold", "sell", "strong_sell"]
+    action: Signal
     entry_price: float | None = None
     target_price: float | None = None
     stop_loss: float | None = None
@@ -221,7 +308,7 @@ class RecommendationEntry(BaseModel):
     rationale: str | None = None
 
 
-class PositionSizing(BaseModel):
+class PositionSizing(_OutputModel):
     """Position sizing recommendations by risk profile."""
 
     conservative_pct: float = Field(ge=0.0, le=100.0)
@@ -229,7 +316,7 @@ class PositionSizing(BaseModel):
     aggressive_pct: float = Field(ge=0.0, le=100.0)
 
 
-class ReportOutput(BaseModel):
+class ReportOutput(_OutputModel):
     """Output schema for the final investment report."""
 
     timestamp: datetime = Field(default_factory=datetime.now)
@@ -270,3 +357,31 @@ class ReportOutput(BaseModel):
     overall_confidence: float = Field(ge=0.0, le=1.0)
     analyst_agreement: Literal["strong", "moderate", "mixed", "divergent"]
     caveats: list[str] = Field(default_factory=list)
+
+
+# Output schema per agent type value (see FinancialAgentType). The data
+# collection agent has no structured output schema.
+OUTPUT_SCHEMAS: MappingProxyType[str, type[_OutputModel]] = MappingProxyType(
+    {
+        "macro_analysis": MacroAnalysisOutput,
+        "technical_analysis": TechnicalAnalysisOutput,
+        "fundamental_analysis": FundamentalAnalysisOutput,
+        "risk_analysis": RiskAnalysisOutput,
+        "sentiment_analysis": SentimentAnalysisOutput,
+        "report": ReportOutput,
+    }
+)
+
+
+def decode_output(agent_type: str, raw: str | bytes) -> _OutputModel:
+    """
+    Decode a raw JSON agent response into its output schema.
+
+    Validates straight from the JSON text with model_validate_json, so no
+    intermediate dict is built.
+
+    Raises:
+        KeyError: If the agent type has no output schema
+        pydantic.ValidationError: If the payload does not match the schema
+    """
+    return OUTPUT_SCHEMAS[agent_type].model_validate_json(raw)
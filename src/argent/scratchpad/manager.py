@@ -5,48 +5,178 @@ The scratchpad allows agents to:
 2. Store intermediate analysis results
 3. Pass structured data between pipeline stages
 
-Data is stored in JSON files, organized by session and data type.
+Data is stored in JSON files, organized by session and data type. Large
+payloads are stored once per session under a content hash and referenced
+from the entry file, so identical data written under several keys or
+rewritten unchanged is not duplicated on disk.
 """
 
+import asyncio
+import hashlib
 import json
 import os
+import shutil
+import string
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+from weakref import WeakValueDictionary
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to stdlib json
+    orjson = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 # Default scratchpad directory
 SCRATCHPAD_DIR = Path(__file__).parent.parent.parent.parent / "data" / "scratchpad"
 
+# Maximum number of entries whose bytes are kept in memory per scratchpad
+MEMORY_CACHE_SIZE = 256
+
+# Payloads larger than this many encoded bytes go to the content-addressed store
+INLINE_DATA_LIMIT = 4096
+
+# Session subdirectory holding content-addressed payloads
+OBJECTS_DIR = "_objects"
+
+# Object-store writes and object-backed deletes between sweeps for payloads
+# they may have orphaned
+OBJECT_SWEEP_INTERVAL = 64
+
+# Guards object-store writes against concurrent sweeps in this process
+_objects_lock = threading.Lock()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a value as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, default=str, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes read from the scratchpad."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Leaf types that JSON encodes as-is and need no wrapping
+_JSON_NATIVE = frozenset({str, int, float, bool, type(None)})
+
+
+# Maps every ASCII character that is not safe in a filename to "_"
+_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+_UNSAFE_TO_UNDERSCORE = {i: "_" for i in range(128) if chr(i) not in _SAFE_CHARS}
+
+
+def _safe_key(key: str) -> str:
+    """Sanitize a key for use as a filename."""
+    if key.isascii():
+        return key.translate(_UNSAFE_TO_UNDERSCORE)
+    return "".join(c if c.isalnum() or c in "._-" else "_" for c in key)
+
 
 def _serialize_for_json(obj: Any) -> Any:
     """Serialize objects for JSON storage."""
+    if type(obj) in _JSON_NATIVE:
+        return obj
+    if isinstance(obj, (list, tuple)):
+        # Check leaves inline so plain numbers/strings skip the recursive call
+        return [
+            item if type(item) in _JSON_NATIVE else _serialize_for_json(item)
+            for item in obj
+        ]
+    if isinstance(obj, dict):
+        return {
+            k: v if type(v) in _JSON_NATIVE else _serialize_for_json(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    if isinstance(obj, BaseModel):
+        # Plain JSON form, so read_as can validate the stored bytes directly
+        return obj.model_dump(mode="json")
     if is_dataclass(obj) and not isinstance(obj, type):
         return {"__dataclass__": type(obj).__name__, "__data__": asdict(obj)}
-    elif isinstance(obj, datetime):
-        return {"__datetime__": obj.isoformat()}
-    elif isinstance(obj, (list, tuple)):
-        return [_serialize_for_json(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: _serialize_for_json(v) for k, v in obj.items()}
     return obj
 
 
 def _deserialize_from_json(obj: Any) -> Any:
     """Deserialize objects from JSON storage."""
+    if type(obj) in _JSON_NATIVE:
+        return obj
     if isinstance(obj, dict):
         if "__datetime__" in obj:
             return datetime.fromisoformat(obj["__datetime__"])
         elif "__dataclass__" in obj:
             # Return as dict, dataclass reconstruction is caller's responsibility
             return obj["__data__"]
-        return {k: _deserialize_from_json(v) for k, v in obj.items()}
+        return {
+            k: v if type(v) in _JSON_NATIVE else _deserialize_from_json(v)
+            for k, v in obj.items()
+        }
     elif isinstance(obj, list):
-        return [_deserialize_from_json(item) for item in obj]
+        return [
+            item if type(item) in _JSON_NATIVE else _deserialize_from_json(item)
+            for item in obj
+        ]
     return obj
 
 
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """
+    Write bytes to path through a temporary file and an atomic rename.
+
+    Uses raw os.open/os.write so a small entry costs one write syscall,
+    and readers never see a partially written file. The temporary file is
+    removed if the write fails.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _check_category(category: str) -> None:
+    """Reject the category name reserved for the object store."""
+    if category == OBJECTS_DIR:
+        raise ValueError(f"Category name {OBJECTS_DIR!r} is reserved for stored payloads")
+
+
+def _is_stale(timestamp: str, max_age_seconds: int | None) -> bool:
+    """Check an entry timestamp against an optional maximum age."""
+    if max_age_seconds is None:
+        return False
+    age = (datetime.now() - datetime.fromisoformat(timestamp)).total_seconds()
+    return age > max_age_seconds
+
+
 class Scratchpad:
     """
     Scratchpad for sharing data between agents.
@@ -79,6 +209,19 @@ class Scratchpad:
                 ...
     """
 
+    # Fixed attribute set; __weakref__ keeps instances usable in _instances
+    __slots__ = (
+        "session_id",
+        "base_dir",
+        "session_dir",
+        "_category_dirs",
+        "_mem",
+        "_object_changes",
+        "_fetch_locks",
+        "_async_fetch_locks",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         session_id: str | None = None,
@@ -95,19 +238,152 @@ class Scratchpad:
         self.session_id = session_id or f"session_{int(time.time())}"
         self.base_dir = scratchpad_dir or SCRATCHPAD_DIR
         self.session_dir = self.base_dir / self.session_id
+        # Categories whose directory is known to exist
+        self._category_dirs: set[str] = set()
+        # Entry and object bytes keyed by (category, key), validated against file stat
+        self._mem: OrderedDict[
+            tuple[str, str], tuple[tuple[int, int], bytes, bytes | None]
+        ] = OrderedDict()
+        # Object-store writes and deletes since the last sweep of orphaned payloads
+        self._object_changes = 0
+        # Per-entry locks that collapse concurrent fetches of the same key
+        self._fetch_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._async_fetch_locks: dict[tuple[str, str], asyncio.Lock] = {}
         self._ensure_dirs()
 
     def _ensure_dirs(self) -> None:
         """Ensure necessary directories exist."""
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+    def _get_category_dir(self, category: str) -> Path:
+        """Get the directory for a category, creating it if needed."""
+        category_dir = self.session_dir / category
+        if category not in self._category_dirs:
+            category_dir.mkdir(parents=True, exist_ok=True)
+            self._category_dirs.add(category)
+        return category_dir
+
     def _get_path(self, category: str, key: str) -> Path:
         """Get the file path for a data entry."""
-        category_dir = self.session_dir / category
-        category_dir.mkdir(parents=True, exist_ok=True)
-        # Sanitize key for use as filename
-        safe_key = "".join(c if c.isalnum() or c in "._-" else "_" for c in key)
-        return category_dir / f"{safe_key}.json"
+        _check_category(category)
+        return self._get_category_dir(category) / f"{_safe_key(key)}.json"
+
+    def _load_entry(self, category: str, key: str) -> dict[str, Any] | None:
+        """
+        Load and decode an entry, serving repeat reads from memory.
+
+        The entry and object bytes are kept in memory as long as the file's
+        mtime and size are unchanged, so writes from other Scratchpad
+        instances are still picked up. The bytes are decoded on every call,
+        so each caller gets its own objects and may mutate them freely.
+        """
+        path = self._get_path(category, key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._mem.pop((category, key), None)
+            return None
+
+        cache_key = (category, key)
+        version = (stat.st_mtime_ns, stat.st_size)
+        hit = self._mem.get(cache_key)
+        if hit is not None and hit[0] == version:
+            try:
+                self._mem.move_to_end(cache_key)
+            except KeyError:
+                pass  # Dropped by a concurrent write, delete or eviction
+            _, raw_bytes, object_bytes = hit
+        else:
+            raw_bytes = path.read_bytes()
+            object_bytes = None
+            ref = _loads(raw_bytes).get("ref")
+            if ref is not None:
+                object_path = self.session_dir / OBJECTS_DIR / f"{ref}.json"
+                try:
+                    object_bytes = object_path.read_bytes()
+                except FileNotFoundError:
+                    return None
+
+            self._mem[cache_key] = (version, raw_bytes, object_bytes)
+            if len(self._mem) > MEMORY_CACHE_SIZE:
+                try:
+                    self._mem.popitem(last=False)
+                except KeyError:
+                    pass
+
+        raw = _loads(raw_bytes)
+        data = raw.get("data") if object_bytes is None else _loads(object_bytes)
+        return {
+            "timestamp": raw["timestamp"],
+            "data": _deserialize_from_json(data),
+            "metadata": raw.get("metadata", {}),
+        }
+
+    def _encode_entry(
+        self,
+        category: str,
+        key: str,
+        data: Any,
+        timestamp: str,
+        metadata: dict[str, Any],
+    ) -> tuple[bytes, str | None, bytes]:
+        """
+        Encode an entry file, splitting off large payloads for the object store.
+
+        The payload is encoded once. Up to INLINE_DATA_LIMIT bytes it is spliced
+        into the entry as "data"; larger payloads are keyed by their hash and
+        the entry only records it, so rewriting identical data just rewrites
+        the small entry file.
+
+        Returns:
+            Tuple of (entry bytes, payload hash or None if inline, payload bytes)
+        """
+        entry: dict[str, Any] = {
+            "key": key,
+            "category": category,
+            "timestamp": timestamp,
+            "metadata": metadata,
+        }
+        payload = _dumps(_serialize_for_json(data))
+
+        if len(payload) <= INLINE_DATA_LIMIT:
+            # The entry dict is never empty, so it always ends in "}"
+            return _dumps(entry)[:-1] + b',"data":' + payload + b"}", None, payload
+
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        entry["ref"] = digest
+        return _dumps(entry), digest, payload
+
+    def _store_entry(
+        self,
+        path: Path,
+        category: str,
+        key: str,
+        data: Any,
+        timestamp: str,
+        metadata: dict[str, Any],
+    ) -> None:
+        """Write one entry file, storing its payload in OBJECTS_DIR if large."""
+        encoded, digest, payload = self._encode_entry(category, key, data, timestamp, metadata)
+        if digest is None:
+            _write_atomic(path, encoded)
+        else:
+            # Held until the entry references the object, so a sweep cannot
+            # remove an object that is being reused
+            with _objects_lock:
+                object_path = self._get_category_dir(OBJECTS_DIR) / f"{digest}.json"
+                if not object_path.exists():
+                    _write_atomic(object_path, payload)
+                _write_atomic(path, encoded)
+            # An overwrite may have orphaned the entry's previous object
+            self._note_object_change()
+        self._mem.pop((category, key), None)
+
+    def _note_object_change(self) -> None:
+        """Count a change that may orphan an object, sweeping every OBJECT_SWEEP_INTERVAL."""
+        self._object_changes += 1
+        if self._object_changes >= OBJECT_SWEEP_INTERVAL:
+            self.sweep_objects()
 
     def write(
         self,
@@ -126,17 +402,40 @@ class Scratchpad:
             metadata: Optional metadata (source, timestamp, etc.)
         """
         path = self._get_path(category, key)
+        timestamp = datetime.now().isoformat()
 
-        entry = {
-            "key": key,
-            "category": category,
-            "timestamp": datetime.now().isoformat(),
-            "data": _serialize_for_json(data),
-            "metadata": metadata or {},
-        }
+        self._store_entry(path, category, key, data, timestamp, metadata or {})
+
+    def write_many(
+        self,
+        category: str,
+        entries: dict[str, Any],
+        metadata: dict[str, Any] | None = None,
+    ) -> int:
+        """
+        Write several entries of one category in a single pass.
+
+        The category directory is resolved once and all entries share the
+        same timestamp and metadata.
+
+        Args:
+            category: Data category
+            entries: Mapping of key to data
+            metadata: Optional metadata applied to every entry
+
+        Returns:
+            Number of entries written
+        """
+        _check_category(category)
+        category_dir = self._get_category_dir(category)
+        timestamp = datetime.now().isoformat()
+        metadata = metadata or {}
+
+        for key, data in entries.items():
+            path = category_dir / f"{_safe_key(key)}.json"
+            self._store_entry(path, category, key, data, timestamp, metadata)
 
-        with open(path, "w") as f:
-            json.dump(entry, f, indent=2, default=str)
+        return len(entries)
 
     def read(
         self,
@@ -155,27 +454,120 @@ class Scratchpad:
         Returns:
             Data if found and not stale, None otherwise
         """
-        path = self._get_path(category, key)
+        try:
+            entry = self._load_entry(category, key)
+            if entry is None:
+                return None
+
+            if _is_stale(entry["timestamp"], max_age_seconds):
+                return None
 
-        if not path.exists():
+            return entry["data"]
+
+        except (json.JSONDecodeError, KeyError, ValueError):
             return None
 
+    def read_as(
+        self,
+        cls: type[ModelT],
+        category: str,
+        key: str,
+        max_age_seconds: int | None = None,
+    ) -> ModelT | None:
+        """
+        Read an entry straight into a Pydantic model.
+
+        Payloads kept in the object store are validated from their raw
+        bytes with model_validate_json, skipping the intermediate dicts.
+
+        Args:
+            cls: Model class to validate into (e.g. TechnicalAnalysisOutput)
+            category: Data category
+            key: Data key
+            max_age_seconds: Maximum age of data in seconds (None = no limit)
+
+        Returns:
+            Model instance if found, fresh and valid, None otherwise
+        """
+        path = self._get_path(category, key)
+
         try:
-            with open(path, "r") as f:
-                entry = json.load(f)
-
-            # Check age if max_age specified
-            if max_age_seconds is not None:
-                timestamp = datetime.fromisoformat(entry["timestamp"])
-                age = (datetime.now() - timestamp).total_seconds()
-                if age > max_age_seconds:
-                    return None
+            raw = _loads(path.read_bytes())
+            if _is_stale(raw["timestamp"], max_age_seconds):
+                return None
 
-            return _deserialize_from_json(entry.get("data"))
+            if "ref" in raw:
+                object_path = self.session_dir / OBJECTS_DIR / f"{raw['ref']}.json"
+                return cls.model_validate_json(object_path.read_bytes())
+            return cls.model_validate(_deserialize_from_json(raw.get("data")))
 
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, KeyError, ValueError):
             return None
 
+    def read_or_fetch(
+        self,
+        category: str,
+        key: str,
+        fetcher: Callable[[], Any],
+        max_age_seconds: int | None = None,
+    ) -> Any | None:
+        """
+        Read an entry, calling fetcher and storing its result on a miss.
+
+        Concurrent callers asking for the same entry wait on a per-entry lock,
+        so only one of them calls fetcher and the others read its result.
+        Different entries are fetched independently.
+
+        Args:
+            category: Data category
+            key: Data key
+            fetcher: Zero-argument callable returning fresh data
+            max_age_seconds: Maximum age of stored data (None = no limit)
+
+        Returns:
+            Stored or freshly fetched data
+        """
+        data = self.read(category, key, max_age_seconds)
+        if data is not None:
+            return data
+
+        lock = self._fetch_locks.setdefault((category, key), threading.Lock())
+        with lock:
+            # Another caller may have fetched it while we waited
+            data = self.read(category, key, max_age_seconds)
+            if data is not None:
+                return data
+
+            data = fetcher()
+            if data is not None:
+                self.write(category, key, data)
+            return data
+
+    async def aread_or_fetch(
+        self,
+        category: str,
+        key: str,
+        fetcher: Callable[[], Awaitable[Any]],
+        max_age_seconds: int | None = None,
+    ) -> Any | None:
+        """Async version of read_or_fetch for coroutine fetchers."""
+        data = self.read(category, key, max_age_seconds)
+        if data is not None:
+            return data
+
+        lock = self._async_fetch_locks.setdefault((category, key), asyncio.Lock())
+        async with lock:
+            data = self.read(category, key, max_age_seconds)
+            if data is not None:
+                return data
+
+            data = await fetcher()
+            if data is not None:
+                self.write(category, key, data)
+            return data
+
     def read_with_metadata(
         self,
         category: str,
@@ -187,20 +579,15 @@ class Scratchpad:
         Returns:
             Tuple of (data, metadata). Data is None if not found.
         """
-        path = self._get_path(category, key)
-
-        if not path.exists():
-            return None, {}
-
         try:
-            with open(path, "r") as f:
-                entry = json.load(f)
+            entry = self._load_entry(category, key)
+            if entry is None:
+                return None, {}
 
-            data = _deserialize_from_json(entry.get("data"))
-            metadata = entry.get("metadata", {})
-            metadata["_timestamp"] = entry.get("timestamp")
+            metadata = dict(entry["metadata"])
+            metadata["_timestamp"] = entry["timestamp"]
 
-            return data, metadata
+            return entry["data"], metadata
 
         except (json.JSONDecodeError, KeyError, ValueError):
             return None, {}
@@ -228,34 +615,104 @@ class Scratchpad:
         return [
             d.name
             for d in self.session_dir.iterdir()
-            if d.is_dir()
+            if d.is_dir() and d.name != OBJECTS_DIR
         ]
 
     def delete(self, category: str, key: str) -> bool:
-        """Delete a specific entry."""
+        """Delete a specific entry; its stored object is removed by a later sweep."""
         path = self._get_path(category, key)
-        if path.exists():
-            path.unlink()
-            return True
-        return False
+        self._mem.pop((category, key), None)
+        try:
+            referenced = "ref" in _loads(path.read_bytes())
+        except FileNotFoundError:
+            return False
+        except ValueError:
+            referenced = False
+        path.unlink(missing_ok=True)
+        if referenced:
+            self._note_object_change()
+        return True
 
     def clear_category(self, category: str) -> int:
         """Clear all entries in a category. Returns count deleted."""
-        category_dir = self.session_dir / category
-        if not category_dir.exists():
-            return 0
+        _check_category(category)
+        for cache_key in [k for k in list(self._mem) if k[0] == category]:
+            self._mem.pop(cache_key, None)
 
         count = 0
-        for path in category_dir.glob("*.json"):
-            path.unlink()
-            count += 1
+        try:
+            with os.scandir(self.session_dir / category) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
+                        count += 1
+        except FileNotFoundError:
+            return 0
+        if count:
+            self.sweep_objects()
         return count
 
+    def sweep_objects(self) -> int:
+        """
+        Remove stored objects no longer referenced by any entry.
+
+        Runs after clears, and after every OBJECT_SWEEP_INTERVAL object-store
+        writes or object-backed deletes, since each may orphan a payload.
+
+        Returns:
+            Number of objects removed
+        """
+        objects_dir = self.session_dir / OBJECTS_DIR
+        with _objects_lock:
+            self._object_changes = 0
+            try:
+                with os.scandir(objects_dir) as entries:
+                    stored = {
+                        entry.name[:-5]: entry.path
+                        for entry in entries
+                        if entry.name.endswith(".json")
+                    }
+            except FileNotFoundError:
+                return 0
+            if not stored:
+                return 0
+
+            for category_dir in self.session_dir.iterdir():
+                if category_dir.name == OBJECTS_DIR or not category_dir.is_dir():
+                    continue
+                for path in category_dir.glob("*.json"):
+                    try:
+                        ref = _loads(path.read_bytes()).get("ref")
+                    except (FileNotFoundError, ValueError):
+                        continue
+                    stored.pop(ref, None)
+
+            for object_path in stored.values():
+                try:
+                    os.unlink(object_path)
+                except FileNotFoundError:
+                    pass
+            return len(stored)
+
     def clear_session(self) -> None:
         """Clear all data in this session."""
-        import shutil
-        if self.session_dir.exists():
-            shutil.rmtree(self.session_dir)
+        self._mem.clear()
+        self._category_dirs.clear()
+        try:
+            with os.scandir(self.session_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        os.unlink(entry.path)
+                        continue
+                    with os.scandir(entry.path) as files:
+                        for file in files:
+                            if file.is_dir(follow_symlinks=False):
+                                shutil.rmtree(file.path)
+                            else:
+                                os.unlink(file.path)
+                    os.rmdir(entry.path)
+        except FileNotFoundError:
+            pass
         self._ensure_dirs()
 
     def get_summary(self) -> dict[str, Any]:
@@ -278,6 +735,10 @@ class Scratchpad:
 # Global scratchpad instance (lazy initialization)
 _scratchpad_instance: Scratchpad | None = None
 
+# Live scratchpads by (base_dir, session_id), so agents resolving the same
+# session share one instance and its in-memory cache
+_instances: WeakValueDictionary[tuple[Path, str], Scratchpad] = WeakValueDictionary()
+
 
 def get_scratchpad(session_id: str | None = None) -> Scratchpad:
     """
@@ -293,11 +754,18 @@ def get_scratchpad(session_id: str | None = None) -> Scratchpad:
     global _scratchpad_instance
 
     if session_id:
-        # Create new instance with specific session
-        return Scratchpad(session_id=session_id)
+        # Reuse a live instance for this session if there is one
+        instance = _instances.get((SCRATCHPAD_DIR, session_id))
+        if instance is None:
+            instance = Scratchpad(session_id=session_id)
+            _instances[(instance.base_dir, session_id)] = instance
+        return instance
 
     if _scratchpad_instance is None:
         _scratchpad_instance = Scratchpad()
+        _instances[(_scratchpad_instance.base_dir, _scratchpad_instance.session_id)] = (
+            _scratchpad_instance
+        )
 
     return _scratchpad_instance
 
@@ -306,6 +774,7 @@ def set_global_scratchpad(scratchpad: Scratchpad) -> None:
     """Set the global scratchpad instance."""
     global _scratchpad_instance
     _scratchpad_instance = scratchpad
+    _instances[(scratchpad.base_dir, scratchpad.session_id)] = scratchpad
 
 
 # Data category constants
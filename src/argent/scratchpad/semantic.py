@@ -0,0 +1,83 @@
+"""Fingerprint-keyed reuse of analysis outputs.
+
+Repeated analyses of the same symbol within a session often see market
+data that has barely moved. A fingerprint buckets the numeric inputs so
+that near-identical states hash to the same value, and the previous
+output stored under that fingerprint can be returned instead of
+recomputing it.
+"""
+
+import hashlib
+import math
+from typing import Any
+
+from argent.scratchpad.manager import Scratchpad, _dumps
+
+# Relative width of a price bucket (0.25%)
+DEFAULT_BUCKET = 0.0025
+
+# Scratchpad category holding fingerprinted outputs
+SEMANTIC_CACHE_CATEGORY = "semantic_cache"
+
+
+def _bucket(value: float, log_step: float) -> int:
+    """Map a float to a relative-width bucket index, keeping its sign."""
+    if value == 0 or math.isnan(value) or math.isinf(value):
+        return 0
+    index = round(math.log(abs(value)) / log_step)
+    # Interleave signs so +x and -x land in different buckets
+    return 2 * index if value > 0 else 2 * index + 1
+
+
+def _quantize(obj: Any, log_step: float) -> Any:
+    """Replace every float in a payload with its bucket index."""
+    if isinstance(obj, float):
+        return _bucket(obj, log_step)
+    if isinstance(obj, dict):
+        return {str(k): _quantize(v, log_step) for k, v in sorted(obj.items())}
+    if isinstance(obj, (list, tuple)):
+        return [_quantize(item, log_step) for item in obj]
+    return obj
+
+
+def fingerprint(payload: Any, bucket: float = DEFAULT_BUCKET) -> str:
+    """
+    Fingerprint a market-state payload.
+
+    Floats are bucketed on a log scale so values within roughly `bucket`
+    of each other map to the same fingerprint; everything else must match
+    exactly.
+
+    Args:
+        payload: JSON-like market state (prices, volumes, news ids, ...)
+        bucket: Relative bucket width for floats
+
+    Returns:
+        Hex digest identifying the bucketed state
+    """
+    quantized = _quantize(payload, math.log1p(bucket))
+    return hashlib.blake2b(_dumps(quantized), digest_size=16).hexdigest()
+
+
+def semantic_lookup(scratchpad: Scratchpad, category: str, key: str, state_fp: str) -> Any | None:
+    """Return the stored output for (category, key) if it has this fingerprint."""
+    data, metadata = scratchpad.read_with_metadata(SEMANTIC_CACHE_CATEGORY, f"{category}.{key}")
+    if data is None or metadata.get("fingerprint") != state_fp:
+        return None
+    return data
+
+
+def semantic_store(
+    scratchpad: Scratchpad,
+    category: str,
+    key: str,
+    state_fp: str,
+    output: Any,
+) -> None:
+    """Store an output for (category, key) under a state fingerprint."""
+    scratchpad.write(
+        SEMANTIC_CACHE_CATEGORY,
+        f"{category}.{key}",
+        output,
+        metadata={"fingerprint": state_fp},
+    )
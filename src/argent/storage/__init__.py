@@ -5,19 +5,22 @@ from argent.storage.models import (
     Base,
     EconomicDataPoint,
     PriceHistory,
+    PriceHistoryChunk,
     Recommendation,
     Symbol,
     TechnicalAnalysisResult,
 )
-from argent.storage.repository import Repository
+from argent.storage.repository import AsyncRepository, Repository
 
 __all__ = [
     "Base",
     "Symbol",
     "PriceHistory",
+    "PriceHistoryChunk",
     "EconomicDataPoint",
     "AnalysisSession",
     "TechnicalAnalysisResult",
     "Recommendation",
     "Repository",
+    "AsyncRepository",
 ]
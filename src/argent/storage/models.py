@@ -1,10 +1,27 @@
 """SQLAlchemy models for financial data storage."""
 
+import math
+import zlib
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, String, Text, Enum as SQLEnum
+import numpy as np
+from sqlalchemy import (
+    JSON,
+    CheckConstraint,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    TypeDecorator,
+    desc,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -14,6 +31,93 @@ class Base(DeclarativeBase):
     pass
 
 
+# DeltaFloatList payload tags; _COMPRESSED is OR-ed in when zlib is applied
+_RAW_FLOAT64 = 0
+_DELTA_VARINT = 1
+_COMPRESSED = 0x80
+# Fixed-point scale for delta encoding (4 decimal places)
+_DELTA_SCALE = 10_000
+# Fixed-point values must stay below this magnitude so they, their deltas and
+# the int64 running sum on decode are exact
+_MAX_FIXED_POINT = 2**53
+# Payloads shorter than this are not worth the zlib header
+_COMPRESS_MIN_BYTES = 64
+
+
+def _encode_varints(values: list[int]) -> bytes:
+    """Zigzag + LEB128 encode signed integers."""
+    out = bytearray()
+    for value in values:
+        zigzag = value * 2 if value >= 0 else -value * 2 - 1
+        while zigzag >= 0x80:
+            out.append((zigzag & 0x7F) | 0x80)
+            zigzag >>= 7
+        out.append(zigzag)
+    return bytes(out)
+
+
+def _decode_varints(data: bytes) -> list[int]:
+    """Decode zigzag + LEB128 signed integers."""
+    values = []
+    zigzag = shift = 0
+    for byte in data:
+        zigzag |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1))
+        zigzag = shift = 0
+    return values
+
+
+class DeltaFloatList(TypeDecorator):
+    """
+    List of floats stored as a compact, order-preserving binary blob.
+
+    Lists whose values are exact at four decimal places and below
+    _MAX_FIXED_POINT once scaled are stored as varint-encoded deltas of the
+    fixed-point values; anything else, including NaN, infinities and very
+    large values, falls back to packed float64, so decoding is always
+    lossless. Longer payloads are zlib-compressed.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: list[float] | None, dialect: Any) -> bytes | None:
+        if value is None:
+            return None
+
+        # NaN and infinities have no fixed-point form and go out as raw float64
+        finite = all(math.isfinite(v) for v in value)
+        scaled = [round(float(v) * _DELTA_SCALE) for v in value] if finite else []
+        if finite and all(
+            abs(s) < _MAX_FIXED_POINT and s / _DELTA_SCALE == v for s, v in zip(scaled, value)
+        ):
+            tag = _DELTA_VARINT
+            deltas = [b - a for a, b in zip([0, *scaled], scaled)]
+            payload = _encode_varints(deltas)
+        else:
+            tag = _RAW_FLOAT64
+            payload = np.asarray(value, dtype="<f8").tobytes()
+
+        if len(payload) >= _COMPRESS_MIN_BYTES:
+            tag |= _COMPRESSED
+            payload = zlib.compress(payload)
+        return bytes([tag]) + payload
+
+    def process_result_value(self, value: bytes | None, dialect: Any) -> list[float] | None:
+        if value is None:
+            return None
+
+        tag, payload = value[0], value[1:]
+        if tag & _COMPRESSED:
+            payload = zlib.decompress(payload)
+        if tag & ~_COMPRESSED == _RAW_FLOAT64:
+            return np.frombuffer(payload, dtype="<f8").tolist()
+        return (np.cumsum(_decode_varints(payload), dtype=np.int64) / _DELTA_SCALE).tolist()
+
+
 class AssetType(str, Enum):
     """Asset type enumeration."""
 
@@ -37,15 +141,28 @@ class AnalysisPhase(str, Enum):
     COMPLETED = "completed"
 
 
+def _enum_check(column: str, enum: type[Enum]) -> CheckConstraint:
+    """
+    CHECK constraint limiting a plain string column to an enum's values.
+
+    Enum columns are stored as strings so rows load without enum coercion;
+    the database still rejects unknown values.
+    """
+    values = ", ".join(f"'{member.value}'" for member in enum)
+    return CheckConstraint(f"{column} IN ({values})", name=f"ck_{column}")
+
+
 class Symbol(Base):
     """Symbol/ticker information."""
 
     __tablename__ = "symbols"
+    __table_args__ = (_enum_check("asset_type", AssetType),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), unique=True, index=True)
     name: Mapped[str | None] = mapped_column(String(255))
-    asset_type: Mapped[AssetType] = mapped_column(SQLEnum(AssetType))
+    # AssetType value; loaded back as a plain str
+    asset_type: Mapped[str] = mapped_column(String(20))
     sector: Mapped[str | None] = mapped_column(String(100))
     industry: Mapped[str | None] = mapped_column(String(100))
     exchange: Mapped[str | None] = mapped_column(String(50))
@@ -62,10 +179,12 @@ class PriceHistory(Base):
     """Historical price data."""
 
     __tablename__ = "price_history"
+    # Reads filter on symbol and scan newest first
+    __table_args__ = (Index("ix_price_symbol_ts", "symbol_id", desc("timestamp")),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    symbol_id: Mapped[int] = mapped_column(ForeignKey("symbols.id"), index=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime, index=True)
+    symbol_id: Mapped[int] = mapped_column(ForeignKey("symbols.id"))
+    timestamp: Mapped[datetime] = mapped_column(DateTime)
     open: Mapped[float] = mapped_column(Float)
     high: Mapped[float] = mapped_column(Float)
     low: Mapped[float] = mapped_column(Float)
@@ -78,15 +197,44 @@ class PriceHistory(Base):
     symbol_rel: Mapped["Symbol"] = relationship(back_populates="price_history")
 
 
+class PriceHistoryChunk(Base):
+    """
+    Columnar block of historical prices for one symbol.
+
+    Each array column holds zlib-compressed little-endian values, one entry
+    per bar sorted by time: timestamps as int64 epoch seconds, prices as
+    float64 and volumes as int64.
+    """
+
+    __tablename__ = "price_history_chunks"
+    __table_args__ = (Index("ix_price_chunk_symbol_start", "symbol_id", "start_ts"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    symbol_id: Mapped[int] = mapped_column(ForeignKey("symbols.id"))
+    start_ts: Mapped[datetime] = mapped_column(DateTime)
+    end_ts: Mapped[datetime] = mapped_column(DateTime)
+    n: Mapped[int] = mapped_column(Integer)
+    timestamps: Mapped[bytes] = mapped_column(LargeBinary)
+    opens: Mapped[bytes] = mapped_column(LargeBinary)
+    highs: Mapped[bytes] = mapped_column(LargeBinary)
+    lows: Mapped[bytes] = mapped_column(LargeBinary)
+    closes: Mapped[bytes] = mapped_column(LargeBinary)
+    volumes: Mapped[bytes] = mapped_column(LargeBinary)
+    source: Mapped[str] = mapped_column(String(50))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class EconomicDataPoint(Base):
     """Economic indicator data from FRED."""
 
     __tablename__ = "economic_data"
+    # Reads filter on series and scan newest first
+    __table_args__ = (Index("ix_econ_series_date", "series_id", desc("date")),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    series_id: Mapped[str] = mapped_column(String(50), index=True)
+    series_id: Mapped[str] = mapped_column(String(50))
     name: Mapped[str] = mapped_column(String(255))
-    date: Mapped[datetime] = mapped_column(DateTime, index=True)
+    date: Mapped[datetime] = mapped_column(DateTime)
     value: Mapped[float] = mapped_column(Float)
     frequency: Mapped[str] = mapped_column(String(20))
     units: Mapped[str | None] = mapped_column(String(100))
@@ -97,13 +245,16 @@ class AnalysisSession(Base):
     """Analysis session tracking."""
 
     __tablename__ = "analysis_sessions"
+    __table_args__ = (_enum_check("phase", AnalysisPhase),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     request: Mapped[str] = mapped_column(Text)
-    symbols: Mapped[str] = mapped_column(Text)  # JSON list of symbols
+    # JSONB on PostgreSQL so the list can be queried and GIN-indexed
+    symbols: Mapped[list[str]] = mapped_column(JSON().with_variant(JSONB(), "postgresql"))
     time_horizon: Mapped[str] = mapped_column(String(20))
-    phase: Mapped[AnalysisPhase] = mapped_column(SQLEnum(AnalysisPhase), default=AnalysisPhase.DATA_COLLECTION)
+    # AnalysisPhase value; loaded back as a plain str
+    phase: Mapped[str] = mapped_column(String(20), default=AnalysisPhase.DATA_COLLECTION.value)
     status: Mapped[str] = mapped_column(String(20), default="in_progress")
     started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime)
@@ -129,9 +280,10 @@ class TechnicalAnalysisResult(Base):
     """Technical analysis results for a symbol."""
 
     __tablename__ = "technical_results"
+    __table_args__ = (Index("ix_technical_session_symbol", "session_id", "symbol_id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    session_id: Mapped[int] = mapped_column(ForeignKey("analysis_sessions.id"), index=True)
+    session_id: Mapped[int] = mapped_column(ForeignKey("analysis_sessions.id"))
     symbol_id: Mapped[int] = mapped_column(ForeignKey("symbols.id"), index=True)
 
     # Technical indicators
@@ -147,9 +299,9 @@ class TechnicalAnalysisResult(Base):
     bollinger_lower: Mapped[float | None] = mapped_column(Float)
     atr: Mapped[float | None] = mapped_column(Float)
 
-    # Support/Resistance levels stored as JSON
-    support_levels: Mapped[list[float] | None] = mapped_column(JSON)
-    resistance_levels: Mapped[list[float] | None] = mapped_column(JSON)
+    # Support/Resistance levels stored as delta-encoded blobs
+    support_levels: Mapped[list[float] | None] = mapped_column(DeltaFloatList)
+    resistance_levels: Mapped[list[float] | None] = mapped_column(DeltaFloatList)
 
     # Signals
     trend_direction: Mapped[str | None] = mapped_column(String(20))  # bullish, bearish, neutral
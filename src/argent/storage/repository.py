@@ -1,11 +1,36 @@
 """Data access layer for financial data."""
 
-import json
+import asyncio
+import functools
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
 from datetime import datetime
-from typing import Any
-
-from sqlalchemy import create_engine, select
+from typing import Any, ClassVar
+
+import numpy as np
+from sqlalchemy import (
+    Engine,
+    RowMapping,
+    Select,
+    bindparam,
+    case,
+    create_engine,
+    event,
+    insert,
+    inspect,
+    make_url,
+    select,
+    text,
+    update,
+)
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import URL
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import AddConstraint
 
 from argent.storage.models import (
     AnalysisPhase,
@@ -14,24 +39,408 @@ from argent.storage.models import (
     Base,
     EconomicDataPoint,
     PriceHistory,
+    PriceHistoryChunk,
     Recommendation,
     Symbol,
     TechnicalAnalysisResult,
 )
 
+# Connection pool settings for server databases
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 20
+POOL_RECYCLE_SECONDS = 1800
+
+# Entries kept in each per-repository object cache
+OBJECT_CACHE_SIZE = 4096
+
+# Rows per bulk insert chunk; PriceHistory rows are wide enough that larger
+# pages keep paying off well past SQLAlchemy's default of 1000
+BULK_INSERT_CHUNK = 20000
+
+
+# Statements are built once with bind parameters so every call reuses the
+# same cached compiled form instead of constructing a new select()
+_SYMBOL_ID_BY_TICKER = select(Symbol.id).where(Symbol.symbol == bindparam("symbol"))
+_SYMBOL_BY_TICKER = select(Symbol).where(Symbol.symbol == bindparam("symbol"))
+_SESSION_PK_BY_ID = select(AnalysisSession.id).where(
+    AnalysisSession.session_id == bindparam("session_id")
+)
+# Both foreign keys of a per-session result in one round trip; the symbol id
+# is NULL when the ticker is unknown
+_SESSION_PK_AND_SYMBOL_ID = select(
+    AnalysisSession.id,
+    select(Symbol.id).where(Symbol.symbol == bindparam("symbol")).scalar_subquery(),
+).where(AnalysisSession.session_id == bindparam("session_id"))
+_SESSION_BY_ID = select(AnalysisSession).where(
+    AnalysisSession.session_id == bindparam("session_id")
+)
+_ECONOMIC_DATA_BY_SERIES = (
+    select(
+        EconomicDataPoint.series_id,
+        EconomicDataPoint.name,
+        EconomicDataPoint.date,
+        EconomicDataPoint.value,
+        EconomicDataPoint.frequency,
+        EconomicDataPoint.units,
+    )
+    .where(EconomicDataPoint.series_id == bindparam("series_id"))
+    .order_by(EconomicDataPoint.date.desc())
+    .limit(bindparam("limit"))
+)
+_RECOMMENDATIONS_BY_SESSION = select(*Recommendation.__table__.c).where(
+    Recommendation.session_id == bindparam("session_pk")
+)
+
+
+def _build_price_history_stmt(has_start: bool, has_end: bool, newest_first: bool) -> Select:
+    stmt = select(
+        PriceHistory.timestamp,
+        PriceHistory.open,
+        PriceHistory.high,
+        PriceHistory.low,
+        PriceHistory.close,
+        PriceHistory.volume,
+        PriceHistory.source,
+    ).where(PriceHistory.symbol_id == bindparam("symbol_id"))
+    if has_start:
+        stmt = stmt.where(PriceHistory.timestamp >= bindparam("start_date"))
+    if has_end:
+        stmt = stmt.where(PriceHistory.timestamp <= bindparam("end_date"))
+    if newest_first:
+        return stmt.order_by(PriceHistory.timestamp.desc()).limit(bindparam("limit"))
+    return stmt.order_by(PriceHistory.timestamp)
+
+
+# One statement per combination of optional date bounds: limited newest-first
+# reads, and unbounded oldest-first scans for streaming
+_PRICE_HISTORY = {
+    (has_start, has_end): _build_price_history_stmt(has_start, has_end, newest_first=True)
+    for has_start in (False, True)
+    for has_end in (False, True)
+}
+_PRICE_HISTORY_SCAN = {
+    (has_start, has_end): _build_price_history_stmt(has_start, has_end, newest_first=False)
+    for has_start in (False, True)
+    for has_end in (False, True)
+}
+
+_PRICE_CHUNKS_BY_SYMBOL = (
+    select(PriceHistoryChunk)
+    .where(PriceHistoryChunk.symbol_id == bindparam("symbol_id"))
+    .order_by(PriceHistoryChunk.start_ts)
+)
+
+# Column name and stored dtype for each PriceHistoryChunk array
+_CHUNK_COLUMNS = {
+    "timestamp": ("timestamps", np.dtype("<i8")),
+    "open": ("opens", np.dtype("<f8")),
+    "high": ("highs", np.dtype("<f8")),
+    "low": ("lows", np.dtype("<f8")),
+    "close": ("closes", np.dtype("<f8")),
+    "volume": ("volumes", np.dtype("<i8")),
+}
+
+
+def _pack_array(values: np.ndarray, dtype: np.dtype) -> bytes:
+    return zlib.compress(np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+
+def _unpack_array(blob: bytes, dtype: np.dtype) -> np.ndarray:
+    return np.frombuffer(zlib.decompress(blob), dtype=dtype)
+
+
+# Dialects with INSERT ... ON CONFLICT ... RETURNING
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Use WAL journaling so readers don't block on writers and commits fsync less."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _is_in_memory(url: URL) -> bool:
+    """Whether a URL names an in-memory SQLite database."""
+    return url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    )
+
+
+def _create_engine(database_url: str) -> Engine:
+    """Create an engine with pool settings suited to the database backend."""
+    url = make_url(database_url)
+    # Bulk inserts go out as multi-row VALUES, one chunk per statement. The
+    # SQLite dialect still splits pages to stay under its bound parameter limit
+    options: dict[str, Any] = {"insertmanyvalues_page_size": BULK_INSERT_CHUNK}
+    if url.get_driver_name() == "psycopg2":
+        # Plain UPDATE/DELETE executemany also gets batched
+        options["executemany_mode"] = "values_plus_batch"
+
+    if url.get_backend_name() == "sqlite":
+        if _is_in_memory(url):
+            # One connection for every thread; each new connection would open
+            # its own empty database
+            options["poolclass"] = StaticPool
+        engine = create_engine(url, connect_args={"check_same_thread": False}, **options)
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
+
+    return create_engine(
+        url,
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+        **options,
+    )
+
+
+# String columns that earlier schemas declared as Enum, storing member names
+_ENUM_COLUMNS = (
+    (Symbol.__table__, "asset_type", AssetType),
+    (AnalysisSession.__table__, "phase", AnalysisPhase),
+)
+
+
+def _migrate_enum_columns(engine: Engine) -> None:
+    """
+    Convert enum columns written by earlier schemas to stored values.
+
+    Symbol.asset_type and AnalysisSession.phase used to be Enum columns
+    holding member names ('STOCK'); they now hold values ('stock') under a
+    CHECK constraint. Native PostgreSQL enum columns are first turned into
+    VARCHAR and given the constraint. Rows already holding values are left
+    untouched, so this is a no-op on current databases.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table, column, enum in _ENUM_COLUMNS:
+            column_type = next(
+                info["type"] for info in inspector.get_columns(table.name) if info["name"] == column
+            )
+            native_enum = engine.dialect.name == "postgresql" and isinstance(column_type, SQLEnum)
+            if native_enum:
+                connection.execute(text(
+                    f"ALTER TABLE {table.name} ALTER COLUMN {column} "
+                    f"TYPE VARCHAR(20) USING {column}::text"
+                ))
+                connection.execute(text(f"DROP TYPE IF EXISTS {column_type.name}"))
+
+            stored = table.c[column]
+            names = {member.name: member.value for member in enum}
+            connection.execute(
+                update(table)
+                .where(stored.in_(list(names)))
+                .values({column: case(names, value=stored)})
+            )
+
+            if native_enum:
+                check = next(c for c in table.constraints if c.name == f"ck_{column}")
+                connection.execute(AddConstraint(check))
+
+
+class _LRUCache(OrderedDict):
+    """
+    Bounded mapping that evicts the least recently used entry.
+
+    get, put and pop hold a lock, since AsyncRepository calls the
+    repository from worker threads.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return self[key]
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self[key] = value
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            return super().pop(key, default)
+
 
 class Repository:
     """Repository for data access operations."""
 
-    def __init__(self, database_url: str):
-        self._engine = create_engine(database_url)
-        self._session_factory = sessionmaker(bind=self._engine)
+    # Database URLs whose schema has already been created in this process
+    _schema_created: ClassVar[set[str]] = set()
+
+    def __init__(
+        self,
+        database_url: str,
+        read_database_url: str | None = None,
+        create_schema: bool = True,
+    ):
+        """
+        Initialize the repository.
+
+        Args:
+            database_url: Primary database URL, used for all writes
+            read_database_url: Optional read replica for get_* methods.
+                Defaults to the primary database.
+            create_schema: Create missing tables on first use of this URL in
+                the process. Pass False when the schema is managed separately
+                (e.g. by `argent init-db` at deploy time) so constructing a
+                repository does not touch the database.
+        """
+        self._database_url = database_url
+        self._engine = _create_engine(database_url)
+        # Returned objects keep their loaded state after commit; ids and
+        # Python-side defaults are already populated at flush time
+        self._session_factory = sessionmaker(bind=self._engine, expire_on_commit=False)
+
+        # Reads run in autocommit mode, skipping BEGIN/COMMIT. Without a
+        # replica this is a view of the primary engine sharing its pool.
+        self._replica_engine = _create_engine(read_database_url) if read_database_url else None
+        self._read_engine = (self._replica_engine or self._engine).execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+        self._read_session_factory = sessionmaker(
+            bind=self._read_engine, expire_on_commit=False
+        )
+        # Streaming reads need a transaction: psycopg2 only opens the named
+        # (server-side) cursor behind yield_per inside one
+        self._stream_session_factory = sessionmaker(
+            bind=self._replica_engine or self._engine, expire_on_commit=False
+        )
+
+        # In-memory databases are private to their engine and always need tables
+        in_memory = _is_in_memory(self._engine.url)
+        if in_memory or (create_schema and database_url not in self._schema_created):
+            self.create_schema()
+        # Primary keys of committed rows; tickers and session ids never change
+        self._symbol_ids: dict[str, int] = {}
+        self._session_pks: dict[str, int] = {}
+        # Detached rows returned by get_symbol / get_analysis_session; callers
+        # share these instances and must not mutate them
+        self._symbol_cache = _LRUCache(OBJECT_CACHE_SIZE)
+        self._session_cache = _LRUCache(OBJECT_CACHE_SIZE)
+
+    def create_schema(self) -> None:
+        """
+        Create any missing tables and indexes on the primary database.
+
+        Enum columns left in the old member-name form are migrated as well.
+        """
         Base.metadata.create_all(self._engine)
+        _migrate_enum_columns(self._engine)
+        self._schema_created.add(self._database_url)
 
     def _get_session(self) -> Session:
         """Get a new database session."""
         return self._session_factory()
 
+    def _get_read_session(self) -> Session:
+        """Get a new autocommit session for read-only queries."""
+        return self._read_session_factory()
+
+    def _get_stream_session(self) -> Session:
+        """Get a new transactional session for queries streamed with yield_per."""
+        return self._stream_session_factory()
+
+    def _get_symbol_id(self, session: Session, symbol: str) -> int | None:
+        """Resolve a ticker to its primary key, consulting the cache first."""
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = session.execute(
+                _SYMBOL_ID_BY_TICKER, {"symbol": symbol}
+            ).scalar_one_or_none()
+            if symbol_id is not None:
+                self._symbol_ids[symbol] = symbol_id
+        return symbol_id
+
+    def _get_or_create_symbol_id(self, session: Session, symbol: str) -> int:
+        """Resolve a ticker to its primary key, adding the symbol if missing."""
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is not None:
+            return symbol_id
+
+        upsert = self._upsert_symbol(symbol=symbol, asset_type=AssetType.STOCK)
+        if upsert is not None:
+            symbol_id = session.execute(upsert.returning(Symbol.id)).scalar_one()
+        else:
+            symbol_id = self._get_symbol_id(session, symbol)
+            if symbol_id is None:
+                new_symbol = Symbol(symbol=symbol, asset_type=AssetType.STOCK)
+                session.add(new_symbol)
+                session.flush()
+                symbol_id = new_symbol.id
+
+        # Cached by _commit once the row is known to be committed
+        session.info.setdefault("symbol_ids", {})[symbol] = symbol_id
+        return symbol_id
+
+    def _upsert_symbol(self, **values: Any) -> Any:
+        """
+        Build an insert of a symbol that resolves to the existing row on conflict.
+
+        The conflict update only rewrites the ticker with itself, so an
+        existing row keeps its fields and RETURNING still yields it. Returns
+        None for dialects without ON CONFLICT support.
+        """
+        dialect_insert = _UPSERT_INSERTS.get(self._engine.dialect.name)
+        if dialect_insert is None:
+            return None
+        stmt = dialect_insert(Symbol).values(**values)
+        return stmt.on_conflict_do_update(
+            index_elements=[Symbol.symbol], set_={"symbol": stmt.excluded.symbol}
+        )
+
+    def _commit(self, session: Session) -> None:
+        """Commit a session and cache the symbol ids it resolved."""
+        session.commit()
+        self._symbol_ids.update(session.info.pop("symbol_ids", {}))
+
+    def _get_session_pk(self, session: Session, session_id: str) -> int | None:
+        """Resolve an analysis session id to its primary key."""
+        pk = self._session_pks.get(session_id)
+        if pk is None:
+            pk = session.execute(
+                _SESSION_PK_BY_ID, {"session_id": session_id}
+            ).scalar_one_or_none()
+            if pk is not None:
+                self._session_pks[session_id] = pk
+        return pk
+
+    def _resolve_result_keys(
+        self, session: Session, session_id: str, symbol: str
+    ) -> tuple[int | None, int | None]:
+        """
+        Resolve the (analysis session pk, symbol id) pair for a result row.
+
+        Served from the caches when possible, otherwise with a single query.
+        """
+        session_pk = self._session_pks.get(session_id)
+        symbol_id = self._symbol_ids.get(symbol)
+
+        if session_pk is None:
+            params = {"session_id": session_id, "symbol": symbol}
+            row = session.execute(_SESSION_PK_AND_SYMBOL_ID, params).first()
+            if row is None:
+                return None, symbol_id
+            session_pk, found_symbol_id = row
+            self._session_pks[session_id] = session_pk
+            if found_symbol_id is not None:
+                self._symbol_ids[symbol] = symbol_id = found_symbol_id
+        elif symbol_id is None:
+            symbol_id = self._get_symbol_id(session, symbol)
+
+        return session_pk, symbol_id
+
     # Symbol operations
     def get_or_create_symbol(
         self,
@@ -40,32 +449,73 @@ class Repository:
         asset_type: AssetType = AssetType.STOCK,
         sector: str | None = None,
         industry: str | None = None,
+        session: Session | None = None,
     ) -> Symbol:
-        """Get existing symbol or create new one."""
-        with self._get_session() as session:
-            stmt = select(Symbol).where(Symbol.symbol == symbol)
-            existing = session.execute(stmt).scalar_one_or_none()
-
-            if existing:
-                return existing
-
-            new_symbol = Symbol(
-                symbol=symbol,
-                name=name,
-                asset_type=asset_type,
-                sector=sector,
-                industry=industry,
+        """
+        Get existing symbol or create new one.
+
+        Pass session to run inside a caller's transaction; the caller is then
+        responsible for committing.
+        """
+        if session is not None:
+            return self._get_or_create_symbol(session, symbol, name, asset_type, sector, industry)
+
+        with self._get_session() as own_session:
+            sym = self._get_or_create_symbol(
+                own_session, symbol, name, asset_type, sector, industry
             )
-            session.add(new_symbol)
-            session.commit()
-            session.refresh(new_symbol)
-            return new_symbol
+            self._commit(own_session)
+        self._symbol_cache.put(symbol, sym)
+        return sym
+
+    def _get_or_create_symbol(
+        self,
+        session: Session,
+        symbol: str,
+        name: str | None,
+        asset_type: AssetType,
+        sector: str | None,
+        industry: str | None,
+    ) -> Symbol:
+        """Get or add a symbol within an open session (flushed, not committed)."""
+        upsert = self._upsert_symbol(
+            symbol=symbol,
+            name=name,
+            asset_type=asset_type,
+            sector=sector,
+            industry=industry,
+        )
+        if upsert is not None:
+            sym = session.scalars(
+                upsert.returning(Symbol), execution_options={"populate_existing": True}
+            ).one()
+        else:
+            sym = session.execute(_SYMBOL_BY_TICKER, {"symbol": symbol}).scalar_one_or_none()
+            if sym is None:
+                sym = Symbol(
+                    symbol=symbol,
+                    name=name,
+                    asset_type=asset_type,
+                    sector=sector,
+                    industry=industry,
+                )
+                session.add(sym)
+                session.flush()
+
+        session.info.setdefault("symbol_ids", {})[symbol] = sym.id
+        return sym
 
     def get_symbol(self, symbol: str) -> Symbol | None:
         """Get symbol by ticker."""
-        with self._get_session() as session:
-            stmt = select(Symbol).where(Symbol.symbol == symbol)
-            return session.execute(stmt).scalar_one_or_none()
+        sym = self._symbol_cache.get(symbol)
+        if sym is None:
+            with self._get_read_session() as session:
+                sym = session.execute(
+                    _SYMBOL_BY_TICKER, {"symbol": symbol}
+                ).scalar_one_or_none()
+            if sym is not None:
+                self._symbol_cache.put(symbol, sym)
+        return sym
 
     # Price history operations
     def save_price_history(
@@ -75,26 +525,30 @@ class Repository:
         source: str = "yahoo_finance",
     ) -> int:
         """Save price history data."""
-        sym = self.get_or_create_symbol(symbol)
-
         with self._get_session() as session:
-            count = 0
-            for price in prices:
-                record = PriceHistory(
-                    symbol_id=sym.id,
-                    timestamp=price["timestamp"],
-                    open=price["open"],
-                    high=price["high"],
-                    low=price["low"],
-                    close=price["close"],
-                    volume=price["volume"],
-                    source=source,
-                )
-                session.add(record)
-                count += 1
-
-            session.commit()
-            return count
+            symbol_id = self._get_or_create_symbol_id(session, symbol)
+            if not prices:
+                self._commit(session)
+                return 0
+
+            session.execute(
+                insert(PriceHistory),
+                [
+                    {
+                        "symbol_id": symbol_id,
+                        "timestamp": price["timestamp"],
+                        "open": price["open"],
+                        "high": price["high"],
+                        "low": price["low"],
+                        "close": price["close"],
+                        "volume": price["volume"],
+                        "source": source,
+                    }
+                    for price in prices
+                ],
+            )
+            self._commit(session)
+            return len(prices)
 
     def get_price_history(
         self,
@@ -102,57 +556,171 @@ class Repository:
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         limit: int = 365,
-    ) -> list[PriceHistory]:
-        """Get price history for a symbol."""
-        sym = self.get_symbol(symbol)
-        if not sym:
-            return []
+    ) -> list[RowMapping]:
+        """Get price history for a symbol as read-only row mappings, newest first."""
+        with self._get_read_session() as session:
+            symbol_id = self._get_symbol_id(session, symbol)
+            if symbol_id is None:
+                return []
+
+            stmt = _PRICE_HISTORY[(bool(start_date), bool(end_date))]
+            params = {
+                "symbol_id": symbol_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "limit": limit,
+            }
+            return list(session.execute(stmt, params).mappings())
+
+    def iter_price_history(
+        self,
+        symbol: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[RowMapping]:
+        """
+        Stream price history for a symbol, oldest first.
+
+        Rows are fetched batch_size at a time, so memory stays bounded by the
+        batch rather than the full history. The read session stays open until
+        the iterator is exhausted or closed.
+        """
+        with self._get_stream_session() as session:
+            symbol_id = self._get_symbol_id(session, symbol)
+            if symbol_id is None:
+                return
+
+            stmt = _PRICE_HISTORY_SCAN[(bool(start_date), bool(end_date))]
+            params = {"symbol_id": symbol_id, "start_date": start_date, "end_date": end_date}
+            result = session.execute(
+                stmt, params, execution_options={"yield_per": batch_size, "stream_results": True}
+            )
+            for partition in result.mappings().partitions():
+                yield from partition
 
-        with self._get_session() as session:
-            stmt = select(PriceHistory).where(PriceHistory.symbol_id == sym.id)
+    def save_price_chunk(
+        self,
+        symbol: str,
+        prices: list[dict[str, Any]],
+        source: str = "yahoo_finance",
+    ) -> int:
+        """
+        Save price history as a single columnar chunk.
 
-            if start_date:
-                stmt = stmt.where(PriceHistory.timestamp >= start_date)
-            if end_date:
-                stmt = stmt.where(PriceHistory.timestamp <= end_date)
+        The bars are sorted by timestamp and stored as one row of packed
+        arrays, which get_price_arrays reads back without per-bar objects.
 
-            stmt = stmt.order_by(PriceHistory.timestamp.desc()).limit(limit)
-            return list(session.execute(stmt).scalars().all())
+        Returns:
+            Number of bars stored
+        """
+        if not prices:
+            return 0
+
+        ordered = sorted(prices, key=lambda price: price["timestamp"])
+        timestamps = np.array([price["timestamp"] for price in ordered], dtype="datetime64[s]")
+        arrays = {"timestamp": timestamps.astype(np.int64)}
+        for field in ("open", "high", "low", "close", "volume"):
+            arrays[field] = np.array([price[field] for price in ordered])
+
+        with self._get_session() as session:
+            chunk = PriceHistoryChunk(
+                symbol_id=self._get_or_create_symbol_id(session, symbol),
+                start_ts=ordered[0]["timestamp"],
+                end_ts=ordered[-1]["timestamp"],
+                n=len(ordered),
+                source=source,
+                **{
+                    column: _pack_array(arrays[field], dtype)
+                    for field, (column, dtype) in _CHUNK_COLUMNS.items()
+                },
+            )
+            session.add(chunk)
+            self._commit(session)
+            return len(ordered)
+
+    def get_price_arrays(
+        self,
+        symbol: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Get chunked price history as column arrays, oldest first.
+
+        Returns:
+            Dict with "timestamp" (datetime64[s]), "open", "high", "low",
+            "close" and "volume" arrays; all empty if nothing is stored
+        """
+        with self._get_read_session() as session:
+            symbol_id = self._get_symbol_id(session, symbol)
+            chunks: list[PriceHistoryChunk] = []
+            if symbol_id is not None:
+                params = {"symbol_id": symbol_id}
+                chunks = list(session.execute(_PRICE_CHUNKS_BY_SYMBOL, params).scalars())
+
+        # Chunks are few and wide, so overlap is checked here and bars are
+        # trimmed to the exact range after decoding
+        chunks = [
+            chunk
+            for chunk in chunks
+            if (start_date is None or chunk.end_ts >= start_date)
+            and (end_date is None or chunk.start_ts <= end_date)
+        ]
+        arrays = {
+            field: np.concatenate(
+                [_unpack_array(getattr(chunk, column), dtype) for chunk in chunks]
+                or [np.empty(0, dtype=dtype)]
+            )
+            for field, (column, dtype) in _CHUNK_COLUMNS.items()
+        }
+
+        timestamps = arrays["timestamp"].astype("datetime64[s]")
+        arrays["timestamp"] = timestamps
+        mask = np.ones(len(timestamps), dtype=bool)
+        if start_date is not None:
+            mask &= timestamps >= np.datetime64(start_date, "s")
+        if end_date is not None:
+            mask &= timestamps <= np.datetime64(end_date, "s")
+        if not mask.all():
+            arrays = {field: values[mask] for field, values in arrays.items()}
+        return arrays
 
     # Economic data operations
     def save_economic_data(self, indicators: list[dict[str, Any]]) -> int:
         """Save economic indicator data."""
+        rows = [
+            {
+                "series_id": indicator["series_id"],
+                "name": indicator["name"],
+                "date": indicator["date"],
+                "value": indicator["value"],
+                "frequency": indicator["frequency"],
+                "units": indicator.get("units"),
+            }
+            for indicator in indicators
+        ]
+        if not rows:
+            return 0
+
+        # Backfills can run to many thousands of points; insert in chunks and
+        # commit once so the whole load is a single transaction
         with self._get_session() as session:
-            count = 0
-            for indicator in indicators:
-                record = EconomicDataPoint(
-                    series_id=indicator["series_id"],
-                    name=indicator["name"],
-                    date=indicator["date"],
-                    value=indicator["value"],
-                    frequency=indicator["frequency"],
-                    units=indicator.get("units"),
-                )
-                session.add(record)
-                count += 1
-
+            stmt = insert(EconomicDataPoint)
+            for start in range(0, len(rows), BULK_INSERT_CHUNK):
+                session.execute(stmt, rows[start : start + BULK_INSERT_CHUNK])
             session.commit()
-            return count
+            return len(rows)
 
     def get_economic_data(
         self,
         series_id: str,
         limit: int = 100,
-    ) -> list[EconomicDataPoint]:
-        """Get economic data for a series."""
-        with self._get_session() as session:
-            stmt = (
-                select(EconomicDataPoint)
-                .where(EconomicDataPoint.series_id == series_id)
-                .order_by(EconomicDataPoint.date.desc())
-                .limit(limit)
-            )
-            return list(session.execute(stmt).scalars().all())
+    ) -> list[RowMapping]:
+        """Get economic data for a series as read-only row mappings, newest first."""
+        with self._get_read_session() as session:
+            params = {"series_id": series_id, "limit": limit}
+            return list(session.execute(_ECONOMIC_DATA_BY_SERIES, params).mappings())
 
     # Analysis session operations
     def create_analysis_session(
@@ -167,19 +735,25 @@ class Repository:
             analysis_session = AnalysisSession(
                 session_id=session_id,
                 request=request,
-                symbols=json.dumps(symbols),
+                symbols=symbols,
                 time_horizon=time_horizon,
             )
             session.add(analysis_session)
             session.commit()
-            session.refresh(analysis_session)
-            return analysis_session
+        self._session_cache.put(session_id, analysis_session)
+        return analysis_session
 
     def get_analysis_session(self, session_id: str) -> AnalysisSession | None:
         """Get analysis session by ID."""
-        with self._get_session() as session:
-            stmt = select(AnalysisSession).where(AnalysisSession.session_id == session_id)
-            return session.execute(stmt).scalar_one_or_none()
+        analysis_session = self._session_cache.get(session_id)
+        if analysis_session is None:
+            with self._get_read_session() as session:
+                analysis_session = session.execute(
+                    _SESSION_BY_ID, {"session_id": session_id}
+                ).scalar_one_or_none()
+            if analysis_session is not None:
+                self._session_cache.put(session_id, analysis_session)
+        return analysis_session
 
     def update_analysis_session(
         self,
@@ -195,38 +769,50 @@ class Repository:
         input_tokens: int = 0,
         output_tokens: int = 0,
     ) -> AnalysisSession | None:
-        """Update analysis session with results."""
-        with self._get_session() as session:
-            stmt = select(AnalysisSession).where(AnalysisSession.session_id == session_id)
-            analysis_session = session.execute(stmt).scalar_one_or_none()
-
-            if not analysis_session:
-                return None
-
-            if phase:
-                analysis_session.phase = phase
-            if status:
-                analysis_session.status = status
-            if macro_analysis:
-                analysis_session.macro_analysis = macro_analysis
-            if technical_analysis:
-                analysis_session.technical_analysis = technical_analysis
-            if fundamental_analysis:
-                analysis_session.fundamental_analysis = fundamental_analysis
-            if risk_analysis:
-                analysis_session.risk_analysis = risk_analysis
-            if sentiment_analysis:
-                analysis_session.sentiment_analysis = sentiment_analysis
-            if final_report:
-                analysis_session.final_report = final_report
-                analysis_session.completed_at = datetime.utcnow()
-
-            analysis_session.total_input_tokens += input_tokens
-            analysis_session.total_output_tokens += output_tokens
+        """
+        Update analysis session with results.
+
+        Only the provided fields are written, in a single UPDATE; token counts
+        are incremented in SQL so concurrent updates don't lose counts.
+        """
+        fields = {
+            "phase": phase,
+            "status": status,
+            "macro_analysis": macro_analysis,
+            "technical_analysis": technical_analysis,
+            "fundamental_analysis": fundamental_analysis,
+            "risk_analysis": risk_analysis,
+            "sentiment_analysis": sentiment_analysis,
+            "final_report": final_report,
+        }
+        values: dict[str, Any] = {name: value for name, value in fields.items() if value}
+        if final_report:
+            values["completed_at"] = datetime.utcnow()
+        values["total_input_tokens"] = AnalysisSession.total_input_tokens + input_tokens
+        values["total_output_tokens"] = AnalysisSession.total_output_tokens + output_tokens
+
+        stmt = (
+            update(AnalysisSession)
+            .where(AnalysisSession.session_id == session_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
 
+        with self._get_session() as session:
+            if self._engine.dialect.update_returning:
+                analysis_session = session.scalars(stmt.returning(AnalysisSession)).one_or_none()
+            else:
+                session.execute(stmt)
+                analysis_session = session.execute(
+                    _SESSION_BY_ID, {"session_id": session_id}
+                ).scalar_one_or_none()
             session.commit()
-            session.refresh(analysis_session)
-            return analysis_session
+
+        if analysis_session is None:
+            self._session_cache.pop(session_id, None)
+        else:
+            self._session_cache.put(session_id, analysis_session)
+        return analysis_session
 
     # Technical analysis results
     def save_technical_result(
@@ -236,16 +822,14 @@ class Repository:
         indicators: dict[str, Any],
     ) -> TechnicalAnalysisResult | None:
         """Save technical analysis results."""
-        analysis_session = self.get_analysis_session(session_id)
-        sym = self.get_symbol(symbol)
-
-        if not analysis_session or not sym:
-            return None
-
         with self._get_session() as session:
+            session_pk, symbol_id = self._resolve_result_keys(session, session_id, symbol)
+            if session_pk is None or symbol_id is None:
+                return None
+
             result = TechnicalAnalysisResult(
-                session_id=analysis_session.id,
-                symbol_id=sym.id,
+                session_id=session_pk,
+                symbol_id=symbol_id,
                 rsi=indicators.get("rsi"),
                 macd=indicators.get("macd"),
                 macd_signal=indicators.get("macd_signal"),
@@ -265,7 +849,6 @@ class Repository:
             )
             session.add(result)
             session.commit()
-            session.refresh(result)
             return result
 
     # Recommendation operations
@@ -276,16 +859,17 @@ class Repository:
         recommendation: dict[str, Any],
     ) -> Recommendation | None:
         """Save an investment recommendation."""
-        analysis_session = self.get_analysis_session(session_id)
-        sym = self.get_or_create_symbol(symbol)
+        with self._get_session() as session:
+            session_pk, symbol_id = self._resolve_result_keys(session, session_id, symbol)
+            if session_pk is None:
+                return None
 
-        if not analysis_session:
-            return None
+            if symbol_id is None:
+                symbol_id = self._get_or_create_symbol_id(session, symbol)
 
-        with self._get_session() as session:
             rec = Recommendation(
-                session_id=analysis_session.id,
-                symbol_id=sym.id,
+                session_id=session_pk,
+                symbol_id=symbol_id,
                 action=recommendation["action"],
                 conviction=recommendation.get("conviction", "medium"),
                 time_horizon=recommendation.get("time_horizon", "medium"),
@@ -301,20 +885,72 @@ class Repository:
                 risk_score=recommendation.get("risk_score"),
             )
             session.add(rec)
-            session.commit()
-            session.refresh(rec)
+            self._commit(session)
             return rec
 
-    def get_recommendations(self, session_id: str) -> list[Recommendation]:
-        """Get recommendations for a session."""
-        analysis_session = self.get_analysis_session(session_id)
-        if not analysis_session:
-            return []
-
-        with self._get_session() as session:
-            stmt = select(Recommendation).where(Recommendation.session_id == analysis_session.id)
-            return list(session.execute(stmt).scalars().all())
+    def get_recommendations(self, session_id: str) -> list[RowMapping]:
+        """Get recommendations for a session as read-only row mappings."""
+        with self._get_read_session() as session:
+            session_pk = self._get_session_pk(session, session_id)
+            if session_pk is None:
+                return []
+
+            params = {"session_pk": session_pk}
+            return list(session.execute(_RECOMMENDATIONS_BY_SESSION, params).mappings())
+
+    def iter_recommendations(self, session_id: str, batch_size: int = 1000) -> Iterator[RowMapping]:
+        """Stream recommendations for a session, batch_size rows at a time."""
+        with self._get_stream_session() as session:
+            session_pk = self._get_session_pk(session, session_id)
+            if session_pk is None:
+                return
+
+            result = session.execute(
+                _RECOMMENDATIONS_BY_SESSION,
+                {"session_pk": session_pk},
+                execution_options={"yield_per": batch_size, "stream_results": True},
+            )
+            for partition in result.mappings().partitions():
+                yield from partition
 
     def close(self):
         """Close database connections."""
         self._engine.dispose()
+        if self._replica_engine is not None:
+            self._replica_engine.dispose()
+
+
+class AsyncRepository:
+    """
+    Awaitable facade over Repository.
+
+    Every public Repository method is available as a coroutine that runs the
+    blocking call in a worker thread, so database I/O can overlap with HTTP
+    fetches on the event loop. The wrapped repository's connection pool is
+    shared by all threads.
+
+    Usage:
+        repo = AsyncRepository(Repository(database_url))
+        await repo.save_price_history("AAPL", prices)
+    """
+
+    def __init__(self, repository: Repository):
+        self._repository = repository
+
+    @property
+    def repository(self) -> Repository:
+        """The wrapped synchronous repository."""
+        return self._repository
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = getattr(self._repository, name)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(name)
+
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        # Bind once so later lookups skip __getattr__
+        setattr(self, name, call)
+        return call
@@ -1,6 +1,7 @@
 """Financial data tools and utilities."""
 
 from argent.tools.calculations import (
+    PricesCache,
     calculate_atr,
     calculate_beta,
     calculate_bollinger_bands,
@@ -28,6 +29,7 @@ __all__ = [
     "MarketDataClient",
     "CryptoDataClient",
     "EconomicDataClient",
+    "PricesCache",
     "calculate_sma",
     "calculate_ema",
     "calculate_rsi",
@@ -0,0 +1,88 @@
+"""Compiled loop kernels for indicators that are scalar sweeps at heart.
+
+Numba is optional (the ``fast`` extra). Without it ``njit`` is a no-op and the
+kernels run as plain Python, so callers should only dispatch here when
+``HAVE_NUMBA`` is true and keep their NumPy path otherwise.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional speedup, callers fall back to NumPy
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _jit(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Compile with Numba when available, otherwise return the function unchanged."""
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def rsi_kernel(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    RSI over each full window of `period` price changes.
+
+    The first change is taken as zero, and windows with neither gains nor
+    losses are skipped, matching the NumPy implementation.
+    """
+    n = prices.size
+    out = np.empty(n - period + 1)
+    count = 0
+    for end in range(period - 1, n):
+        gain = 0.0
+        loss = 0.0
+        for i in range(end - period + 1, end + 1):
+            if i == 0:
+                continue
+            change = prices[i] - prices[i - 1]
+            if change > 0.0:
+                gain += change
+            else:
+                loss -= change
+        if loss == 0.0:
+            if gain == 0.0:
+                continue
+            out[count] = 100.0
+        else:
+            out[count] = 100.0 - 100.0 / (1.0 + gain / loss)
+        count += 1
+    return out[:count]
+
+
+@_jit
+def atr_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling mean of the true range in a single sweep.
+
+    True ranges are kept in a circular buffer of length `period` so the
+    running sum can drop the value leaving the window.
+    """
+    n = high.size
+    out = np.empty(n - period + 1)
+    window = np.zeros(period)
+    total = 0.0
+    prev_close = close[0]
+    for i in range(n):
+        tr = high[i] - low[i]
+        up = abs(high[i] - prev_close)
+        down = abs(low[i] - prev_close)
+        if up > tr:
+            tr = up
+        if down > tr:
+            tr = down
+        prev_close = close[i]
+
+        slot = i % period
+        total += tr - window[slot]
+        window[slot] = tr
+        if i >= period - 1:
+            out[i - period + 1] = total / period
+    return out
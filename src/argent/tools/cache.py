@@ -1,14 +1,21 @@
 """Caching layer for reducing redundant API calls."""
 
 import hashlib
+import inspect
+import io
 import json
 import os
+import pickle
+import threading
 import time
-from dataclasses import asdict, is_dataclass
-from datetime import datetime
-from functools import wraps
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from fnmatch import fnmatch
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import Any, BinaryIO, TypeVar
+from zoneinfo import ZoneInfo
 
 # TTL Configuration in seconds
 TTL_CONFIG = {
@@ -18,13 +25,25 @@ TTL_CONFIG = {
     "crypto_price": 60,  # 1 minute
     "crypto_history": 3600,  # 60 minutes
     "crypto_info": 3600,  # 60 minutes
+    "coins_list": 86400,  # 24 hours
+    "unknown_symbol": 3600,  # 60 minutes
     "economic_indicator": 43200,  # 12 hours
     "macro_snapshot": 43200,  # 12 hours
-    "news": 900,  # 15 minutes
+    "news": 1800,  # 30 minutes
     "financials": 86400,  # 24 hours
     "recommendations": 3600,  # 60 minutes
 }
 
+# Maximum number of entries held in the in-process tier
+MEMORY_CACHE_SIZE = 1024
+
+# Maximum number of argument tuples whose derived cache keys are memoized
+KEY_CACHE_SIZE = 4096
+
+# Append-only log in the cache directory of "<prefix>\t<key>" lines, shared by
+# every process using the directory
+PREFIX_INDEX_FILE = "_prefix_index.log"
+
 # Default cache directory
 CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cache"
 
@@ -38,57 +57,110 @@ def _ensure_cache_dir() -> Path:
 
 
 def _generate_cache_key(prefix: str, *args: Any, **kwargs: Any) -> str:
-    """Generate a unique cache key from function arguments."""
-    key_parts = [prefix]
-
-    for arg in args:
-        if isinstance(arg, (str, int, float, bool)):
-            key_parts.append(str(arg))
-        elif isinstance(arg, (list, tuple)):
-            key_parts.append(json.dumps(sorted(arg) if all(isinstance(x, str) for x in arg) else arg))
-        elif isinstance(arg, dict):
-            key_parts.append(json.dumps(arg, sort_keys=True))
-        else:
-            key_parts.append(str(arg))
-
-    for k, v in sorted(kwargs.items()):
-        key_parts.append(f"{k}={v}")
-
-    key_string = ":".join(key_parts)
-    return hashlib.md5(key_string.encode()).hexdigest()
-
-
-def _serialize_value(value: Any) -> Any:
-    """Serialize a value for JSON storage."""
-    if is_dataclass(value) and not isinstance(value, type):
-        return {"__dataclass__": type(value).__name__, "data": asdict(value)}
-    elif isinstance(value, datetime):
-        return {"__datetime__": value.isoformat()}
-    elif isinstance(value, list):
-        return [_serialize_value(item) for item in value]
-    elif isinstance(value, dict):
-        return {k: _serialize_value(v) for k, v in value.items()}
-    return value
-
-
-def _deserialize_value(value: Any, dataclass_registry: dict[str, type] | None = None) -> Any:
-    """Deserialize a value from JSON storage."""
-    if isinstance(value, dict):
-        if "__datetime__" in value:
-            return datetime.fromisoformat(value["__datetime__"])
-        elif "__dataclass__" in value and dataclass_registry:
-            cls_name = value["__dataclass__"]
-            if cls_name in dataclass_registry:
-                cls = dataclass_registry[cls_name]
-                data = value["data"]
-                # Recursively deserialize nested values
-                for k, v in data.items():
-                    data[k] = _deserialize_value(v, dataclass_registry)
-                return cls(**data)
-        return {k: _deserialize_value(v, dataclass_registry) for k, v in value.items()}
-    elif isinstance(value, list):
-        return [_deserialize_value(item, dataclass_registry) for item in value]
-    return value
+    """Generate a unique cache key from function arguments.
+
+    The arguments are canonicalized as one compact JSON document (dict keys
+    sorted, anything JSON can't encode such as dataclasses or datetimes falls
+    back to ``str``) and hashed to a 64-bit BLAKE2b hex digest.
+    """
+    payload = json.dumps(
+        [prefix, args, sorted(kwargs.items())],
+        default=str,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def _write_atomic(path: Path, payload: bytes, mtime: float) -> None:
+    """
+    Publish bytes at path through a temporary file and an atomic rename.
+
+    The temporary file gets its mtime before the rename, so readers never see
+    a partial entry or one with the wrong age.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.utime(tmp, (mtime, mtime))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE, typed=True)
+def _memo_cache_key(prefix: str, *args: Any, **kwargs: Any) -> str:
+    """Memoized _generate_cache_key for hashable arguments."""
+    return _generate_cache_key(prefix, *args, **kwargs)
+
+
+# Exact (module, name) globals cache files may reference besides registered
+# dataclasses: value types, plus the reconstructors numpy (1.x and 2.x), pytz
+# and dateutil pickle through. Anything else in those packages is refused.
+_SAFE_GLOBALS = frozenset({
+    ("builtins", "bytearray"),
+    ("builtins", "complex"),
+    ("builtins", "frozenset"),
+    ("builtins", "set"),
+    ("collections", "OrderedDict"),
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "time"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+    ("decimal", "Decimal"),
+    ("zoneinfo", "ZoneInfo"),
+    ("numpy", "dtype"),
+    ("numpy", "ndarray"),
+    ("numpy.core.multiarray", "_reconstruct"),
+    ("numpy.core.multiarray", "scalar"),
+    ("numpy.core.numeric", "_frombuffer"),
+    ("numpy._core.multiarray", "_reconstruct"),
+    ("numpy._core.multiarray", "scalar"),
+    ("numpy._core.numeric", "_frombuffer"),
+    ("pytz", "_UTC"),
+    ("pytz", "_p"),
+    ("dateutil.tz.tz", "_ttinfo"),
+    ("dateutil.tz.tz", "tzfile"),
+    ("dateutil.tz.tz", "tzlocal"),
+    ("dateutil.tz.tz", "tzoffset"),
+    ("dateutil.tz.tz", "tzutc"),
+})
+
+
+def _getattr_zoneinfo(obj: Any, name: str) -> Any:
+    """The one getattr pickles need: ZoneInfo reduces to getattr(ZoneInfo, "_unpickle")."""
+    if obj is ZoneInfo and name == "_unpickle":
+        return ZoneInfo._unpickle
+    raise pickle.UnpicklingError(f"Refusing to resolve {name!r} from cache")
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves registered dataclasses and plain value types."""
+
+    def __init__(self, file: BinaryIO, registry: dict[tuple[str, str], type]):
+        super().__init__(file)
+        self._registry = registry
+
+    def find_class(self, module: str, name: str) -> Any:
+        cls = self._registry.get((module, name))
+        if cls is not None:
+            return cls
+        if module == "builtins" and name == "getattr":
+            return _getattr_zoneinfo
+        if (module, name) in _SAFE_GLOBALS:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Refusing to load {module}.{name} from cache")
 
 
 class Cache:
@@ -97,19 +169,152 @@ class Cache:
     def __init__(self, cache_dir: Path | None = None):
         self.cache_dir = cache_dir or CACHE_DIR
         self._ensure_dir()
-        self._dataclass_registry: dict[str, type] = {}
+        self._dataclass_registry: dict[tuple[str, str], type] = {}
+        # In-process tier: key -> (timestamp, pickled value), least recently used
+        # first. Values are kept pickled so every hit returns a fresh copy, as a
+        # disk read would, and callers mutating a result can't corrupt the cache
+        self._mem: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._mem_max = MEMORY_CACHE_SIZE
+        # Shard directories known to exist, so set() only mkdirs once per shard
+        self._shards: set[str] = set()
+        # Prefix (e.g. the cached function's name) -> keys, so invalidation by
+        # prefix doesn't list the whole cache. New keys are appended to the
+        # shared log as they are stored, and lookups merge in what other
+        # processes appended; @cached runs from thread pools, hence the lock
+        self._index_lock = threading.Lock()
+        self._prefix_index: dict[str, set[str]] = {}
+        self._key_prefixes: dict[str, str] = {}
+        self._merge_prefix_log()
 
     def _ensure_dir(self) -> None:
         """Ensure cache directory exists."""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def register_dataclass(self, cls: type) -> None:
-        """Register a dataclass for deserialization."""
-        self._dataclass_registry[cls.__name__] = cls
+        """Register a dataclass that may be loaded back from cache files."""
+        self._dataclass_registry[(cls.__module__, cls.__qualname__)] = cls
+
+    def _remember(self, key: str, timestamp: float, payload: bytes) -> None:
+        """Store a pickled value in the in-process tier, evicting the oldest entry if full."""
+        # Pop and reinsert rather than move_to_end, so a concurrent eviction of
+        # this key can't raise between the two steps
+        self._mem.pop(key, None)
+        self._mem[key] = (timestamp, payload)
+        if len(self._mem) > self._mem_max:
+            try:
+                self._mem.popitem(last=False)
+            except KeyError:
+                pass
+
+    def _merge_prefix_log(self) -> None:
+        """Fold the shared prefix log into the in-process index; call with the lock held."""
+        try:
+            with open(self.cache_dir / PREFIX_INDEX_FILE, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            prefix, sep, key = line.partition("\t")
+            if sep and key and key not in self._key_prefixes:
+                self._key_prefixes[key] = prefix
+                self._prefix_index.setdefault(prefix, set()).add(key)
+
+    def _append_prefix_log(self, lines: list[str]) -> None:
+        """Append index lines in one write, so lines from other processes never interleave."""
+        try:
+            fd = os.open(
+                self.cache_dir / PREFIX_INDEX_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+            try:
+                os.write(fd, "".join(f"{line}\n" for line in lines).encode())
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+    def _compact_prefix_log(self) -> None:
+        """
+        Rewrite the prefix log without keys whose entries are gone.
+
+        The log is first moved aside, so appends from other processes start a
+        fresh log, and the surviving lines are appended to that.
+        """
+        log = self.cache_dir / PREFIX_INDEX_FILE
+        aside = log.with_name(f"{log.name}.{os.getpid()}.{threading.get_ident()}")
+        with self._index_lock:
+            try:
+                os.replace(log, aside)
+            except OSError:
+                return
+            try:
+                lines = aside.read_text(encoding="utf-8").splitlines()
+            except OSError:
+                lines = []
+            aside.unlink(missing_ok=True)
+            live = []
+            for line in dict.fromkeys(lines):
+                key = line.partition("\t")[2]
+                if key and self._get_cache_path(key).exists():
+                    live.append(line)
+            if live:
+                self._append_prefix_log(live)
+
+    def _index_key(self, key: str, prefix: str) -> None:
+        """Record that key was stored under prefix."""
+        with self._index_lock:
+            if self._key_prefixes.get(key) == prefix:
+                return
+            self._forget_key_locked(key)
+            self._key_prefixes[key] = prefix
+            self._prefix_index.setdefault(prefix, set()).add(key)
+            self._append_prefix_log([f"{prefix}\t{key}"])
+
+    def _forget_key(self, key: str) -> None:
+        """Drop key from the in-process prefix index."""
+        with self._index_lock:
+            self._forget_key_locked(key)
+
+    def _forget_key_locked(self, key: str) -> None:
+        """_forget_key for callers already holding the index lock."""
+        prefix = self._key_prefixes.pop(key, None)
+        if prefix is None:
+            return
+        keys = self._prefix_index[prefix]
+        keys.discard(key)
+        if not keys:
+            del self._prefix_index[prefix]
+
+    def keys_for_prefix(self, pattern: str) -> list[str] | None:
+        """
+        Keys stored under prefixes matching a pattern.
+
+        Args:
+            pattern: Exact prefix, or a substring/glob matched against prefixes
+
+        Returns:
+            Matching keys, or None if no indexed prefix matches
+        """
+        with self._index_lock:
+            # Pick up keys other processes stored since this instance last looked
+            self._merge_prefix_log()
+            keys = self._prefix_index.get(pattern)
+            if keys is not None:
+                return list(keys)
+            matched = [
+                prefix for prefix in self._prefix_index if fnmatch(prefix, f"*{pattern}*")
+            ]
+            if not matched:
+                return None
+            return [key for prefix in matched for key in self._prefix_index[prefix]]
 
     def _get_cache_path(self, key: str) -> Path:
-        """Get the file path for a cache key."""
-        return self.cache_dir / f"{key}.json"
+        """Get the file path for a cache key, sharded by its first two characters."""
+        return self.cache_dir / key[:2] / f"{key[2:]}.pkl"
+
+    def _iter_entries(self) -> Iterator[tuple[str, Path]]:
+        """Yield (key, path) for every entry on disk."""
+        for cache_file in self.cache_dir.glob("*/*.pkl"):
+            yield cache_file.parent.name + cache_file.stem, cache_file
 
     def get(self, key: str, ttl: int | None = None) -> Any | None:
         """
@@ -122,61 +327,84 @@ class Cache:
         Returns:
             Cached value or None if not found/expired
         """
-        cache_path = self._get_cache_path(key)
+        hit = self._mem.get(key)
+        if hit is not None:
+            timestamp, payload = hit
+            if ttl is None or time.time() - timestamp <= ttl:
+                try:
+                    self._mem.move_to_end(key)
+                except KeyError:
+                    pass  # Evicted by another thread
+                # Pickled in this process (or already vetted on load from disk)
+                return pickle.loads(payload)
+            self._mem.pop(key, None)
 
-        if not cache_path.exists():
-            return None
+        cache_path = self._get_cache_path(key)
 
+        # The file mtime is the write time, so expiry needs only a stat
         try:
-            with open(cache_path, "r") as f:
-                cached = json.load(f)
+            timestamp = cache_path.stat().st_mtime
+        except OSError:
+            return None
 
-            timestamp = cached.get("timestamp", 0)
+        if ttl is not None and time.time() - timestamp > ttl:
+            # Expired, remove cache file
+            cache_path.unlink(missing_ok=True)
+            return None
 
-            # Check TTL
-            if ttl is not None:
-                age = time.time() - timestamp
-                if age > ttl:
-                    # Expired, remove cache file
-                    cache_path.unlink(missing_ok=True)
-                    return None
+        try:
+            payload = cache_path.read_bytes()
+            value = _CacheUnpickler(io.BytesIO(payload), self._dataclass_registry).load()
 
-            return _deserialize_value(cached.get("value"), self._dataclass_registry)
+            self._remember(key, timestamp, payload)
+            return value
 
-        except (json.JSONDecodeError, KeyError, OSError):
+        except (pickle.UnpicklingError, EOFError, AttributeError, KeyError, OSError):
             # Invalid cache file, remove it
             cache_path.unlink(missing_ok=True)
             return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, prefix: str | None = None) -> None:
         """
         Store a value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
+            prefix: Optional name the key was derived from, for invalidation
         """
         cache_path = self._get_cache_path(key)
+        timestamp = time.time()
 
         try:
-            cached = {
-                "timestamp": time.time(),
-                "value": _serialize_value(value),
-            }
-            with open(cache_path, "w") as f:
-                json.dump(cached, f)
-        except (OSError, TypeError) as e:
+            payload = pickle.dumps(value, protocol=5)
+            self._remember(key, timestamp, payload)
+            shard = key[:2]
+            if shard not in self._shards:
+                cache_path.parent.mkdir(exist_ok=True)
+                self._shards.add(shard)
+            _write_atomic(cache_path, payload, timestamp)
+            if prefix is not None:
+                self._index_key(key, prefix)
+        except (OSError, TypeError, AttributeError, pickle.PicklingError):
             # Failed to write cache, log and continue
             pass
 
     def delete(self, key: str) -> None:
         """Delete a cache entry."""
+        self._mem.pop(key, None)
+        self._forget_key(key)
         cache_path = self._get_cache_path(key)
         cache_path.unlink(missing_ok=True)
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        for cache_file in self.cache_dir.glob("*.json"):
+        self._mem.clear()
+        with self._index_lock:
+            self._prefix_index.clear()
+            self._key_prefixes.clear()
+            (self.cache_dir / PREFIX_INDEX_FILE).unlink(missing_ok=True)
+        for _, cache_file in self._iter_entries():
             cache_file.unlink(missing_ok=True)
 
     def cleanup_expired(self, ttl_map: dict[str, int] | None = None) -> int:
@@ -191,32 +419,70 @@ class Cache:
         """
         ttl_map = ttl_map or TTL_CONFIG
         default_ttl = max(ttl_map.values()) if ttl_map else 86400
+        # Entries are written in one go, so the file mtime is the write time and
+        # expiry can be decided from a stat without reading the payload
+        cutoff = time.time() - default_ttl
         removed = 0
 
-        for cache_file in self.cache_dir.glob("*.json"):
+        for key, cache_file in self._iter_entries():
             try:
-                with open(cache_file, "r") as f:
-                    cached = json.load(f)
-
-                timestamp = cached.get("timestamp", 0)
-                age = time.time() - timestamp
-
-                # Use default TTL for cleanup
-                if age > default_ttl:
+                if cache_file.stat().st_mtime < cutoff:
                     cache_file.unlink()
+                    self._mem.pop(key, None)
+                    self._forget_key(key)
                     removed += 1
+            except OSError:
+                # Removed concurrently
+                continue
 
-            except (json.JSONDecodeError, OSError):
-                # Invalid cache file, remove it
-                cache_file.unlink(missing_ok=True)
-                removed += 1
-
+        if removed:
+            self._compact_prefix_log()
         return removed
 
 
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into a single execution."""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` unless a call for ``key`` is already in flight.
+
+        Callers that arrive while the first call runs wait for it and receive
+        its result (or its exception) instead of repeating the work.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
 # Global cache instance
 _cache_instance: Cache | None = None
 
+# Misses currently being computed by @cached functions, keyed by cache key
+_in_flight = SingleFlight()
+
 
 def get_cache() -> Cache:
     """Get the global cache instance."""
@@ -245,31 +511,39 @@ def cached(
             ...
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Resolve everything that doesn't depend on the call once
+        actual_ttl = ttl if ttl is not None else TTL_CONFIG.get(cache_type, 3600)
+        prefix = key_prefix or f"{func.__module__}.{func.__name__}"
+        first_param = next(iter(inspect.signature(func).parameters), None)
+        skip = 1 if first_param in ("self", "cls") else 0
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            cache = get_cache()
-
-            # Get TTL from config or override
-            actual_ttl = ttl if ttl is not None else TTL_CONFIG.get(cache_type, 3600)
+            cache = _cache_instance or get_cache()
 
-            # Generate cache key (skip 'self' argument)
-            func_args = args[1:] if args and hasattr(args[0], "__class__") else args
-            prefix = key_prefix or f"{func.__module__}.{func.__name__}"
-            cache_key = _generate_cache_key(prefix, *func_args, **kwargs)
+            # Generate cache key (skip 'self' argument); repeat calls with hashable
+            # arguments reuse the key instead of re-serializing and re-hashing
+            try:
+                cache_key = _memo_cache_key(prefix, *args[skip:], **kwargs)
+            except TypeError:
+                cache_key = _generate_cache_key(prefix, *args[skip:], **kwargs)
 
             # Try to get from cache
             cached_value = cache.get(cache_key, actual_ttl)
             if cached_value is not None:
                 return cached_value
 
-            # Call function and cache result
-            result = func(*args, **kwargs)
+            def compute() -> T:
+                result = func(*args, **kwargs)
 
-            # Only cache non-None and non-empty results
-            if result is not None and result != [] and result != {}:
-                cache.set(cache_key, result)
+                # Only cache non-None and non-empty results
+                if result is not None and result != [] and result != {}:
+                    cache.set(cache_key, result, prefix=prefix)
 
-            return result
+                return result
+
+            # Concurrent misses for the same key share one call
+            return _in_flight.do(cache_key, compute)
 
         return wrapper
     return decorator
@@ -279,8 +553,12 @@ def invalidate_cache(pattern: str | None = None) -> int:
     """
     Invalidate cache entries matching a pattern.
 
+    The pattern is first looked up in the prefix index (exact prefix, or glob
+    against prefixes such as ``argent.tools.news.*``); if no prefix matches,
+    it is matched against the keys on disk.
+
     Args:
-        pattern: Glob pattern for cache keys (None = clear all)
+        pattern: Prefix or glob pattern for cache keys (None = clear all)
 
     Returns:
         Number of entries invalidated
@@ -291,9 +569,11 @@ def invalidate_cache(pattern: str | None = None) -> int:
         cache.clear()
         return -1  # Unknown count
 
-    count = 0
-    for cache_file in cache.cache_dir.glob(f"*{pattern}*.json"):
-        cache_file.unlink(missing_ok=True)
-        count += 1
+    keys = cache.keys_for_prefix(pattern)
+    if keys is None:
+        keys = [key for key, _ in cache._iter_entries() if fnmatch(key, f"*{pattern}*")]
+
+    for key in keys:
+        cache.delete(key)
 
-    return count
+    return len(keys)
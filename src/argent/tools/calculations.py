@@ -3,8 +3,37 @@
 from dataclasses import dataclass
 
 import numpy as np
-import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import stats
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
+from scipy.signal import lfilter
+
+from argent.tools import _kernels
+
+try:
+    import bottleneck as bn
+except ImportError:  # Optional speedup, fall back to NumPy windows
+    bn = None
+
+
+@dataclass
+class PricesCache:
+    """Price series with its log returns computed once for reuse across metrics."""
+
+    prices: np.ndarray
+    log_returns: np.ndarray
+
+    @classmethod
+    def from_prices(cls, prices: "list[float] | PricesCache") -> "PricesCache":
+        """Build a cache from a price list (returns an existing cache unchanged)."""
+        if isinstance(prices, PricesCache):
+            return prices
+        prices_arr = np.asarray(prices, dtype=float)
+        if len(prices_arr) < 2:
+            return cls(prices_arr, np.empty(0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_returns = np.log(prices_arr[1:] / prices_arr[:-1])
+        return cls(prices_arr, log_returns[~np.isnan(log_returns)])
 
 
 @dataclass
@@ -27,14 +56,26 @@ class SupportResistance:
     last_touch: int  # index of last touch
 
 
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Mean of each full window of `period` values (length n - period + 1)."""
+    if bn is not None:
+        return bn.move_mean(values, window=period)[period - 1 :]
+    return np.convolve(values, np.ones(period), mode="valid") / period
+
+
+def _ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the first value (pandas adjust=False)."""
+    alpha = 2.0 / (period + 1)
+    ema, _ = lfilter([alpha], [1.0, alpha - 1.0], values, zi=[values[0] * (1.0 - alpha)])
+    return ema
+
+
 def calculate_sma(prices: list[float], period: int) -> list[float]:
     """Calculate Simple Moving Average."""
     if len(prices) < period:
         return []
 
-    series = pd.Series(prices)
-    sma = series.rolling(window=period).mean()
-    return sma.dropna().tolist()
+    return _rolling_mean(np.asarray(prices, dtype=np.float64), period).tolist()
 
 
 def calculate_ema(prices: list[float], period: int) -> list[float]:
@@ -42,9 +83,7 @@ def calculate_ema(prices: list[float], period: int) -> list[float]:
     if len(prices) < period:
         return []
 
-    series = pd.Series(prices)
-    ema = series.ewm(span=period, adjust=False).mean()
-    return ema.tolist()
+    return _ema(np.asarray(prices, dtype=np.float64), period).tolist()
 
 
 def calculate_rsi(prices: list[float], period: int = 14) -> list[float]:
@@ -57,19 +96,21 @@ def calculate_rsi(prices: list[float], period: int = 14) -> list[float]:
     if len(prices) < period + 1:
         return []
 
-    series = pd.Series(prices)
-    delta = series.diff()
+    prices_arr = np.ascontiguousarray(prices, dtype=np.float64)
+    if _kernels.HAVE_NUMBA:
+        return _kernels.rsi_kernel(prices_arr, period).tolist()
 
-    gain = delta.where(delta > 0, 0)
-    loss = (-delta).where(delta < 0, 0)
+    # The first window counts a zero change for the first price
+    delta = np.diff(prices_arr, prepend=prices_arr[0])
 
-    avg_gain = gain.rolling(window=period).mean()
-    avg_loss = loss.rolling(window=period).mean()
+    avg_gain = _rolling_mean(np.maximum(delta, 0.0), period)
+    avg_loss = _rolling_mean(np.maximum(-delta, 0.0), period)
 
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
 
-    return rsi.dropna().tolist()
+    return rsi[~np.isnan(rsi)].tolist()
 
 
 def calculate_macd(
@@ -87,18 +128,15 @@ def calculate_macd(
     if len(prices) < slow_period + signal_period:
         return {"macd": [], "signal": [], "histogram": []}
 
-    series = pd.Series(prices)
-    ema_fast = series.ewm(span=fast_period, adjust=False).mean()
-    ema_slow = series.ewm(span=slow_period, adjust=False).mean()
-
-    macd_line = ema_fast - ema_slow
-    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+    prices_arr = np.asarray(prices, dtype=np.float64)
+    macd_line = _ema(prices_arr, fast_period) - _ema(prices_arr, slow_period)
+    signal_line = _ema(macd_line, signal_period)
     histogram = macd_line - signal_line
 
     return {
-        "macd": macd_line.dropna().tolist(),
-        "signal": signal_line.dropna().tolist(),
-        "histogram": histogram.dropna().tolist(),
+        "macd": macd_line.tolist(),
+        "signal": signal_line.tolist(),
+        "histogram": histogram.tolist(),
     }
 
 
@@ -116,17 +154,22 @@ def calculate_bollinger_bands(
     if len(prices) < period:
         return {"upper": [], "middle": [], "lower": []}
 
-    series = pd.Series(prices)
-    middle = series.rolling(window=period).mean()
-    std = series.rolling(window=period).std()
+    prices_arr = np.asarray(prices, dtype=np.float64)
+    if bn is not None:
+        middle = bn.move_mean(prices_arr, window=period)[period - 1 :]
+        std = bn.move_std(prices_arr, window=period, ddof=1)[period - 1 :]
+    else:
+        windows = sliding_window_view(prices_arr, period)
+        middle = windows.mean(axis=1)
+        std = windows.std(axis=1, ddof=1)
 
     upper = middle + (std * std_dev)
     lower = middle - (std * std_dev)
 
     return {
-        "upper": upper.dropna().tolist(),
-        "middle": middle.dropna().tolist(),
-        "lower": lower.dropna().tolist(),
+        "upper": upper.tolist(),
+        "middle": middle.tolist(),
+        "lower": lower.tolist(),
     }
 
 
@@ -145,21 +188,33 @@ def calculate_atr(
     if len(high) < period + 1:
         return []
 
-    high_arr = np.array(high)
-    low_arr = np.array(low)
-    close_arr = np.array(close)
-
-    prev_close = np.roll(close_arr, 1)
-    prev_close[0] = close_arr[0]
-
-    tr1 = high_arr - low_arr
-    tr2 = np.abs(high_arr - prev_close)
-    tr3 = np.abs(low_arr - prev_close)
-
-    true_range = np.maximum(tr1, np.maximum(tr2, tr3))
-
-    atr = pd.Series(true_range).rolling(window=period).mean()
-    return atr.dropna().tolist()
+    if _kernels.HAVE_NUMBA:
+        return _kernels.atr_kernel(
+            np.ascontiguousarray(high, dtype=np.float64),
+            np.ascontiguousarray(low, dtype=np.float64),
+            np.ascontiguousarray(close, dtype=np.float64),
+            period,
+        ).tolist()
+
+    high_arr = np.asarray(high, dtype=np.float64)
+    low_arr = np.asarray(low, dtype=np.float64)
+    close_arr = np.asarray(close, dtype=np.float64)
+
+    # Build the true range in place against the previous close (the first bar
+    # uses its own close), reusing one scratch array for both gap terms
+    true_range = high_arr - low_arr
+    prev_close = close_arr[:-1]
+    gap = np.subtract(high_arr[1:], prev_close)
+    np.abs(gap, out=gap)
+    np.maximum(true_range[1:], gap, out=true_range[1:])
+    np.subtract(low_arr[1:], prev_close, out=gap)
+    np.abs(gap, out=gap)
+    np.maximum(true_range[1:], gap, out=true_range[1:])
+    true_range[0] = max(
+        true_range[0], abs(high_arr[0] - close_arr[0]), abs(low_arr[0] - close_arr[0])
+    )
+
+    return _rolling_mean(true_range, period).tolist()
 
 
 def calculate_returns(prices: list[float]) -> list[float]:
@@ -167,35 +222,35 @@ def calculate_returns(prices: list[float]) -> list[float]:
     if len(prices) < 2:
         return []
 
-    series = pd.Series(prices)
-    returns = series.pct_change()
-    return returns.dropna().tolist()
+    prices_arr = np.asarray(prices, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = prices_arr[1:] / prices_arr[:-1] - 1.0
+    return returns[~np.isnan(returns)].tolist()
 
 
 def calculate_log_returns(prices: list[float]) -> list[float]:
     """Calculate logarithmic returns."""
-    if len(prices) < 2:
-        return []
-
-    series = pd.Series(prices)
-    log_returns = np.log(series / series.shift(1))
-    return log_returns.dropna().tolist()
+    return PricesCache.from_prices(prices).log_returns.tolist()
 
 
-def calculate_volatility(prices: list[float], period: int = 252, annualize: bool = True) -> float:
+def calculate_volatility(
+    prices: list[float] | PricesCache,
+    period: int = 252,
+    annualize: bool = True,
+) -> float:
     """
     Calculate annualized volatility.
 
     Args:
-        prices: Price series
+        prices: Price series or precomputed PricesCache
         period: Trading days for annualization (252 for daily, 52 for weekly)
         annualize: Whether to annualize the result
 
     Returns:
         Volatility as a decimal (e.g., 0.20 for 20%)
     """
-    returns = calculate_log_returns(prices)
-    if not returns:
+    returns = PricesCache.from_prices(prices).log_returns
+    if not len(returns):
         return 0.0
 
     std = np.std(returns)
@@ -205,21 +260,22 @@ def calculate_volatility(prices: list[float], period: int = 252, annualize: bool
 
 
 def calculate_beta(
-    asset_prices: list[float],
-    market_prices: list[float],
+    asset_prices: list[float] | PricesCache,
+    market_prices: list[float] | PricesCache,
 ) -> float:
     """
     Calculate beta (systematic risk) relative to market.
 
     Beta = Cov(asset, market) / Var(market)
     """
-    asset_returns = calculate_log_returns(asset_prices)
-    market_returns = calculate_log_returns(market_prices)
+    asset_returns = PricesCache.from_prices(asset_prices).log_returns
+    market_returns = PricesCache.from_prices(market_prices).log_returns
 
     if len(asset_returns) != len(market_returns) or len(asset_returns) < 2:
         return 1.0
 
-    covariance = np.cov(asset_returns, market_returns)[0][1]
+    # Population covariance, to match np.var's default ddof=0
+    covariance = np.cov(asset_returns, market_returns, ddof=0)[0][1]
     market_variance = np.var(market_returns)
 
     if market_variance == 0:
@@ -241,34 +297,32 @@ def calculate_correlation_matrix(
         Nested dict of correlations
     """
     returns_dict = {}
-    min_length = float("inf")
-
     for symbol, prices in price_series.items():
-        returns = calculate_log_returns(prices)
-        if returns:
+        returns = PricesCache.from_prices(prices).log_returns
+        if len(returns):
             returns_dict[symbol] = returns
-            min_length = min(min_length, len(returns))
 
-    if not returns_dict or min_length < 2:
+    if not returns_dict:
+        return {}
+
+    min_length = min(len(r) for r in returns_dict.values())
+    if min_length < 2:
         return {}
 
     # Truncate to same length
-    symbols = list(returns_dict.keys())
-    data = np.array([returns_dict[s][-int(min_length) :] for s in symbols])
+    symbols = list(returns_dict)
+    data = np.vstack([returns_dict[s][-min_length:] for s in symbols])
 
-    corr_matrix = np.corrcoef(data)
+    # atleast_2d keeps a single symbol from collapsing to a scalar
+    corr_rows = np.atleast_2d(np.corrcoef(data)).tolist()
 
-    result = {}
-    for i, sym1 in enumerate(symbols):
-        result[sym1] = {}
-        for j, sym2 in enumerate(symbols):
-            result[sym1][sym2] = float(corr_matrix[i][j])
+    result = {sym: dict(zip(symbols, row)) for sym, row in zip(symbols, corr_rows)}
 
     return result
 
 
 def calculate_var(
-    prices: list[float],
+    prices: list[float] | PricesCache,
     confidence: float = 0.95,
     horizon: int = 1,
 ) -> dict[str, float]:
@@ -276,21 +330,24 @@ def calculate_var(
     Calculate Value at Risk using historical method.
 
     Args:
-        prices: Price series
+        prices: Price series or precomputed PricesCache
         confidence: Confidence level (e.g., 0.95 for 95%)
         horizon: Time horizon in days
 
     Returns:
         dict with VaR metrics
     """
-    returns = calculate_log_returns(prices)
-    if len(returns) < 30:
+    returns_arr = PricesCache.from_prices(prices).log_returns
+    if len(returns_arr) < 30:
         return {"var": 0.0, "confidence": confidence, "horizon": horizon}
 
-    returns_arr = np.array(returns)
-
-    # Historical VaR
-    var_percentile = np.percentile(returns_arr, (1 - confidence) * 100)
+    # Historical VaR: the linearly interpolated quantile, found by selecting the
+    # two bracketing order statistics instead of sorting everything
+    position = (len(returns_arr) - 1) * (1 - confidence)
+    lo = int(position)
+    hi = min(lo + 1, len(returns_arr) - 1)
+    part = np.partition(returns_arr, [lo, hi])
+    var_percentile = part[lo] + (position - lo) * (part[hi] - part[lo])
 
     # Scale for horizon (square root of time)
     var_scaled = var_percentile * np.sqrt(horizon)
@@ -336,7 +393,7 @@ def calculate_max_drawdown(prices: list[float]) -> dict[str, float]:
 
 
 def calculate_sharpe_ratio(
-    prices: list[float],
+    prices: list[float] | PricesCache,
     risk_free_rate: float = 0.05,
     periods_per_year: int = 252,
 ) -> float:
@@ -345,7 +402,7 @@ def calculate_sharpe_ratio(
 
     Sharpe = (Return - Risk Free Rate) / Volatility
     """
-    returns = calculate_log_returns(prices)
+    returns = PricesCache.from_prices(prices).log_returns
     if len(returns) < 2:
         return 0.0
 
@@ -359,7 +416,7 @@ def calculate_sharpe_ratio(
 
 
 def calculate_sortino_ratio(
-    prices: list[float],
+    prices: list[float] | PricesCache,
     risk_free_rate: float = 0.05,
     periods_per_year: int = 252,
 ) -> float:
@@ -368,11 +425,10 @@ def calculate_sortino_ratio(
 
     Sortino = (Return - Risk Free Rate) / Downside Deviation
     """
-    returns = calculate_log_returns(prices)
-    if len(returns) < 2:
+    returns_arr = PricesCache.from_prices(prices).log_returns
+    if len(returns_arr) < 2:
         return 0.0
 
-    returns_arr = np.array(returns)
     mean_return = np.mean(returns_arr) * periods_per_year
 
     # Downside deviation - only consider negative returns
@@ -407,54 +463,67 @@ def identify_support_resistance(
     if len(prices) < window * 2:
         return []
 
-    prices_arr = np.array(prices)
-    levels = []
-
-    # Find local minima (support) and maxima (resistance)
-    for i in range(window, len(prices_arr) - window):
-        window_before = prices_arr[i - window : i]
-        window_after = prices_arr[i + 1 : i + window + 1]
-
-        # Local minimum (potential support)
-        if prices_arr[i] <= window_before.min() and prices_arr[i] <= window_after.min():
-            levels.append({"level": prices_arr[i], "type": "support", "idx": i})
-
-        # Local maximum (potential resistance)
-        if prices_arr[i] >= window_before.max() and prices_arr[i] >= window_after.max():
-            levels.append({"level": prices_arr[i], "type": "resistance", "idx": i})
-
-    # Cluster nearby levels
-    clustered = []
-    for level in levels:
-        merged = False
-        for cluster in clustered:
-            if abs(level["level"] - cluster["level"]) / cluster["level"] < threshold:
-                # Merge into existing cluster
-                cluster["touches"].append(level["idx"])
-                cluster["level"] = (cluster["level"] + level["level"]) / 2
-                merged = True
-                break
-        if not merged:
-            clustered.append(
-                {
-                    "level": level["level"],
-                    "type": level["type"],
-                    "touches": [level["idx"]],
-                }
-            )
-
-    # Convert to SupportResistance objects
-    result = []
-    for cluster in clustered:
-        if len(cluster["touches"]) >= 2:  # Only include levels with multiple touches
-            result.append(
-                SupportResistance(
-                    level=cluster["level"],
-                    type=cluster["type"],
-                    strength=len(cluster["touches"]),
-                    last_touch=max(cluster["touches"]),
-                )
-            )
+    prices_arr = np.asarray(prices, dtype=float)
+
+    # Find local minima (support) and maxima (resistance): a point is an extremum
+    # when it equals the min/max of the centred window around it
+    size = 2 * window + 1
+    is_min = prices_arr == minimum_filter1d(prices_arr, size=size)
+    is_max = prices_arr == maximum_filter1d(prices_arr, size=size)
+
+    # Only points with a full window on both sides qualify
+    candidates = np.flatnonzero(is_min | is_max)
+    candidates = candidates[(candidates >= window) & (candidates < len(prices_arr) - window)]
+    supports = candidates[is_min[candidates]]
+    resistances = candidates[is_max[candidates]]
+
+    # Extrema as parallel arrays, ordered by price (then index, support first)
+    touch_idx = np.concatenate([supports, resistances])
+    is_resistance = np.concatenate(
+        [np.zeros(len(supports), dtype=bool), np.ones(len(resistances), dtype=bool)]
+    )
+    order = np.lexsort((is_resistance, touch_idx, prices_arr[touch_idx]))
+    touch_idx = touch_idx[order]
+    is_resistance = is_resistance[order]
+    touch_prices = prices_arr[touch_idx]
+
+    # Cluster nearby levels: sweep in price order, merging each level into the
+    # current cluster while it stays within threshold of the cluster mean
+    n = len(touch_idx)
+    cluster_levels = np.empty(n)
+    cluster_resistance = np.empty(n, dtype=bool)
+    cluster_touches = np.zeros(n, dtype=np.int32)
+    cluster_last = np.zeros(n, dtype=np.int64)
+    c = -1
+    for j in range(n):
+        price = touch_prices[j]
+        if c >= 0 and abs(price - cluster_levels[c]) / cluster_levels[c] < threshold:
+            cluster_touches[c] += 1
+            cluster_levels[c] += (price - cluster_levels[c]) / cluster_touches[c]
+            cluster_last[c] = max(cluster_last[c], touch_idx[j])
+        else:
+            c += 1
+            cluster_levels[c] = price
+            cluster_resistance[c] = is_resistance[j]
+            cluster_touches[c] = 1
+            cluster_last[c] = touch_idx[j]
+
+    # Only include levels with multiple touches
+    keep = cluster_touches[: c + 1] >= 2
+    result = [
+        SupportResistance(
+            level=level,
+            type="resistance" if resistance else "support",
+            strength=touches,
+            last_touch=last,
+        )
+        for level, resistance, touches, last in zip(
+            cluster_levels[: c + 1][keep].tolist(),
+            cluster_resistance[: c + 1][keep].tolist(),
+            cluster_touches[: c + 1][keep].tolist(),
+            cluster_last[: c + 1][keep].tolist(),
+        )
+    ]
 
     # Sort by strength
     result.sort(key=lambda x: x.strength, reverse=True)
@@ -469,8 +538,11 @@ def calculate_technical_signals(prices: list[float]) -> list[TechnicalSignal]:
     signals = []
     current_price = prices[-1]
 
+    # Convert once; the indicator helpers take the array without copying
+    closes = np.asarray(prices, dtype=np.float64)
+
     # RSI Signal
-    rsi = calculate_rsi(prices)
+    rsi = calculate_rsi(closes)
     if rsi:
         rsi_val = rsi[-1]
         if rsi_val < 30:
@@ -485,7 +557,7 @@ def calculate_technical_signals(prices: list[float]) -> list[TechnicalSignal]:
         signals.append(TechnicalSignal("RSI", rsi_val, signal, min(strength, 1.0)))
 
     # MACD Signal
-    macd = calculate_macd(prices)
+    macd = calculate_macd(closes)
     if macd["histogram"]:
         hist = macd["histogram"][-1]
         prev_hist = macd["histogram"][-2] if len(macd["histogram"]) > 1 else 0
@@ -501,8 +573,8 @@ def calculate_technical_signals(prices: list[float]) -> list[TechnicalSignal]:
         signals.append(TechnicalSignal("MACD", hist, signal, strength))
 
     # Moving Average Signal
-    sma_50 = calculate_sma(prices, 50)
-    sma_200 = calculate_sma(prices, 200)
+    sma_50 = calculate_sma(closes, 50)
+    sma_200 = calculate_sma(closes, 200)
     if sma_50 and sma_200:
         if sma_50[-1] > sma_200[-1]:
             signal = "bullish"
@@ -513,7 +585,7 @@ def calculate_technical_signals(prices: list[float]) -> list[TechnicalSignal]:
         signals.append(TechnicalSignal("MA_Cross", sma_50[-1], signal, strength))
 
     # Bollinger Band Signal
-    bb = calculate_bollinger_bands(prices)
+    bb = calculate_bollinger_bands(closes)
     if bb["upper"] and bb["lower"]:
         bb_position = (current_price - bb["lower"][-1]) / (bb["upper"][-1] - bb["lower"][-1])
         if bb_position < 0.2:
@@ -535,13 +607,14 @@ def calculate_trend_strength(prices: list[float], period: int = 20) -> dict[str,
     if len(prices) < period * 2:
         return {"trend_strength": 0.0, "direction": 0.0}
 
-    returns = calculate_returns(prices[-period:])
-    if not returns:
+    window = np.asarray(prices[-period:], dtype=np.float64)
+    if len(window) < 2:
         return {"trend_strength": 0.0, "direction": 0.0}
 
     # Simple trend strength: consistency of direction
-    positive_returns = sum(1 for r in returns if r > 0)
-    trend_consistency = abs(positive_returns / len(returns) - 0.5) * 2
+    changes = window[1:] - window[:-1]
+    positive_returns = int((changes > 0).sum())
+    trend_consistency = abs(positive_returns / len(changes) - 0.5) * 2
 
     # Direction: positive = uptrend, negative = downtrend
     total_return = (prices[-1] / prices[-period] - 1)
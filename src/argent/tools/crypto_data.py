@@ -1,16 +1,21 @@
 """Cryptocurrency data client using CoinGecko API."""
 
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 from pycoingecko import CoinGeckoAPI
 
-from argent.tools.cache import cached, get_cache
+from argent.tools.cache import TTL_CONFIG, _generate_cache_key, cached, get_cache
+from argent.tools.http_session import get_http_session, get_json
 from argent.tools.rate_limiter import DataSource, get_rate_limiter
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptoPriceData:
     """Normalized crypto price data structure."""
 
@@ -45,69 +50,228 @@ SYMBOL_TO_ID: dict[str, str] = {
     "FIL": "filecoin",
 }
 
+# Reverse of SYMBOL_TO_ID, for labelling market data rows by coin ID
+_ID_TO_SYMBOL: dict[str, str] = {coin_id: symbol for symbol, coin_id in SYMBOL_TO_ID.items()}
+
+# Maximum coin IDs per /coins/markets request, and how many requests run at once
+MARKETS_CHUNK_SIZE = 100
+MARKETS_MAX_WORKERS = 4
+
+# Cache key for the full CoinGecko symbol -> ID map, and key prefix marking
+# symbols that map to no listed coin. Keys are hashed like every other entry,
+# so user-supplied symbols never reach cache filenames
+_COINS_LIST_PREFIX = "coingecko_coins_list"
+_COINS_LIST_KEY = _generate_cache_key(_COINS_LIST_PREFIX)
+_UNKNOWN_SYMBOL_PREFIX = "coingecko_unknown_symbol"
+
+# Seconds to wait before downloading the coin list again after a failure
+COINS_LIST_RETRY_DELAY = 300
+
 
 class CryptoDataClient:
     """Client for fetching cryptocurrency data from CoinGecko."""
 
     def __init__(self):
         self._cg = CoinGeckoAPI()
+        # pycoingecko has no session argument; share the pooled keep-alive session
+        self._cg.session = get_http_session()
         self._rate_limiter = get_rate_limiter()
-        self._id_cache: dict[str, str] = SYMBOL_TO_ID.copy()
+        # Symbols resolved from the coin list; SYMBOL_TO_ID is checked first
+        self._id_cache: dict[str, str] = {}
+        # Reverse of _id_cache, for labelling market data rows by coin ID
+        self._id_to_symbol: dict[str, str] = {}
+        # Full symbol -> ID map from get_coins_list, loaded at most once
+        self._all_coins: dict[str, str] | None = None
+        self._coins_list_retry_at = 0.0
+        # Serializes coin list loads, so a lookup racing warm() waits for its result
+        self._coins_list_lock = threading.Lock()
         # Register dataclasses for cache deserialization
         cache = get_cache()
         cache.register_dataclass(CryptoPriceData)
 
+    def warm(self) -> Future:
+        """
+        Prefetch the coin list in the background.
+
+        Prices are not prefetched: no caller asks for exactly the well-known
+        symbol set, so warming them would only spend CoinGecko's small
+        request budget on a cache key nobody reads.
+
+        Returns:
+            Future that completes once the coin list is loaded
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crypto-warm")
+        future = executor.submit(self._load_all_coins)
+        executor.shutdown(wait=False)
+        return future
+
+    def _get_json(self, path: str, **params: Any) -> Any:
+        """
+        GET a CoinGecko endpoint directly on the client's session.
+
+        Used for the multi-megabyte payloads (coin list, market charts), so the
+        body is decoded with orjson when installed rather than pycoingecko's
+        stdlib json.
+        """
+        if self._cg.extra_params:
+            params.update(self._cg.extra_params)
+        return get_json(
+            f"{self._cg.api_base_url}{path}",
+            params=params,
+            session=self._cg.session,
+            timeout=self._cg.request_timeout,
+        )
+
+    def _load_all_coins(self) -> dict[str, str]:
+        """
+        Load the symbol -> ID map for every coin CoinGecko lists.
+
+        The list is fetched at most once per process and shared through the
+        cache for a day; the first coin listed for a symbol wins. Concurrent
+        callers wait for a load already in progress instead of starting another.
+        """
+        if self._all_coins is not None:
+            return self._all_coins
+        with self._coins_list_lock:
+            return self._load_all_coins_locked()
+
+    def _load_all_coins_locked(self) -> dict[str, str]:
+        """Body of _load_all_coins; call with _coins_list_lock held."""
+        if self._all_coins is not None:
+            return self._all_coins
+        if time.monotonic() < self._coins_list_retry_at:
+            return {}
+
+        cache = get_cache()
+        all_coins = cache.get(_COINS_LIST_KEY, TTL_CONFIG["coins_list"])
+        if all_coins is None:
+            try:
+                coins = self._rate_limiter.call(DataSource.COINGECKO, self._get_json, "coins/list")
+            except Exception:
+                # Don't retry the multi-megabyte download on every lookup while it fails
+                self._coins_list_retry_at = time.monotonic() + COINS_LIST_RETRY_DELAY
+                return {}
+            all_coins = {}
+            for coin in coins:
+                all_coins.setdefault(coin["symbol"].upper(), coin["id"])
+            cache.set(_COINS_LIST_KEY, all_coins, prefix=_COINS_LIST_PREFIX)
+
+        self._all_coins = all_coins
+        return all_coins
+
     def _get_coin_id(self, symbol: str) -> str | None:
         """Convert a symbol to CoinGecko coin ID."""
         symbol_upper = symbol.upper()
-        if symbol_upper in self._id_cache:
-            return self._id_cache[symbol_upper]
+        coin_id = SYMBOL_TO_ID.get(symbol_upper) or self._id_cache.get(symbol_upper)
+        if coin_id:
+            return coin_id
+
+        self._resolve_unlisted([symbol_upper])
+        return self._id_cache.get(symbol_upper)
 
-        # Try to find the coin by searching
-        self._rate_limiter.acquire_sync(DataSource.COINGECKO)
+    def _resolve_unlisted(self, upper_syms: list[str]) -> None:
+        """
+        Look up symbols missing from SYMBOL_TO_ID and _id_cache in the full coin list.
+
+        Symbols the list doesn't contain are remembered in the shared cache, so
+        they don't trigger a coin list load again until the entry expires.
+        """
+        cache = get_cache()
+        ttl = TTL_CONFIG["unknown_symbol"]
+        missing = [
+            symbol
+            for symbol in upper_syms
+            if symbol not in SYMBOL_TO_ID
+            and symbol not in self._id_cache
+            and cache.get(_generate_cache_key(_UNKNOWN_SYMBOL_PREFIX, symbol), ttl) is None
+        ]
+        if not missing:
+            return
+
+        all_coins = self._load_all_coins()
+        if not all_coins:
+            # List unavailable; a miss here says nothing about the symbol
+            return
+
+        for symbol in missing:
+            coin_id = all_coins.get(symbol)
+            if coin_id:
+                self._remember_coin_id(symbol, coin_id)
+            else:
+                cache.set(
+                    _generate_cache_key(_UNKNOWN_SYMBOL_PREFIX, symbol),
+                    True,
+                    prefix=_UNKNOWN_SYMBOL_PREFIX,
+                )
+
+    def _remember_coin_id(self, symbol_upper: str, coin_id: str) -> None:
+        """Record a resolved symbol in both lookup directions."""
+        self._id_cache[symbol_upper] = coin_id
+        self._id_to_symbol[coin_id] = symbol_upper
+
+    def _resolve_coin_ids(self, symbols: list[str]) -> list[str]:
+        """Resolve symbols to CoinGecko IDs, loading the coin list once if needed."""
+        upper_syms = [symbol.upper() for symbol in symbols]
+        self._resolve_unlisted(upper_syms)
+        id_cache = self._id_cache
+        coin_ids = (SYMBOL_TO_ID.get(s) or id_cache.get(s) for s in upper_syms)
+        return list(dict.fromkeys(coin_id for coin_id in coin_ids if coin_id))
+
+    def _fetch_markets_chunk(self, coin_ids: list[str]) -> list[dict[str, Any]]:
+        """Fetch market data for one chunk of coin IDs, empty on failure."""
         try:
-            coins = self._cg.get_coins_list()
-            for coin in coins:
-                if coin["symbol"].upper() == symbol_upper:
-                    self._id_cache[symbol_upper] = coin["id"]
-                    return coin["id"]
+            return self._rate_limiter.call(
+                DataSource.COINGECKO,
+                self._cg.get_coins_markets,
+                vs_currency="usd",
+                ids=",".join(coin_ids),
+                price_change_percentage="24h,7d,30d",
+            )
         except Exception:
-            pass
+            return []
 
-        return None
+    def _fetch_markets(self, coin_ids: list[str]) -> list[dict[str, Any]]:
+        """
+        Fetch market data for any number of coin IDs.
+
+        IDs are split into MARKETS_CHUNK_SIZE requests that run concurrently,
+        within the limiter's spacing and concurrency limit; a failed chunk drops
+        only its coins.
+        """
+        chunks = [
+            coin_ids[i : i + MARKETS_CHUNK_SIZE]
+            for i in range(0, len(coin_ids), MARKETS_CHUNK_SIZE)
+        ]
+        if len(chunks) == 1:
+            return self._fetch_markets_chunk(chunks[0])
+
+        with ThreadPoolExecutor(max_workers=min(MARKETS_MAX_WORKERS, len(chunks))) as executor:
+            results = executor.map(self._fetch_markets_chunk, chunks)
+            return [coin for coins in results for coin in coins]
 
     @cached("crypto_price")
     def get_current_price(self, symbols: list[str]) -> dict[str, CryptoPriceData]:
         """Get current prices for multiple cryptocurrencies."""
-        self._rate_limiter.acquire_sync(DataSource.COINGECKO)
-
         # Convert symbols to coin IDs
-        coin_ids = []
-        symbol_to_id_map = {}
-        for symbol in symbols:
-            coin_id = self._get_coin_id(symbol)
-            if coin_id:
-                coin_ids.append(coin_id)
-                symbol_to_id_map[coin_id] = symbol.upper()
+        coin_ids = self._resolve_coin_ids(symbols)
 
         if not coin_ids:
             return {}
 
-        try:
-            data = self._cg.get_coins_markets(
-                vs_currency="usd",
-                ids=",".join(coin_ids),
-                price_change_percentage="24h,7d,30d",
-            )
-        except Exception:
-            return {}
+        data = self._fetch_markets(coin_ids)
 
+        id_to_symbol = self._id_to_symbol
         result = {}
         for coin in data:
-            symbol = symbol_to_id_map.get(coin["id"], coin["symbol"].upper())
+            coin_id = coin["id"]
+            symbol = (
+                _ID_TO_SYMBOL.get(coin_id)
+                or id_to_symbol.get(coin_id)
+                or coin["symbol"].upper()
+            )
             result[symbol] = CryptoPriceData(
                 symbol=symbol,
-                coin_id=coin["id"],
+                coin_id=coin_id,
                 timestamp=datetime.now(),
                 price_usd=coin.get("current_price", 0),
                 market_cap=coin.get("market_cap", 0),
@@ -120,54 +284,99 @@ class CryptoDataClient:
         return result
 
     @cached("crypto_history")
-    def get_price_history(
+    def get_price_history_arrays(
         self,
         symbol: str,
         days: int = 365,
-    ) -> list[dict[str, Any]]:
+    ) -> dict[str, np.ndarray]:
         """
-        Fetch historical price data for a cryptocurrency.
+        Fetch historical price data for a cryptocurrency as columns.
 
         Args:
             symbol: Crypto symbol (e.g., BTC, ETH)
             days: Number of days of history (1, 7, 14, 30, 90, 180, 365, max)
 
         Returns:
-            List of price data dictionaries
+            Dict of equal-length arrays: "timestamp" (datetime64[ms], UTC),
+            "price", "volume" and "market_cap" (float64, NaN where the API
+            returned fewer points than prices); empty if unavailable
         """
         coin_id = self._get_coin_id(symbol)
         if not coin_id:
-            return []
-
-        self._rate_limiter.acquire_sync(DataSource.COINGECKO)
+            return {}
 
         try:
-            data = self._cg.get_coin_market_chart_by_id(
-                id=coin_id,
+            data = self._rate_limiter.call(
+                DataSource.COINGECKO,
+                self._get_json,
+                f"coins/{coin_id}/market_chart",
                 vs_currency="usd",
                 days=days,
             )
         except Exception:
+            return {}
+
+        prices = np.asarray(data.get("prices") or [], dtype=np.float64).reshape(-1, 2)
+        if not len(prices):
+            return {}
+
+        def aligned(key: str) -> np.ndarray:
+            # Align a value column with prices, padding a short series with NaN
+            column = np.full(len(prices), np.nan)
+            values = np.asarray(data.get(key) or [], dtype=np.float64).reshape(-1, 2)
+            values = values[: len(prices), 1]
+            column[: len(values)] = values
+            return column
+
+        return {
+            "timestamp": prices[:, 0].astype("datetime64[ms]"),
+            "price": prices[:, 1],
+            "volume": aligned("total_volumes"),
+            "market_cap": aligned("market_caps"),
+        }
+
+    def get_price_history(
+        self,
+        symbol: str,
+        days: int = 365,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch historical price data for a cryptocurrency.
+
+        Row-per-point view of get_price_history_arrays.
+
+        Args:
+            symbol: Crypto symbol (e.g., BTC, ETH)
+            days: Number of days of history (1, 7, 14, 30, 90, 180, 365, max)
+
+        Returns:
+            List of price data dictionaries
+        """
+        history = self.get_price_history_arrays(symbol, days=days)
+        if not history:
             return []
 
-        prices = data.get("prices", [])
-        volumes = data.get("total_volumes", [])
-        market_caps = data.get("market_caps", [])
+        def nullable(values: np.ndarray) -> list[float | None]:
+            return np.where(np.isnan(values), None, values).tolist()
 
-        result = []
-        for i, (timestamp_ms, price) in enumerate(prices):
-            result.append(
-                {
-                    "symbol": symbol.upper(),
-                    "timestamp": datetime.fromtimestamp(timestamp_ms / 1000),
-                    "price_usd": price,
-                    "volume": volumes[i][1] if i < len(volumes) else None,
-                    "market_cap": market_caps[i][1] if i < len(market_caps) else None,
-                    "source": "coingecko",
-                }
+        symbol_upper = symbol.upper()
+        seconds = (history["timestamp"].astype(np.int64) / 1000).tolist()
+        return [
+            {
+                "symbol": symbol_upper,
+                "timestamp": datetime.fromtimestamp(timestamp),
+                "price_usd": price,
+                "volume": volume,
+                "market_cap": market_cap,
+                "source": "coingecko",
+            }
+            for timestamp, price, volume, market_cap in zip(
+                seconds,
+                history["price"].tolist(),
+                nullable(history["volume"]),
+                nullable(history["market_cap"]),
             )
-
-        return result
+        ]
 
     @cached("crypto_info")
     def get_coin_info(self, symbol: str) -> dict[str, Any] | None:
@@ -176,10 +385,10 @@ class CryptoDataClient:
         if not coin_id:
             return None
 
-        self._rate_limiter.acquire_sync(DataSource.COINGECKO)
-
         try:
-            data = self._cg.get_coin_by_id(
+            data = self._rate_limiter.call(
+                DataSource.COINGECKO,
+                self._cg.get_coin_by_id,
                 id=coin_id,
                 localization=False,
                 tickers=False,
@@ -189,23 +398,26 @@ class CryptoDataClient:
         except Exception:
             return None
 
-        market_data = data.get("market_data", {})
+        market_data = data.get("market_data") or {}
+
+        def usd(key: str) -> Any:
+            return (market_data.get(key) or {}).get("usd")
 
         return {
             "symbol": symbol.upper(),
             "name": data.get("name"),
-            "description": data.get("description", {}).get("en", "")[:500],
+            "description": (data.get("description") or {}).get("en", "")[:500],
             "market_cap_rank": data.get("market_cap_rank"),
-            "current_price": market_data.get("current_price", {}).get("usd"),
-            "market_cap": market_data.get("market_cap", {}).get("usd"),
-            "total_volume": market_data.get("total_volume", {}).get("usd"),
+            "current_price": usd("current_price"),
+            "market_cap": usd("market_cap"),
+            "total_volume": usd("total_volume"),
             "circulating_supply": market_data.get("circulating_supply"),
             "total_supply": market_data.get("total_supply"),
             "max_supply": market_data.get("max_supply"),
-            "ath": market_data.get("ath", {}).get("usd"),
-            "ath_date": market_data.get("ath_date", {}).get("usd"),
-            "atl": market_data.get("atl", {}).get("usd"),
-            "atl_date": market_data.get("atl_date", {}).get("usd"),
+            "ath": usd("ath"),
+            "ath_date": usd("ath_date"),
+            "atl": usd("atl"),
+            "atl_date": usd("atl_date"),
             "price_change_24h": market_data.get("price_change_percentage_24h"),
             "price_change_7d": market_data.get("price_change_percentage_7d"),
             "price_change_30d": market_data.get("price_change_percentage_30d"),
@@ -215,30 +427,29 @@ class CryptoDataClient:
     @cached("crypto_price", ttl=300)  # 5 minutes for global data
     def get_global_market_data(self) -> dict[str, Any]:
         """Get global cryptocurrency market data."""
-        self._rate_limiter.acquire_sync(DataSource.COINGECKO)
-
         try:
-            data = self._cg.get_global()
+            data = self._rate_limiter.call(DataSource.COINGECKO, self._cg.get_global)
         except Exception:
             return {}
 
+        # pycoingecko already unwraps the response's "data" envelope
+        market_cap_share = data.get("market_cap_percentage") or {}
+
         return {
-            "total_market_cap_usd": data.get("data", {}).get("total_market_cap", {}).get("usd"),
-            "total_volume_24h_usd": data.get("data", {}).get("total_volume", {}).get("usd"),
-            "btc_dominance": data.get("data", {}).get("market_cap_percentage", {}).get("btc"),
-            "eth_dominance": data.get("data", {}).get("market_cap_percentage", {}).get("eth"),
-            "active_cryptocurrencies": data.get("data", {}).get("active_cryptocurrencies"),
-            "markets": data.get("data", {}).get("markets"),
-            "market_cap_change_24h": data.get("data", {}).get("market_cap_change_percentage_24h_usd"),
+            "total_market_cap_usd": (data.get("total_market_cap") or {}).get("usd"),
+            "total_volume_24h_usd": (data.get("total_volume") or {}).get("usd"),
+            "btc_dominance": market_cap_share.get("btc"),
+            "eth_dominance": market_cap_share.get("eth"),
+            "active_cryptocurrencies": data.get("active_cryptocurrencies"),
+            "markets": data.get("markets"),
+            "market_cap_change_24h": data.get("market_cap_change_percentage_24h_usd"),
         }
 
     @cached("crypto_price", ttl=900)  # 15 minutes for trending
     def get_trending(self) -> list[dict[str, Any]]:
         """Get trending cryptocurrencies."""
-        self._rate_limiter.acquire_sync(DataSource.COINGECKO)
-
         try:
-            data = self._cg.get_search_trending()
+            data = self._rate_limiter.call(DataSource.COINGECKO, self._cg.get_search_trending)
         except Exception:
             return []
 
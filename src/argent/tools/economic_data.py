@@ -1,14 +1,17 @@
 """Economic data client using FRED API."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+import pandas as pd
+
 from argent.tools.cache import cached, get_cache
 from argent.tools.rate_limiter import DataSource, get_rate_limiter
 
 
-@dataclass
+@dataclass(slots=True)
 class EconomicIndicator:
     """Normalized economic indicator data structure."""
 
@@ -56,6 +59,17 @@ FRED_SERIES: dict[str, dict[str, str]] = {
 }
 
 
+def _latest(series: pd.Series) -> dict[str, Any]:
+    """Latest value and its ISO date from a series, or ``None`` for both when empty."""
+    if series.empty:
+        return {"latest": None, "date": None}
+    return {"latest": float(series.iloc[-1]), "date": series.index[-1].isoformat()}
+
+
+# Concurrent FRED requests per client; the rate limiter still spaces them out
+FRED_MAX_WORKERS = 6
+
+
 class EconomicDataClient:
     """Client for fetching economic data from FRED."""
 
@@ -63,6 +77,7 @@ class EconomicDataClient:
         self._api_key = api_key
         self._rate_limiter = get_rate_limiter()
         self._fred = None
+        self._pool = ThreadPoolExecutor(max_workers=FRED_MAX_WORKERS)
         # Register dataclasses for cache deserialization
         cache = get_cache()
         cache.register_dataclass(EconomicIndicator)
@@ -75,10 +90,59 @@ class EconomicDataClient:
             except ImportError:
                 pass
 
+    def warm(self) -> Future:
+        """
+        Prefetch the macro snapshot series in the background.
+
+        The snapshot fans its series out to the client's pool and waits on
+        them, so it runs on its own thread rather than taking a pool worker.
+
+        Returns:
+            Future that completes once the snapshot is cached
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="econ-warm")
+        future = executor.submit(self.get_macro_snapshot)
+        executor.shutdown(wait=False)
+        return future
+
+    def close(self) -> None:
+        """Shut down the fetch pool."""
+        self._pool.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def _ensure_fred(self) -> bool:
         """Ensure FRED client is available."""
         return self._fred is not None
 
+    def _get_series_raw(
+        self,
+        series_id: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int = 100,
+    ) -> pd.Series:
+        """Fetch the last ``limit`` non-missing observations of a series as a pandas Series."""
+        if not self._ensure_fred():
+            return pd.Series(dtype=float)
+
+        try:
+            series = self._rate_limiter.call(
+                DataSource.FRED,
+                self._fred.get_series,
+                series_id,
+                observation_start=start_date,
+                observation_end=end_date,
+            )
+        except Exception:
+            return pd.Series(dtype=float)
+
+        return series.dropna().tail(limit)
+
     @cached("economic_indicator")
     def get_series(
         self,
@@ -99,52 +163,54 @@ class EconomicDataClient:
         Returns:
             List of EconomicIndicator objects
         """
-        if not self._ensure_fred():
-            return []
-
-        self._rate_limiter.acquire_sync(DataSource.FRED)
-
-        try:
-            series = self._fred.get_series(
-                series_id,
-                observation_start=start_date,
-                observation_end=end_date,
-            )
-        except Exception:
-            return []
+        series = self._get_series_raw(series_id, start_date, end_date, limit)
 
         series_info = FRED_SERIES.get(series_id, {"name": series_id, "frequency": "unknown"})
-
-        result = []
-        for date, value in series.tail(limit).items():
-            if value is not None and not (isinstance(value, float) and value != value):  # Check for NaN
-                result.append(
-                    EconomicIndicator(
-                        series_id=series_id,
-                        name=series_info["name"],
-                        date=date.to_pydatetime(),
-                        value=float(value),
-                        frequency=series_info["frequency"],
-                    )
-                )
-
-        return result
+        name = series_info["name"]
+        frequency = series_info["frequency"]
+
+        # Missing observations were dropped in pandas by _get_series_raw
+        return [
+            EconomicIndicator(
+                series_id=series_id,
+                name=name,
+                date=date,
+                value=value,
+                frequency=frequency,
+            )
+            for date, value in zip(
+                series.index.to_pydatetime(), series.to_numpy(dtype=float).tolist()
+            )
+        ]
 
     def get_latest_value(self, series_id: str) -> EconomicIndicator | None:
         """Get the most recent value for a series."""
         indicators = self.get_series(series_id, limit=1)
         return indicators[-1] if indicators else None
 
+    def _latest_values(self, series_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch the latest value of several series concurrently."""
+        futures = {sid: self._pool.submit(self.get_latest_value, sid) for sid in series_ids}
+
+        values = {}
+        for series_id, future in futures.items():
+            indicator = future.result()
+            if indicator:
+                values[series_id] = {
+                    "name": indicator.name,
+                    "value": indicator.value,
+                    "date": indicator.date.isoformat(),
+                }
+        return values
+
     @cached("economic_indicator", ttl=86400)  # 24 hours for metadata
     def get_series_info(self, series_id: str) -> dict[str, Any] | None:
         """Get metadata about a FRED series."""
         if not self._ensure_fred():
             return None
 
-        self._rate_limiter.acquire_sync(DataSource.FRED)
-
         try:
-            info = self._fred.get_series_info(series_id)
+            info = self._rate_limiter.call(DataSource.FRED, self._fred.get_series_info, series_id)
             return {
                 "series_id": series_id,
                 "title": info.get("title"),
@@ -163,8 +229,6 @@ class EconomicDataClient:
         if not self._ensure_fred():
             return {"error": "FRED API key not configured"}
 
-        snapshot = {}
-
         # Key indicators to fetch
         key_series = [
             "FEDFUNDS",
@@ -176,14 +240,7 @@ class EconomicDataClient:
             "UMCSENT",
         ]
 
-        for series_id in key_series:
-            indicator = self.get_latest_value(series_id)
-            if indicator:
-                snapshot[series_id] = {
-                    "name": indicator.name,
-                    "value": indicator.value,
-                    "date": indicator.date.isoformat(),
-                }
+        snapshot = self._latest_values(key_series)
 
         # Calculate yield curve spread
         if "DGS10" in snapshot and "DGS2" in snapshot:
@@ -201,31 +258,21 @@ class EconomicDataClient:
         if not self._ensure_fred():
             return {}
 
-        cpi = self.get_series("CPIAUCSL", limit=periods)
-        core_cpi = self.get_series("CPILFESL", limit=periods)
-        pce = self.get_series("PCEPI", limit=periods)
+        futures = [
+            self._pool.submit(self._get_series_raw, series_id, limit=periods)
+            for series_id in ("CPIAUCSL", "CPILFESL", "PCEPI")
+        ]
+        cpi, core_cpi, pce = (future.result() for future in futures)
 
-        def calc_yoy_change(data: list[EconomicIndicator]) -> float | None:
-            if len(data) >= 13:
-                return ((data[-1].value / data[-13].value) - 1) * 100
+        def calc_yoy_change(series: pd.Series) -> float | None:
+            if len(series) >= 13:
+                return (float(series.iloc[-1] / series.iloc[-13]) - 1) * 100
             return None
 
         return {
-            "cpi": {
-                "latest": cpi[-1].value if cpi else None,
-                "yoy_change": calc_yoy_change(cpi),
-                "date": cpi[-1].date.isoformat() if cpi else None,
-            },
-            "core_cpi": {
-                "latest": core_cpi[-1].value if core_cpi else None,
-                "yoy_change": calc_yoy_change(core_cpi),
-                "date": core_cpi[-1].date.isoformat() if core_cpi else None,
-            },
-            "pce": {
-                "latest": pce[-1].value if pce else None,
-                "yoy_change": calc_yoy_change(pce),
-                "date": pce[-1].date.isoformat() if pce else None,
-            },
+            "cpi": {**_latest(cpi), "yoy_change": calc_yoy_change(cpi)},
+            "core_cpi": {**_latest(core_cpi), "yoy_change": calc_yoy_change(core_cpi)},
+            "pce": {**_latest(pce), "yoy_change": calc_yoy_change(pce)},
         }
 
     @cached("economic_indicator")
@@ -234,29 +281,27 @@ class EconomicDataClient:
         if not self._ensure_fred():
             return {}
 
-        unemployment = self.get_series("UNRATE", limit=periods)
-        payrolls = self.get_series("PAYEMS", limit=periods)
-        claims = self.get_series("ICSA", limit=12)
+        futures = [
+            self._pool.submit(self._get_series_raw, "UNRATE", limit=periods),
+            self._pool.submit(self._get_series_raw, "PAYEMS", limit=periods),
+            self._pool.submit(self._get_series_raw, "ICSA", limit=12),
+        ]
+        unemployment, payrolls, claims = (future.result() for future in futures)
 
         return {
             "unemployment_rate": {
-                "latest": unemployment[-1].value if unemployment else None,
-                "change_1y": (unemployment[-1].value - unemployment[-13].value)
+                **_latest(unemployment),
+                "change_1y": float(unemployment.iloc[-1] - unemployment.iloc[-13])
                 if len(unemployment) >= 13
                 else None,
-                "date": unemployment[-1].date.isoformat() if unemployment else None,
             },
             "nonfarm_payrolls": {
-                "latest": payrolls[-1].value if payrolls else None,
-                "monthly_change": (payrolls[-1].value - payrolls[-2].value)
+                **_latest(payrolls),
+                "monthly_change": float(payrolls.iloc[-1] - payrolls.iloc[-2])
                 if len(payrolls) >= 2
                 else None,
-                "date": payrolls[-1].date.isoformat() if payrolls else None,
-            },
-            "initial_claims": {
-                "latest": claims[-1].value if claims else None,
-                "date": claims[-1].date.isoformat() if claims else None,
             },
+            "initial_claims": _latest(claims),
         }
 
     @cached("economic_indicator")
@@ -265,38 +310,31 @@ class EconomicDataClient:
         if not self._ensure_fred():
             return {}
 
-        rates = {}
         rate_series = ["FEDFUNDS", "DFF", "DGS2", "DGS10", "DGS30"]
 
-        for series_id in rate_series:
-            indicator = self.get_latest_value(series_id)
-            if indicator:
-                rates[series_id] = {
-                    "name": indicator.name,
-                    "value": indicator.value,
-                    "date": indicator.date.isoformat(),
-                }
-
-        return rates
+        return self._latest_values(rate_series)
 
     def search_series(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search for FRED series by keyword."""
         if not self._ensure_fred():
             return []
 
-        self._rate_limiter.acquire_sync(DataSource.FRED)
-
         try:
-            results = self._fred.search(query, limit=limit)
+            results = self._rate_limiter.call(
+                DataSource.FRED, self._fred.search, query, limit=limit
+            )
+            if results is None:
+                return []
+            records = results.to_dict("index")
             return [
                 {
-                    "series_id": row.name,
-                    "title": row.get("title"),
-                    "frequency": row.get("frequency"),
-                    "units": row.get("units"),
-                    "popularity": row.get("popularity"),
+                    "series_id": series_id,
+                    "title": record.get("title"),
+                    "frequency": record.get("frequency"),
+                    "units": record.get("units"),
+                    "popularity": record.get("popularity"),
                 }
-                for _, row in results.iterrows()
+                for series_id, record in records.items()
             ]
         except Exception:
             return []
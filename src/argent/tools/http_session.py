@@ -0,0 +1,84 @@
+"""Shared HTTP session for the data clients."""
+
+import json
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to stdlib json
+    orjson = None
+
+# Connection pools per host and connections kept alive in each
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 50
+
+# Gateway errors retried with exponential backoff. Throttling statuses (429, 503)
+# are left to RateLimiter.call, which backs off and keeps requests spaced out
+RETRY_STATUSES = (502, 504)
+
+
+def loads(raw: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _create_session() -> requests.Session:
+    """Build a keep-alive session with pooled, retrying HTTPS adapters."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        # urllib3 would otherwise still retry any response carrying Retry-After
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_http_session: requests.Session | None = None
+
+
+def get_http_session() -> requests.Session:
+    """Get or create the global HTTP session instance."""
+    global _http_session
+    if _http_session is None:
+        _http_session = _create_session()
+    return _http_session
+
+
+def get_json(
+    url: str,
+    params: dict[str, Any] | None = None,
+    session: requests.Session | None = None,
+    timeout: float = 30,
+) -> Any:
+    """
+    GET a URL and decode its JSON body from the raw bytes.
+
+    Args:
+        url: URL to fetch
+        params: Query parameters
+        session: Session to use (the global session if not provided)
+        timeout: Request timeout in seconds
+
+    Returns:
+        Decoded JSON
+
+    Raises:
+        requests.HTTPError: If the response status is an error
+    """
+    response = (session or get_http_session()).get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    return loads(response.content)
@@ -1,5 +1,9 @@
 """Market data client using Yahoo Finance and Alpha Vantage."""
 
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -7,11 +11,11 @@ from typing import Any
 import pandas as pd
 import yfinance as yf
 
-from argent.tools.cache import cached, get_cache
+from argent.tools.cache import TTL_CONFIG, cached, get_cache
 from argent.tools.rate_limiter import DataSource, get_rate_limiter
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     """Normalized price data structure."""
 
@@ -25,7 +29,7 @@ class PriceData:
     source: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyInfo:
     """Company fundamental information."""
 
@@ -51,17 +55,73 @@ class CompanyInfo:
     fifty_two_week_low: float | None
 
 
+# Ticker objects reused per client; yfinance memoizes quote and statement data on
+# them, so they are dropped after the shortest cache TTL to keep quotes fresh
+TICKER_CACHE_SIZE = 256
+TICKER_TTL = TTL_CONFIG["current_price"]
+
+# quoteSummary modules holding every field get_company_info reads
+COMPANY_INFO_MODULES = [
+    "quoteType",
+    "assetProfile",
+    "summaryDetail",
+    "defaultKeyStatistics",
+    "financialData",
+]
+
+
 class MarketDataClient:
     """Client for fetching stock and ETF market data."""
 
     def __init__(self, alpha_vantage_api_key: str | None = None):
         self.alpha_vantage_api_key = alpha_vantage_api_key
         self._rate_limiter = get_rate_limiter()
+        self._tickers: OrderedDict[str, tuple[float, yf.Ticker]] = OrderedDict()
+        self._tickers_lock = threading.Lock()
         # Register dataclasses for cache deserialization
         cache = get_cache()
         cache.register_dataclass(PriceData)
         cache.register_dataclass(CompanyInfo)
 
+    def warm(self, watchlist: list[str] | None = None) -> Future:
+        """
+        Prefetch current prices for a watchlist in the background.
+
+        Args:
+            watchlist: Symbols to prefetch (nothing is fetched if omitted)
+
+        Returns:
+            Future that completes once the prices are cached
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="market-warm")
+        future = executor.submit(self._warm, list(watchlist or []))
+        executor.shutdown(wait=False)
+        return future
+
+    def _warm(self, watchlist: list[str]) -> None:
+        for symbol in watchlist:
+            try:
+                self.get_current_price(symbol)
+            except Exception:
+                continue
+
+    def _ticker(self, symbol: str) -> yf.Ticker:
+        """Get a reusable yfinance Ticker for a symbol."""
+        key = symbol.upper()
+        now = time.monotonic()
+        with self._tickers_lock:
+            entry = self._tickers.get(key)
+            if entry is not None and now - entry[0] < TICKER_TTL:
+                self._tickers.move_to_end(key)
+                return entry[1]
+
+            ticker = yf.Ticker(symbol)
+            self._tickers[key] = (now, ticker)
+            self._tickers.move_to_end(key)
+            if len(self._tickers) > TICKER_CACHE_SIZE:
+                self._tickers.popitem(last=False)
+            return ticker
+
     @cached("price_history")
     def get_price_history(
         self,
@@ -80,38 +140,76 @@ class MarketDataClient:
         Returns:
             List of PriceData objects
         """
-        self._rate_limiter.acquire_sync(DataSource.YAHOO_FINANCE)
-
-        ticker = yf.Ticker(symbol)
-        df = ticker.history(period=period, interval=interval)
+        ticker = self._ticker(symbol)
+        df = self._rate_limiter.call(
+            DataSource.YAHOO_FINANCE, ticker.history, period=period, interval=interval
+        )
 
         if df.empty:
             return []
 
-        prices = []
-        for timestamp, row in df.iterrows():
-            prices.append(
-                PriceData(
-                    symbol=symbol,
-                    timestamp=timestamp.to_pydatetime(),
-                    open=float(row["Open"]),
-                    high=float(row["High"]),
-                    low=float(row["Low"]),
-                    close=float(row["Close"]),
-                    volume=int(row["Volume"]),
-                    source="yahoo_finance",
-                )
+        # Pull whole columns out once instead of boxing every row with iterrows
+        opens, highs, lows, closes = (
+            df[column].to_numpy(dtype=float).tolist() for column in ("Open", "High", "Low", "Close")
+        )
+        volumes = df["Volume"].to_numpy(dtype="int64").tolist()
+
+        return [
+            PriceData(symbol, timestamp, open_, high, low, close, volume, "yahoo_finance")
+            for timestamp, open_, high, low, close, volume in zip(
+                df.index.to_pydatetime(), opens, highs, lows, closes, volumes
             )
+        ]
+
+    def _quote_summary(self, ticker: yf.Ticker, modules: list[str]) -> dict[str, Any] | None:
+        """
+        Fetch selected quoteSummary modules as one flat dict keyed like ``ticker.info``.
 
-        return prices
+        Goes through yfinance's authenticated session, but skips the extra quote
+        request ``info`` makes. Returns None if the response is empty.
+        """
+        response = ticker._quote._fetch(modules=modules)
+        try:
+            result = response["quoteSummary"]["result"][0]
+        except (KeyError, IndexError, TypeError):
+            return None
+
+        info: dict[str, Any] = {}
+        for module in result.values():
+            if isinstance(module, dict):
+                info.update((k, v) for k, v in module.items() if v is not None)
+        return info or None
+
+    @staticmethod
+    def _fast_quote(ticker: yf.Ticker, symbol: str) -> dict[str, Any]:
+        """Build the current price dict from ``ticker.fast_info``."""
+        fast_info = ticker.fast_info
+        return {
+            "symbol": symbol,
+            "current_price": fast_info.last_price,
+            "previous_close": fast_info.previous_close,
+            "open": fast_info.open,
+            "day_high": fast_info.day_high,
+            "day_low": fast_info.day_low,
+            "volume": fast_info.last_volume,
+            "market_cap": fast_info.market_cap,
+            "fifty_two_week_high": fast_info.year_high,
+            "fifty_two_week_low": fast_info.year_low,
+        }
 
     @cached("current_price")
     def get_current_price(self, symbol: str) -> dict[str, Any]:
         """Get current price and basic info for a symbol."""
-        self._rate_limiter.acquire_sync(DataSource.YAHOO_FINANCE)
+        ticker = self._ticker(symbol)
+        try:
+            # fast_info reads the small quote endpoint instead of the full quoteSummary
+            return self._rate_limiter.call(
+                DataSource.YAHOO_FINANCE, self._fast_quote, ticker, symbol
+            )
+        except Exception:
+            pass
 
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = self._rate_limiter.call(DataSource.YAHOO_FINANCE, getattr, ticker, "info")
 
         return {
             "symbol": symbol,
@@ -129,10 +227,15 @@ class MarketDataClient:
     @cached("company_info")
     def get_company_info(self, symbol: str) -> CompanyInfo:
         """Get detailed company fundamental information."""
-        self._rate_limiter.acquire_sync(DataSource.YAHOO_FINANCE)
-
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        ticker = self._ticker(symbol)
+        try:
+            info = self._rate_limiter.call(
+                DataSource.YAHOO_FINANCE, self._quote_summary, ticker, COMPANY_INFO_MODULES
+            )
+        except Exception:
+            info = None
+        if not info:
+            info = self._rate_limiter.call(DataSource.YAHOO_FINANCE, getattr, ticker, "info")
 
         return CompanyInfo(
             symbol=symbol,
@@ -160,35 +263,38 @@ class MarketDataClient:
     @cached("financials")
     def get_financials(self, symbol: str) -> dict[str, Any]:
         """Get company financial statements."""
-        self._rate_limiter.acquire_sync(DataSource.YAHOO_FINANCE)
-
-        ticker = yf.Ticker(symbol)
+        ticker = self._ticker(symbol)
 
         def df_to_dict(df: pd.DataFrame) -> dict[str, Any]:
             if df.empty:
                 return {}
+            # Coerce and drop missing values column-wise in pandas rather than per cell
+            numeric = df.apply(pd.to_numeric, errors="coerce")
+            labels = numeric.index.astype(str)
             result = {}
-            for col in df.columns:
-                col_data = {}
-                for idx, val in df[col].items():
-                    if pd.notna(val):
-                        col_data[str(idx)] = float(val) if isinstance(val, (int, float)) else val
-                result[str(col.date())] = col_data
+            for col in numeric.columns:
+                values = numeric[col]
+                present = values.notna().to_numpy()
+                result[str(col.date())] = dict(
+                    zip(labels[present], values[present].astype(float).tolist())
+                )
             return result
 
+        # Each statement is a separate request, fetched on first attribute access
+        def fetch(statement: str) -> pd.DataFrame:
+            return self._rate_limiter.call(DataSource.YAHOO_FINANCE, getattr, ticker, statement)
+
         return {
-            "income_statement": df_to_dict(ticker.income_stmt),
-            "balance_sheet": df_to_dict(ticker.balance_sheet),
-            "cash_flow": df_to_dict(ticker.cashflow),
+            "income_statement": df_to_dict(fetch("income_stmt")),
+            "balance_sheet": df_to_dict(fetch("balance_sheet")),
+            "cash_flow": df_to_dict(fetch("cashflow")),
         }
 
     @cached("recommendations")
     def get_recommendations(self, symbol: str) -> list[dict[str, Any]]:
         """Get analyst recommendations for a symbol."""
-        self._rate_limiter.acquire_sync(DataSource.YAHOO_FINANCE)
-
-        ticker = yf.Ticker(symbol)
-        recs = ticker.recommendations
+        ticker = self._ticker(symbol)
+        recs = self._rate_limiter.call(DataSource.YAHOO_FINANCE, getattr, ticker, "recommendations")
 
         if recs is None or recs.empty:
             return []
@@ -209,10 +315,8 @@ class MarketDataClient:
 
     def search_symbols(self, query: str) -> list[dict[str, str]]:
         """Search for symbols matching a query."""
-        self._rate_limiter.acquire_sync(DataSource.YAHOO_FINANCE)
-
         try:
-            results = yf.Tickers(query)
+            results = self._rate_limiter.call(DataSource.YAHOO_FINANCE, yf.Tickers, query)
             return [{"symbol": query, "name": query}]
         except Exception:
             return []
@@ -1,16 +1,116 @@
 """Financial news fetching and sentiment analysis."""
 
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
-import httpx
+import yfinance as yf
 
 from argent.tools.cache import cached, get_cache
 from argent.tools.rate_limiter import DataSource, get_rate_limiter
 
-
-@dataclass
+# Keywords for analyze_sentiment_simple, matched against whole words of the text
+POSITIVE_WORDS = frozenset({
+    "surge", "soar", "rally", "gain", "rise", "jump", "bull",
+    "growth", "profit", "beat", "exceed", "strong", "upgrade",
+    "buy", "outperform", "positive", "optimistic", "boom",
+})
+NEGATIVE_WORDS = frozenset({
+    "crash", "plunge", "fall", "drop", "decline", "loss",
+    "bear", "miss", "weak", "downgrade", "sell", "underperform",
+    "negative", "pessimistic", "recession", "fear", "crisis",
+})
+
+# Inflected forms that count as their keyword; headlines rarely use the bare stem
+KEYWORD_FORMS: dict[str, tuple[str, ...]] = {
+    "surge": ("surges", "surged", "surging"),
+    "soar": ("soars", "soared", "soaring"),
+    "rally": ("rallies", "rallied", "rallying"),
+    "gain": ("gains", "gained", "gaining"),
+    "rise": ("rises", "rose", "risen", "rising"),
+    "jump": ("jumps", "jumped", "jumping"),
+    "bull": ("bulls", "bullish"),
+    "profit": ("profits", "profitable", "profitability"),
+    "beat": ("beats", "beating"),
+    "exceed": ("exceeds", "exceeded", "exceeding"),
+    "strong": ("stronger", "strongest"),
+    "upgrade": ("upgrades", "upgraded"),
+    "buy": ("buys", "buying"),
+    "outperform": ("outperforms", "outperformed", "outperforming"),
+    "optimistic": ("optimism",),
+    "boom": ("booms", "boomed", "booming"),
+    "crash": ("crashes", "crashed", "crashing"),
+    "plunge": ("plunges", "plunged", "plunging"),
+    "fall": ("falls", "fell", "fallen", "falling"),
+    "drop": ("drops", "dropped", "dropping"),
+    "decline": ("declines", "declined", "declining"),
+    "loss": ("losses",),
+    "bear": ("bears", "bearish"),
+    "miss": ("misses", "missed"),
+    "weak": ("weaker", "weakest", "weakness", "weakens", "weakened"),
+    "downgrade": ("downgrades", "downgraded"),
+    "sell": ("sells", "selling", "selloff"),
+    "underperform": ("underperforms", "underperformed", "underperforming"),
+    "pessimistic": ("pessimism",),
+    "recession": ("recessions",),
+    "fear": ("fears", "feared"),
+    "crisis": ("crises",),
+}
+
+# Every accepted word form mapped to its keyword
+_KEYWORD_OF = {word: word for word in POSITIVE_WORDS | NEGATIVE_WORDS} | {
+    form: word for word, forms in KEYWORD_FORMS.items() for form in forms
+}
+_POSITIVE_FORMS = frozenset(form for form, word in _KEYWORD_OF.items() if word in POSITIVE_WORDS)
+_NEGATIVE_FORMS = frozenset(form for form, word in _KEYWORD_OF.items() if word in NEGATIVE_WORDS)
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Symbols covered by get_news_summary, all fetched concurrently
+SUMMARY_MAX_SYMBOLS = 5
+
+
+def _sentiment_counts(text_lower: str) -> tuple[int, int]:
+    """
+    Count the distinct positive and negative keywords among the words of a text.
+
+    Inflected forms count as their keyword, so "surge" and "surged" together
+    are one signal.
+    """
+    words = set(_WORD_RE.findall(text_lower))
+    keyword_of = _KEYWORD_OF
+    positive = {keyword_of[form] for form in words & _POSITIVE_FORMS}
+    negative = {keyword_of[form] for form in words & _NEGATIVE_FORMS}
+    return len(positive), len(negative)
+
+
+def _score_sentiment(text: str) -> dict[str, Any]:
+    """Score a text by counting the sentiment keywords among its words."""
+    positive_count, negative_count = _sentiment_counts(text.lower())
+
+    if positive_count > negative_count:
+        sentiment = "positive"
+        score = min(positive_count / (positive_count + negative_count + 1), 1.0)
+    elif negative_count > positive_count:
+        sentiment = "negative"
+        score = -min(negative_count / (positive_count + negative_count + 1), 1.0)
+    else:
+        sentiment = "neutral"
+        score = 0.0
+
+    return {
+        "sentiment": sentiment,
+        "score": score,
+        "positive_signals": positive_count,
+        "negative_signals": negative_count,
+    }
+
+
+@dataclass(slots=True)
 class NewsArticle:
     """News article data structure."""
 
@@ -22,6 +122,30 @@ class NewsArticle:
     symbols: list[str]
     sentiment: str | None = None  # positive, negative, neutral
     relevance_score: float | None = None
+    published_ts: float = 0.0  # POSIX publish time for sorting, 0.0 when unknown
+
+
+def _parse_article(item: dict[str, Any], symbol: str) -> NewsArticle:
+    """Build a NewsArticle from one item of a yfinance ``Ticker.news`` list."""
+    published = None
+    published_ts = 0.0
+    timestamp = item.get("providerPublishTime")
+    if isinstance(timestamp, (int, float)):
+        try:
+            published = datetime.fromtimestamp(timestamp)
+            published_ts = float(timestamp)
+        except (ValueError, OverflowError, OSError):  # Out of range for the platform
+            pass
+
+    return NewsArticle(
+        title=item.get("title", ""),
+        source=item.get("publisher", "Unknown"),
+        url=item.get("link", ""),
+        published_at=published,
+        summary=None,  # Yahoo doesn't provide summaries
+        symbols=[symbol],
+        published_ts=published_ts,
+    )
 
 
 class NewsClient:
@@ -29,12 +153,11 @@ class NewsClient:
 
     def __init__(self):
         self._rate_limiter = get_rate_limiter()
-        self._client = httpx.Client(timeout=30.0)
+        self._pool = ThreadPoolExecutor(max_workers=SUMMARY_MAX_SYMBOLS)
         # Register dataclasses for cache deserialization
         cache = get_cache()
         cache.register_dataclass(NewsArticle)
 
-    @cached("news")
     def get_news_for_symbol(
         self,
         symbol: str,
@@ -46,46 +169,53 @@ class NewsClient:
         Note: This is a simplified implementation. In production,
         you might want to use a dedicated news API like Finnhub or Alpha Vantage News.
         """
-        import yfinance as yf
+        if limit <= 0:
+            return []
+        return self._fetch_news(symbol)[:limit]
+
+    def get_news_for_symbols(
+        self,
+        symbols: list[str],
+        limit: int = 10,
+    ) -> dict[str, list[NewsArticle]]:
+        """
+        Fetch news articles for several symbols at once.
+
+        yfinance has no batched news endpoint (``yf.Tickers.news`` loops over
+        the symbols), so the per-symbol fetches run concurrently instead, each
+        going through the rate limiter and the per-symbol cache.
+
+        Returns:
+            Articles keyed by symbol, in the order the symbols were given
+        """
+        if limit <= 0:
+            return {symbol: [] for symbol in symbols}
+        unique = list(dict.fromkeys(symbols))
+        fetched = self._pool.map(self._fetch_news, unique)
+        return {symbol: articles[:limit] for symbol, articles in zip(unique, fetched)}
 
-        self._rate_limiter.acquire_sync(DataSource.YAHOO_FINANCE)
+    @cached("news")
+    def _fetch_news(self, symbol: str) -> list[NewsArticle]:
+        """
+        Fetch every article Yahoo lists for a symbol.
 
+        Cached per symbol rather than per limit, so callers asking for
+        different numbers of articles share one request.
+        """
         try:
+            # A fresh Ticker on purpose: yfinance keeps .news on the instance
+            # forever, so a reused one would keep serving the first response
             ticker = yf.Ticker(symbol)
-            news = ticker.news or []
+            news = self._rate_limiter.call(DataSource.YAHOO_FINANCE, getattr, ticker, "news") or []
         except Exception:
             return []
 
-        articles = []
-        for item in news[:limit]:
-            published = None
-            if "providerPublishTime" in item:
-                try:
-                    published = datetime.fromtimestamp(item["providerPublishTime"])
-                except (ValueError, TypeError):
-                    pass
-
-            articles.append(
-                NewsArticle(
-                    title=item.get("title", ""),
-                    source=item.get("publisher", "Unknown"),
-                    url=item.get("link", ""),
-                    published_at=published,
-                    summary=None,  # Yahoo doesn't provide summaries
-                    symbols=[symbol],
-                    sentiment=None,
-                    relevance_score=None,
-                )
-            )
-
-        return articles
+        return [_parse_article(item, symbol) for item in news]
 
-    @cached("news")
     def get_market_news(self, limit: int = 10) -> list[NewsArticle]:
         """Fetch general market news using SPY as a proxy."""
         return self.get_news_for_symbol("SPY", limit=limit)
 
-    @cached("news")
     def get_crypto_news(self, limit: int = 10) -> list[NewsArticle]:
         """Fetch cryptocurrency news using BTC-USD as a proxy."""
         return self.get_news_for_symbol("BTC-USD", limit=limit)
@@ -98,63 +228,40 @@ class NewsClient:
         Note: This is a basic implementation. The agent can use Claude
         for more sophisticated sentiment analysis.
         """
-        text_lower = text.lower()
-
-        positive_words = [
-            "surge", "soar", "rally", "gain", "rise", "jump", "bull",
-            "growth", "profit", "beat", "exceed", "strong", "upgrade",
-            "buy", "outperform", "positive", "optimistic", "boom",
-        ]
-        negative_words = [
-            "crash", "plunge", "fall", "drop", "decline", "loss",
-            "bear", "miss", "weak", "downgrade", "sell", "underperform",
-            "negative", "pessimistic", "recession", "fear", "crisis",
-        ]
-
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-
-        if positive_count > negative_count:
-            sentiment = "positive"
-            score = min(positive_count / (positive_count + negative_count + 1), 1.0)
-        elif negative_count > positive_count:
-            sentiment = "negative"
-            score = -min(negative_count / (positive_count + negative_count + 1), 1.0)
-        else:
-            sentiment = "neutral"
-            score = 0.0
+        return _score_sentiment(text)
 
-        return {
-            "sentiment": sentiment,
-            "score": score,
-            "positive_signals": positive_count,
-            "negative_signals": negative_count,
-        }
+    def analyze_sentiment_batch(self, texts: list[str]) -> list[dict[str, Any]]:
+        """
+        Keyword-based sentiment for many texts in one call.
+
+        Returns:
+            One analyze_sentiment_simple result per text, in order
+        """
+        return [_score_sentiment(text) for text in texts]
 
     def get_news_summary(self, symbols: list[str]) -> dict[str, Any]:
         """Get a summary of news for multiple symbols."""
         all_articles = []
-        sentiment_summary = {"positive": 0, "negative": 0, "neutral": 0}
-
-        for symbol in symbols[:5]:  # Limit to avoid rate limits
-            articles = self.get_news_for_symbol(symbol, limit=5)
+        # Seeded so every label is reported and ties resolve in this order
+        sentiment_summary = Counter(positive=0, negative=0, neutral=0)
 
-            for article in articles:
-                sentiment = self.analyze_sentiment_simple(article.title)
-                article.sentiment = sentiment["sentiment"]
-                sentiment_summary[sentiment["sentiment"]] += 1
+        # Limit to avoid rate limits; the rate limiter still paces the requests
+        fetched = self.get_news_for_symbols(symbols[:SUMMARY_MAX_SYMBOLS], limit=5)
 
+        for articles in fetched.values():
             all_articles.extend(articles)
 
-        # Sort by date, most recent first
-        all_articles.sort(
-            key=lambda x: x.published_at or datetime.min,
-            reverse=True,
-        )
+        scores = self.analyze_sentiment_batch([article.title for article in all_articles])
+        for article, sentiment in zip(all_articles, scores):
+            article.sentiment = sentiment["sentiment"]
+            sentiment_summary[sentiment["sentiment"]] += 1
+
+        # Sort by date, most recent first; undated articles carry 0.0 and sort last
+        all_articles.sort(key=attrgetter("published_ts"), reverse=True)
 
         total = sum(sentiment_summary.values())
         if total > 0:
-            overall_sentiment = max(sentiment_summary, key=sentiment_summary.get)
+            overall_sentiment = sentiment_summary.most_common(1)[0][0]
             sentiment_score = (sentiment_summary["positive"] - sentiment_summary["negative"]) / total
         else:
             overall_sentiment = "neutral"
@@ -163,14 +270,14 @@ class NewsClient:
         return {
             "articles": all_articles[:20],
             "total_articles": len(all_articles),
-            "sentiment_distribution": sentiment_summary,
+            "sentiment_distribution": dict(sentiment_summary),
             "overall_sentiment": overall_sentiment,
             "sentiment_score": sentiment_score,
         }
 
     def close(self):
-        """Close the HTTP client."""
-        self._client.close()
+        """Shut down the fetch pool."""
+        self._pool.shutdown(wait=False)
 
     def __enter__(self):
         return self
@@ -1,10 +1,15 @@
 """Rate limiter for API calls to respect free tier limits."""
 
 import asyncio
+import threading
 import time
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any, TypeVar
+
+T = TypeVar("T")
 
 
 class DataSource(str, Enum):
@@ -16,17 +21,17 @@ class DataSource(str, Enum):
     COINGECKO = "coingecko"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig:
     """Rate limit configuration for a data source."""
 
     requests_per_second: float
     burst_limit: int = 1
+    # Minimum interval between requests in seconds, derived once at construction
+    min_interval: float = field(init=False, repr=False)
 
-    @property
-    def min_interval(self) -> float:
-        """Minimum interval between requests in seconds."""
-        return 1.0 / self.requests_per_second
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "min_interval", 1.0 / self.requests_per_second)
 
 
 # Free tier rate limits
@@ -38,45 +43,210 @@ RATE_LIMITS: dict[DataSource, RateLimitConfig] = {
 }
 
 
+# AIMD concurrency control per source: fast successes add AIMD_INCREASE to the
+# allowed concurrency (up to burst_limit), throttling responses multiply it by
+# AIMD_DECREASE (down to one call at a time)
+AIMD_INCREASE = 0.5
+AIMD_DECREASE = 0.5
+AIMD_LATENCY_TARGET = 2.0  # seconds
+
+# Responses that mean "slow down", the wait used when no Retry-After is given,
+# and how many times a throttled call is retried before giving up
+THROTTLE_STATUSES = frozenset({429, 503})
+THROTTLE_BACKOFF = 2.0  # seconds
+THROTTLE_RETRIES = 2
+# Longest Retry-After worth waiting out while holding a concurrency slot;
+# longer requests are raised to the caller straight away
+THROTTLE_MAX_DELAY = 30.0  # seconds
+
+
+def _throttle_delay(error: Exception) -> float | None:
+    """
+    Seconds to wait before retrying if an error is a provider throttling response.
+
+    Recognises HTTP errors carrying a 429/503 response (requests, httpx),
+    yfinance's YFRateLimitError and pycoingecko's ValueError wrapping the error
+    body.
+
+    Returns:
+        Delay in seconds, or None if the error is not a throttling response
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        name = type(error).__name__
+        if name == "YFRateLimitError":
+            status = 429
+        elif error.args and isinstance(error.args[0], dict):
+            body_status = error.args[0].get("status")
+            if isinstance(body_status, dict):
+                status = body_status.get("error_code")
+
+    if status not in THROTTLE_STATUSES:
+        return None
+
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return max(float(retry_after), 0.0)
+    except (TypeError, ValueError):
+        return THROTTLE_BACKOFF
+
+
 @dataclass
 class RateLimiter:
-    """Thread-safe rate limiter for multiple data sources."""
+    """
+    Thread-safe token-bucket rate limiter for multiple data sources.
+
+    Each source allows an initial burst of ``burst_limit`` requests, then
+    ``requests_per_second`` on average.
+    """
 
-    _last_request: dict[DataSource, float] = field(default_factory=lambda: defaultdict(float))
-    _locks: dict[DataSource, asyncio.Lock] = field(
-        default_factory=lambda: defaultdict(asyncio.Lock)
-    )
+    _next_allowed: dict[DataSource, float] = field(default_factory=dict)
+    _sync_lock: threading.Lock = field(default_factory=threading.Lock)
+    _concurrency: dict[DataSource, float] = field(default_factory=dict)
+    _in_flight: dict[DataSource, int] = field(default_factory=lambda: defaultdict(int))
+    _slots: threading.Condition = field(default_factory=threading.Condition)
 
     async def acquire(self, source: DataSource) -> None:
-        """Wait until a request can be made to the given source."""
+        """
+        Wait until a request can be made to the given source.
+
+        The token is reserved under the same thread lock as acquire_sync, which
+        never awaits, so no asyncio lock is needed and the limiter works from
+        any event loop (and alongside threads).
+        """
         config = RATE_LIMITS.get(source)
         if not config:
             return
 
-        async with self._locks[source]:
-            now = time.monotonic()
-            elapsed = now - self._last_request[source]
-            wait_time = config.min_interval - elapsed
+        with self._sync_lock:
+            wait_time = self._reserve(source, config)
 
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-
-            self._last_request[source] = time.monotonic()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
     def acquire_sync(self, source: DataSource) -> None:
-        """Synchronous version of acquire for non-async contexts."""
+        """
+        Synchronous version of acquire for non-async contexts.
+
+        Safe to call from several threads: each caller takes its token under a
+        lock, then sleeps off any shortfall outside the lock.
+        """
         config = RATE_LIMITS.get(source)
-        if not config:
-            return
+        if config:
+            self._acquire_sync(source, config)
 
-        now = time.monotonic()
-        elapsed = now - self._last_request[source]
-        wait_time = config.min_interval - elapsed
+    def _acquire_sync(self, source: DataSource, config: RateLimitConfig) -> None:
+        """acquire_sync for a source whose config has already been looked up."""
+        with self._sync_lock:
+            wait_time = self._reserve(source, config)
 
         if wait_time > 0:
             time.sleep(wait_time)
 
-        self._last_request[source] = time.monotonic()
+    def _reserve(self, source: DataSource, config: RateLimitConfig) -> float:
+        """
+        Reserve the next request slot for a source; call with ``_sync_lock`` held.
+
+        The token bucket is kept as a single "next allowed" time per source
+        (GCRA): each request moves it ``min_interval`` later, it is never
+        earlier than now, and a request may go ahead as long as it is no more
+        than ``burst_limit - 1`` intervals early. Concurrent callers queue up
+        behind each other's reservations.
+
+        Returns:
+            Seconds the caller must wait before making its request
+        """
+        now = time.monotonic()
+        interval = config.min_interval
+        slot = max(now, self._next_allowed.get(source, now))
+        self._next_allowed[source] = slot + interval
+        return max(0.0, slot - (config.burst_limit - 1) * interval - now)
+
+    def concurrency(self, source: DataSource) -> float:
+        """Current AIMD concurrency limit for a source."""
+        config = RATE_LIMITS.get(source)
+        if not config:
+            return float("inf")
+        return self._limit(source, config)
+
+    def _limit(self, source: DataSource, config: RateLimitConfig) -> float:
+        """AIMD concurrency limit for a source whose config has already been looked up."""
+        return self._concurrency.get(source, float(config.burst_limit))
+
+    def call(self, source: DataSource, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Make a rate-limited call to an external API.
+
+        At most ``concurrency(source)`` calls run at once, each spaced by
+        ``acquire_sync``. When the provider throttles, the limit is halved and
+        the call is retried after Retry-After; quick successes raise the limit
+        again by AIMD_INCREASE.
+
+        Args:
+            source: Data source the call goes to
+            fn: Function making the request
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Whatever ``fn`` returns
+
+        Raises:
+            Exception: Whatever ``fn`` raises once retries are exhausted
+        """
+        config = RATE_LIMITS.get(source)
+        if not config:
+            return fn(*args, **kwargs)
+
+        attempt = 0
+        while True:
+            self._enter(source, config)
+            try:
+                self._acquire_sync(source, config)
+                start = time.monotonic()
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    delay = _throttle_delay(e)
+                    if delay is None:
+                        raise
+                    self._adjust(source, config, throttled=True)
+                    if attempt >= THROTTLE_RETRIES or delay > THROTTLE_MAX_DELAY:
+                        raise
+                    # Hold the slot while backing off so the source stays quiet
+                    time.sleep(delay)
+                else:
+                    if time.monotonic() - start < AIMD_LATENCY_TARGET:
+                        self._adjust(source, config, throttled=False)
+                    return result
+            finally:
+                self._leave(source)
+            attempt += 1
+
+    def _enter(self, source: DataSource, config: RateLimitConfig) -> None:
+        """Block until a concurrency slot for the source is free, then take it."""
+        with self._slots:
+            while self._in_flight[source] >= max(1, int(self._limit(source, config))):
+                self._slots.wait()
+            self._in_flight[source] += 1
+
+    def _leave(self, source: DataSource) -> None:
+        """Release a concurrency slot."""
+        with self._slots:
+            self._in_flight[source] -= 1
+            self._slots.notify_all()
+
+    def _adjust(self, source: DataSource, config: RateLimitConfig, throttled: bool) -> None:
+        """Apply one AIMD step to the source's concurrency limit."""
+        cap = float(config.burst_limit)
+        with self._slots:
+            current = self._limit(source, config)
+            if throttled:
+                self._concurrency[source] = max(1.0, current * AIMD_DECREASE)
+            else:
+                self._concurrency[source] = min(cap, current + AIMD_INCREASE)
+                self._slots.notify_all()
 
 
 # Global rate limiter instance
@@ -0,0 +1,431 @@
+"""Tests for the file-backed cache."""
+
+import gc
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from argent.tools import cache as cache_module
+from argent.tools.cache import (
+    Cache,
+    SingleFlight,
+    _generate_cache_key,
+    cached,
+    invalidate_cache,
+)
+
+
+@dataclass
+class Quote:
+    symbol: str
+    price: float
+    asof: datetime
+
+
+@dataclass(slots=True)
+class SlottedQuote:
+    symbol: str
+    price: float
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache rooted in a temporary directory."""
+    cache = Cache(cache_dir=tmp_path)
+    cache.register_dataclass(Quote)
+    return cache
+
+
+class TestCacheKey:
+    """Tests for cache key generation."""
+
+    def test_key_is_stable(self):
+        """Test that equal arguments produce equal keys."""
+        assert _generate_cache_key("p", "AAPL", period="1y") == _generate_cache_key(
+            "p", "AAPL", period="1y"
+        )
+
+    def test_key_distinguishes_arguments(self):
+        """Test that different arguments produce different keys."""
+        assert _generate_cache_key("p", "AAPL") != _generate_cache_key("p", "MSFT")
+        assert _generate_cache_key("p", "AAPL") != _generate_cache_key("q", "AAPL")
+
+    def test_key_ignores_keyword_order(self):
+        """Test that keyword and dict key order do not change the key."""
+        assert _generate_cache_key("p", {"a": 1, "b": 2}, x=1, y=2) == _generate_cache_key(
+            "p", {"b": 2, "a": 1}, y=2, x=1
+        )
+
+    def test_key_handles_non_json_arguments(self):
+        """Test that values JSON can't encode still produce a key."""
+        when = datetime(2024, 1, 15)
+        assert _generate_cache_key("p", when) != _generate_cache_key("p", datetime(2024, 1, 16))
+
+    def test_key_length(self):
+        """Test that keys are 64-bit hex digests."""
+        assert len(_generate_cache_key("p", "AAPL")) == 16
+
+
+class TestCache:
+    """Tests for cache reads and writes."""
+
+    def test_round_trip(self, cache):
+        """Test that stored values are read back unchanged."""
+        quote = Quote("AAPL", 187.5, datetime(2024, 1, 15, 9, 30))
+        cache.set("k", {"quotes": [quote]})
+
+        assert cache.get("k") == {"quotes": [quote]}
+
+    def test_round_trip_from_disk(self, cache, tmp_path):
+        """Test that a fresh instance reads values written by another."""
+        quote = Quote("AAPL", 187.5, datetime(2024, 1, 15, 9, 30))
+        cache.set("k", [quote])
+
+        other = Cache(cache_dir=tmp_path)
+        other.register_dataclass(Quote)
+
+        assert other.get("k") == [quote]
+
+    def test_slotted_dataclass_round_trip_from_disk(self, cache, tmp_path):
+        """Test that slotted dataclasses load back from disk."""
+        cache.set("k", [SlottedQuote("AAPL", 187.5)])
+
+        other = Cache(cache_dir=tmp_path)
+        other.register_dataclass(SlottedQuote)
+
+        assert other.get("k") == [SlottedQuote("AAPL", 187.5)]
+
+    def test_timezone_aware_round_trip_from_disk(self, cache, tmp_path):
+        """Test that timezone-aware datetimes load back from disk."""
+        when = datetime(2024, 1, 15, 9, 30, tzinfo=ZoneInfo("America/New_York"))
+        cache.set("k", [when])
+
+        assert Cache(cache_dir=tmp_path).get("k") == [when]
+
+    def test_unregistered_class_not_loaded(self, cache, tmp_path):
+        """Test that files referencing unregistered classes are treated as misses."""
+        cache.set("k", Quote("AAPL", 187.5, datetime(2024, 1, 15, 9, 30)))
+
+        assert Cache(cache_dir=tmp_path).get("k") is None
+        assert not cache._get_cache_path("k").exists()
+
+    def test_numpy_values_round_trip_from_disk(self, cache, tmp_path):
+        """Test that numpy arrays and scalars load back from disk."""
+        cache.set("k", {"prices": np.arange(3.0), "last": np.float64(2.5)})
+
+        loaded = Cache(cache_dir=tmp_path).get("k")
+
+        np.testing.assert_array_equal(loaded["prices"], np.arange(3.0))
+        assert loaded["last"] == 2.5
+
+    def test_non_allowlisted_numpy_global_not_loaded(self, cache, tmp_path):
+        """Test that other callables from allowed packages are refused."""
+        cache.set("k", [np.testing.assert_equal])
+
+        assert Cache(cache_dir=tmp_path).get("k") is None
+        assert not cache._get_cache_path("k").exists()
+
+    def test_missing_entry(self, cache):
+        """Test that missing entries read as None."""
+        assert cache.get("missing") is None
+
+    def test_expired_entry(self, cache, monkeypatch):
+        """Test that entries older than the TTL are dropped."""
+        cache.set("k", {"a": 1})
+        real_time = time.time
+        monkeypatch.setattr("argent.tools.cache.time.time", lambda: real_time() + 120)
+
+        assert cache.get("k", ttl=60) is None
+        assert cache.get("k") is None
+
+    def test_expiry_read_from_mtime(self, cache, tmp_path):
+        """Test that an on-disk entry expires by its file modification time."""
+        cache.set("k", {"a": 1})
+        stale = time.time() - 120
+        os.utime(cache._get_cache_path("k"), (stale, stale))
+
+        assert Cache(cache_dir=tmp_path).get("k", ttl=60) is None
+        assert not cache._get_cache_path("k").exists()
+
+    def test_delete_and_clear(self, cache):
+        """Test that delete and clear remove entries from every tier."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert cache.get("b") is None
+
+
+class TestLayout:
+    """Tests for the on-disk layout."""
+
+    def test_entries_are_sharded(self, cache, tmp_path):
+        """Test that entries live in a subdirectory named after the key prefix."""
+        key = _generate_cache_key("p", "AAPL")
+        cache.set(key, {"a": 1})
+
+        assert (tmp_path / key[:2] / f"{key[2:]}.pkl").exists()
+        assert [k for k, _ in cache._iter_entries()] == [key]
+
+    def test_write_leaves_no_temp_files(self, cache, tmp_path):
+        """Test that writes publish the entry and leave no temporary files behind."""
+        cache.set("ab1234", {"a": 1})
+        cache.set("ab1234", {"a": 2})
+
+        assert [p.name for p in (tmp_path / "ab").iterdir()] == ["1234.pkl"]
+
+    def test_unpicklable_value_not_written(self, cache, tmp_path):
+        """Test that a failed write leaves neither an entry nor a temporary file."""
+        cache.set("ab1234", lambda: None)
+
+        assert list(tmp_path.glob("ab/*")) == []
+        assert cache.get("ab1234") is None
+
+    def test_clear_removes_sharded_entries(self, cache, tmp_path):
+        """Test that clear reaches entries in every shard."""
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            cache.set(_generate_cache_key("p", symbol), symbol)
+
+        cache.clear()
+
+        assert list(tmp_path.glob("*/*.pkl")) == []
+
+
+    def test_cleanup_expired_uses_mtime(self, cache, tmp_path):
+        """Test that cleanup removes entries whose files are older than the TTL."""
+        cache.set("old", 1)
+        cache.set("new", 2)
+        stale = time.time() - 7200
+        os.utime(cache._get_cache_path("old"), (stale, stale))
+
+        assert cache.cleanup_expired({"news": 3600}) == 1
+        assert cache.get("old") is None
+        assert cache.get("new") == 2
+
+class TestMemoryTier:
+    """Tests for the in-process cache tier."""
+
+    def test_hit_skips_disk(self, cache):
+        """Test that a repeated read is served without touching disk."""
+        cache.set("k", {"a": 1})
+        cache._get_cache_path("k").unlink()
+
+        assert cache.get("k") == {"a": 1}
+
+    def test_disk_read_populates_memory(self, cache, tmp_path):
+        """Test that a value loaded from disk is kept in memory."""
+        cache.set("k", {"a": 1})
+        other = Cache(cache_dir=tmp_path)
+
+        assert other.get("k") == {"a": 1}
+        assert "k" in other._mem
+
+    def test_memory_hits_are_copies(self, cache):
+        """Test that mutating a returned value doesn't change what later reads see."""
+        value = {"prices": [1.0, 2.0]}
+        cache.set("k", value)
+        value["prices"].append(3.0)
+        cache.get("k")["prices"].append(4.0)
+
+        assert cache.get("k") == {"prices": [1.0, 2.0]}
+
+    def test_eviction(self, cache):
+        """Test that the least recently used entry is evicted first."""
+        cache._mem_max = 2
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert list(cache._mem) == ["a", "c"]
+
+
+class TestCachedDecorator:
+    """Tests for the @cached decorator."""
+
+    @pytest.fixture(autouse=True)
+    def global_cache(self, cache, monkeypatch):
+        """Point the global cache at the temporary directory."""
+        monkeypatch.setattr(cache_module, "_cache_instance", cache)
+
+    def test_method_results_cached(self):
+        """Test that a method is called once per distinct argument set."""
+        calls = []
+
+        class Client:
+            @cached("news")
+            def fetch(self, symbol: str) -> dict:
+                calls.append(symbol)
+                return {"symbol": symbol}
+
+        assert Client().fetch("AAPL") == {"symbol": "AAPL"}
+        assert Client().fetch("AAPL") == {"symbol": "AAPL"}
+        assert Client().fetch("MSFT") == {"symbol": "MSFT"}
+        assert calls == ["AAPL", "MSFT"]
+
+    def test_function_first_argument_in_key(self):
+        """Test that plain functions keep their first argument in the key."""
+        calls = []
+
+        @cached("news")
+        def fetch(symbol: str) -> dict:
+            calls.append(symbol)
+            return {"symbol": symbol}
+
+        fetch("AAPL")
+        fetch("MSFT")
+
+        assert calls == ["AAPL", "MSFT"]
+
+    def test_unhashable_arguments(self):
+        """Test that unhashable arguments fall back to direct key generation."""
+        calls = []
+
+        @cached("news")
+        def fetch(symbols: list[str]) -> dict:
+            calls.append(symbols)
+            return {"symbols": symbols}
+
+        fetch(["AAPL", "MSFT"])
+        fetch(["AAPL", "MSFT"])
+
+        assert calls == [["AAPL", "MSFT"]]
+
+    def test_empty_results_not_cached(self):
+        """Test that empty results are recomputed."""
+        calls = []
+
+        @cached("news")
+        def fetch(symbol: str) -> list:
+            calls.append(symbol)
+            return []
+
+        fetch("AAPL")
+        fetch("AAPL")
+
+        assert calls == ["AAPL", "AAPL"]
+
+    def test_concurrent_misses_coalesced(self):
+        """Test that concurrent calls for one key run the function once."""
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @cached("news")
+        def fetch(symbol: str) -> dict:
+            calls.append(symbol)
+            started.set()
+            release.wait(timeout=5)
+            return {"symbol": symbol}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(fetch, "AAPL")
+            started.wait(timeout=5)
+            others = [executor.submit(fetch, "AAPL") for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            results = [first.result()] + [f.result() for f in others]
+
+        assert calls == ["AAPL"]
+        assert results == [{"symbol": "AAPL"}] * 4
+
+
+class TestSingleFlight:
+    """Tests for in-flight call coalescing."""
+
+    def test_sequential_calls_both_run(self):
+        """Test that calls that don't overlap each run."""
+        flight = SingleFlight()
+
+        assert flight.do("k", lambda: 1) == 1
+        assert flight.do("k", lambda: 2) == 2
+
+    def test_exception_propagates_and_clears(self):
+        """Test that a failed call raises and does not block later calls."""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("k", fail)
+        assert flight.do("k", lambda: 3) == 3
+
+
+class TestInvalidation:
+    """Tests for prefix-based invalidation."""
+
+    @pytest.fixture(autouse=True)
+    def global_cache(self, cache, monkeypatch):
+        """Point the global cache at the temporary directory."""
+        monkeypatch.setattr(cache_module, "_cache_instance", cache)
+
+    def test_invalidate_by_prefix(self, cache):
+        """Test that only entries stored under the matching prefix are removed."""
+        cache.set("aa01", 1, prefix="argent.tools.news.get_news")
+        cache.set("aa02", 2, prefix="argent.tools.news.get_news")
+        cache.set("bb01", 3, prefix="argent.tools.market_data.get_price_history")
+
+        assert invalidate_cache("argent.tools.news.get_news") == 2
+        assert cache.get("aa01") is None
+        assert cache.get("bb01") == 3
+
+    def test_invalidate_by_prefix_glob(self, cache):
+        """Test that patterns are matched against prefixes."""
+        cache.set("aa01", 1, prefix="argent.tools.news.get_news")
+        cache.set("bb01", 2, prefix="argent.tools.market_data.get_price_history")
+
+        assert invalidate_cache("news") == 1
+        assert cache.get("bb01") == 2
+
+    def test_invalidate_falls_back_to_keys(self, cache):
+        """Test that unindexed entries are still matched by key."""
+        cache.set("cc01", 1)
+
+        assert invalidate_cache("cc0") == 1
+        assert cache.get("cc01") is None
+
+    def test_prefix_index_persisted(self, cache, tmp_path):
+        """Test that the prefix index survives into a new instance."""
+        cache.set("aa01", 1, prefix="argent.tools.news.get_news")
+
+        other = Cache(cache_dir=tmp_path)
+
+        assert other.keys_for_prefix("argent.tools.news.get_news") == ["aa01"]
+
+    def test_keys_stored_by_other_instances_invalidated(self, cache, tmp_path):
+        """Test that invalidation sees keys another process stored after startup."""
+        other = Cache(cache_dir=tmp_path)
+        cache.set("aa01", 1, prefix="argent.tools.news.get_news")
+        other.set("aa02", 2, prefix="argent.tools.news.get_news")
+
+        assert invalidate_cache("argent.tools.news.get_news") == 2
+        assert Cache(cache_dir=tmp_path).get("aa02") is None
+
+    def test_cleanup_compacts_prefix_log(self, cache, tmp_path, monkeypatch):
+        """Test that expired keys are dropped from the prefix log."""
+        cache.set("aa01", 1, prefix="argent.tools.news.get_news")
+        cache.set("aa02", 2, prefix="argent.tools.news.get_news")
+        os.utime(cache._get_cache_path("aa01"), (0, 0))
+
+        assert cache.cleanup_expired({"news": 60}) == 1
+        assert Cache(cache_dir=tmp_path).keys_for_prefix("news") == ["aa02"]
+
+    def test_index_does_not_keep_instances_alive(self, tmp_path):
+        """Test that a discarded cache can be garbage collected."""
+        ref = weakref.ref(Cache(cache_dir=tmp_path))
+        gc.collect()
+
+        assert ref() is None
@@ -3,7 +3,10 @@
 import pytest
 import numpy as np
 
+from argent.tools import _kernels
 from argent.tools.calculations import (
+    PricesCache,
+    calculate_atr,
     calculate_sma,
     calculate_ema,
     calculate_rsi,
@@ -157,6 +160,21 @@ class TestReturns:
         for lr, sr in zip(log_returns, simple_returns):
             assert abs(lr - sr) < 0.02  # Should be within 2% for these values
 
+    def test_prices_cache_reused(self):
+        """Test that metrics give the same result from a precomputed cache."""
+        np.random.seed(7)
+        prices = [100]
+        for _ in range(100):
+            prices.append(prices[-1] * (1 + np.random.randn() * 0.02))
+        cache = PricesCache.from_prices(prices)
+
+        assert cache.log_returns.tolist() == calculate_log_returns(prices)
+        assert calculate_volatility(cache) == calculate_volatility(prices)
+        assert calculate_var(cache) == calculate_var(prices)
+        assert calculate_sharpe_ratio(cache) == calculate_sharpe_ratio(prices)
+        assert calculate_sortino_ratio(cache) == calculate_sortino_ratio(prices)
+        assert PricesCache.from_prices(cache) is cache
+
 
 class TestVolatility:
     """Tests for volatility calculation."""
@@ -310,6 +328,51 @@ class TestSupportResistance:
         assert len(support_levels) >= 0
         assert len(resistance_levels) >= 0
 
+    def test_nearby_levels_cluster(self):
+        """Test that touches within the threshold merge into one averaged level."""
+        prices = []
+        for low in (95.0, 95.5, 95.2):
+            prices.extend([100, 102, 104, 105, 104, 102, 100, 98, 96, low, 96, 98])
+        prices.extend([100, 102, 104])
+
+        levels = identify_support_resistance(prices, window=5)
+        support = [level for level in levels if level.type == "support"]
+
+        assert len(support) == 1
+        assert support[0].strength == 3
+        assert support[0].level == pytest.approx((95.0 + 95.5 + 95.2) / 3)
+
+
+
+class TestKernels:
+    """Tests that the loop kernels agree with the NumPy implementations."""
+
+    @pytest.fixture(autouse=True)
+    def numpy_path(self, monkeypatch):
+        """Force the public functions onto their NumPy path for comparison."""
+        monkeypatch.setattr(_kernels, "HAVE_NUMBA", False)
+
+    def test_rsi_kernel(self):
+        """Test RSI kernel output, including flat windows that are skipped."""
+        np.random.seed(3)
+        prices = list(100 + np.cumsum(np.random.randn(200))) + [100.0] * 20
+
+        expected = calculate_rsi(prices)
+        result = _kernels.rsi_kernel(np.asarray(prices), 14)
+
+        assert result.tolist() == pytest.approx(expected)
+
+    def test_atr_kernel(self):
+        """Test ATR kernel output."""
+        np.random.seed(4)
+        close = 100 + np.cumsum(np.random.randn(200))
+        high = close + np.abs(np.random.randn(200))
+        low = close - np.abs(np.random.randn(200))
+
+        expected = calculate_atr(high.tolist(), low.tolist(), close.tolist())
+        result = _kernels.atr_kernel(high, low, close, 14)
+
+        assert result.tolist() == pytest.approx(expected)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,64 @@
+"""Tests for the CoinGecko crypto data client."""
+
+import threading
+
+import pytest
+
+from argent.tools import cache as cache_module
+from argent.tools.cache import TTL_CONFIG, Cache, _generate_cache_key
+from argent.tools.crypto_data import _UNKNOWN_SYMBOL_PREFIX, CryptoDataClient
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Crypto client on a temporary cache, calling endpoints without rate limiting."""
+    monkeypatch.setattr(cache_module, "_cache_instance", Cache(cache_dir=tmp_path))
+    client = CryptoDataClient()
+    monkeypatch.setattr(
+        client._rate_limiter, "call", lambda source, fn, *args, **kwargs: fn(*args, **kwargs)
+    )
+    return client
+
+
+class TestCoinList:
+    """Tests for loading the full coin list."""
+
+    def test_lookup_waits_for_warm_up(self, client, monkeypatch):
+        """Test that a lookup during warm-up shares its download."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def get_json(path, **params):
+            calls.append(path)
+            started.set()
+            release.wait(timeout=5)
+            return [{"id": "pepe", "symbol": "pepe"}]
+
+        monkeypatch.setattr(client, "_get_json", get_json)
+        future = client.warm()
+        assert started.wait(timeout=5)
+
+        lookup = threading.Thread(target=client._get_coin_id, args=("PEPE",))
+        lookup.start()
+        # Give the lookup time to reach the coin list while the download is held
+        lookup.join(timeout=0.2)
+        assert lookup.is_alive()
+        release.set()
+        lookup.join(timeout=5)
+
+        assert future.result(timeout=5) == {"PEPE": "pepe"}
+        assert client._get_coin_id("PEPE") == "pepe"
+        assert calls == ["coins/list"]
+
+    def test_unknown_symbols_reach_disk_cache(self, client, monkeypatch, tmp_path):
+        """Test that unlisted symbols, even ones unsafe as filenames, are cached on disk."""
+        monkeypatch.setattr(
+            client, "_get_json", lambda path, **params: [{"id": "bitcoin", "symbol": "btc"}]
+        )
+
+        assert client._get_coin_id("BTC/USD") is None
+
+        # A new cache instance only sees what reached the disk
+        key = _generate_cache_key(_UNKNOWN_SYMBOL_PREFIX, "BTC/USD")
+        assert Cache(cache_dir=tmp_path).get(key, TTL_CONFIG["unknown_symbol"]) is True
@@ -0,0 +1,46 @@
+"""Tests for the FRED economic data client."""
+
+import threading
+
+import pytest
+
+from argent.tools import cache as cache_module
+from argent.tools import economic_data
+from argent.tools.cache import Cache
+from argent.tools.economic_data import EconomicDataClient
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Economic data client on a temporary cache, without a FRED key (makes no requests)."""
+    monkeypatch.setattr(cache_module, "_cache_instance", Cache(cache_dir=tmp_path))
+    with EconomicDataClient() as client:
+        yield client
+
+
+class TestWarm:
+    """Tests for background prefetching."""
+
+    def test_warm_does_not_wait_on_a_pool_worker(self, client, monkeypatch):
+        """Test that warm-up completes while every pool worker is busy."""
+        monkeypatch.setattr(client, "get_series", lambda series_id, limit=100: [])
+        release = threading.Event()
+        blockers = [
+            client._pool.submit(release.wait, 5)
+            for _ in range(economic_data.FRED_MAX_WORKERS - 1)
+        ]
+
+        # The snapshot's own series jobs still get the one free worker
+        snapshot = client.warm().result(timeout=5)
+
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+        assert isinstance(snapshot, dict)
+
+    def test_close_shuts_down_pool(self, client):
+        """Test that close stops the fetch pool from taking new work."""
+        client.close()
+
+        with pytest.raises(RuntimeError):
+            client._pool.submit(lambda: None)
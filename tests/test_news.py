@@ -0,0 +1,214 @@
+"""Tests for news sentiment analysis."""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from argent.tools.news import NewsArticle, NewsClient
+
+
+@pytest.fixture
+def client():
+    """News client (sentiment analysis makes no requests)."""
+    return NewsClient()
+
+
+class TestSentiment:
+    """Tests for keyword-based sentiment analysis."""
+
+    def test_positive(self, client):
+        """Test that positive keywords give positive sentiment."""
+        result = client.analyze_sentiment_simple(
+            "Shares surge after earnings beat on strong profit"
+        )
+
+        assert result["sentiment"] == "positive"
+        assert result["positive_signals"] == 4
+        assert result["negative_signals"] == 0
+        assert result["score"] == pytest.approx(0.8)
+
+    def test_negative(self, client):
+        """Test that negative keywords give negative sentiment."""
+        result = client.analyze_sentiment_simple("Stocks plunge on recession fear")
+
+        assert result["sentiment"] == "negative"
+        assert result["negative_signals"] == 3
+        assert result["score"] == pytest.approx(-0.75)
+
+    def test_neutral(self, client):
+        """Test that balanced or keyword-free text is neutral."""
+        quiet = client.analyze_sentiment_simple("Company holds annual meeting")
+        mixed = client.analyze_sentiment_simple("Analyst upgrade, then a downgrade")
+
+        assert quiet["sentiment"] == "neutral"
+        assert mixed["sentiment"] == "neutral"
+        assert mixed["score"] == 0.0
+
+    def test_repeated_keyword_counted_once(self, client):
+        """Test that each keyword counts once however often it appears."""
+        result = client.analyze_sentiment_simple("Rally! Rally! Rally!")
+
+        assert result["positive_signals"] == 1
+
+    def test_case_insensitive(self, client):
+        """Test that matching ignores case."""
+        assert client.analyze_sentiment_simple("MARKETS CRASH")["sentiment"] == "negative"
+
+    def test_batch_matches_single(self, client):
+        """Test that batch scoring gives the per-text results in order."""
+        texts = ["Shares surge", "Stocks plunge on fear", "Company holds annual meeting"]
+
+        assert client.analyze_sentiment_batch(texts) == [
+            client.analyze_sentiment_simple(text) for text in texts
+        ]
+
+    @pytest.mark.parametrize(
+        "headline, sentiment, signals",
+        [
+            ("Apple shares surged after earnings beats estimates", "positive", 2),
+            ("Nvidia gains, rallies to record", "positive", 2),
+            ("Stocks plunged; losses mount", "negative", 2),
+        ],
+    )
+    def test_inflected_forms(self, client, headline, sentiment, signals):
+        """Test that inflected forms of the keywords are counted."""
+        result = client.analyze_sentiment_simple(headline)
+
+        assert result["sentiment"] == sentiment
+        assert result["positive_signals"] + result["negative_signals"] == signals
+
+    def test_forms_of_one_keyword_counted_once(self, client):
+        """Test that several forms of the same keyword are a single signal."""
+        result = client.analyze_sentiment_simple("Shares surge, then surged again")
+
+        assert result["positive_signals"] == 1
+
+    def test_whole_words_only(self, client):
+        """Test that keywords inside longer words are not counted."""
+        result = client.analyze_sentiment_simple("Surgery unit ships bearings")
+
+        assert result["positive_signals"] == 0
+        assert result["negative_signals"] == 0
+
+
+def _article(symbol: str, title: str, published_at: datetime | None = None) -> NewsArticle:
+    return NewsArticle(
+        title=title,
+        source="Test",
+        url="",
+        published_at=published_at,
+        summary=None,
+        symbols=[symbol],
+        published_ts=published_at.timestamp() if published_at else 0.0,
+    )
+
+
+class TestNewsForSymbols:
+    """Tests for fetching news for several symbols."""
+
+    def test_keyed_by_symbol_and_limited(self, client, monkeypatch):
+        """Test that results are keyed by symbol, de-duplicated and truncated."""
+        calls = []
+
+        def fetch(symbol):
+            calls.append(symbol)
+            return [_article(symbol, f"{symbol} {i}") for i in range(4)]
+
+        monkeypatch.setattr(client, "_fetch_news", fetch)
+        news = client.get_news_for_symbols(["SPY", "QQQ", "SPY"], limit=2)
+
+        assert list(news) == ["SPY", "QQQ"]
+        assert [a.title for a in news["QQQ"]] == ["QQQ 0", "QQQ 1"]
+        assert sorted(calls) == ["QQQ", "SPY"]
+
+
+class TestNewsSummary:
+    """Tests for multi-symbol news summaries."""
+
+    def test_symbols_fetched_concurrently(self, client, monkeypatch):
+        """Test that symbols are fetched concurrently rather than one after another."""
+        symbols = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOG"]
+        # Only passes once every fetch is in flight at the same time
+        barrier = threading.Barrier(len(symbols), timeout=5)
+
+        def fetch(symbol):
+            barrier.wait()
+            return [_article(symbol, f"{symbol} shares rally")]
+
+        monkeypatch.setattr(client, "_fetch_news", fetch)
+        summary = client.get_news_summary(symbols + ["META"])
+
+        assert summary["total_articles"] == 5
+        assert summary["sentiment_distribution"]["positive"] == 5
+        assert summary["overall_sentiment"] == "positive"
+
+    def test_articles_sorted_newest_first(self, client, monkeypatch):
+        """Test that articles are sorted newest first with undated ones last."""
+        articles = {
+            "AAPL": [_article("AAPL", "old", datetime(2024, 1, 1)), _article("AAPL", "undated")],
+            "MSFT": [_article("MSFT", "new", datetime(2024, 6, 1))],
+        }
+        monkeypatch.setattr(client, "_fetch_news", articles.__getitem__)
+
+        summary = client.get_news_summary(["AAPL", "MSFT"])
+
+        assert [a.title for a in summary["articles"]] == ["new", "old", "undated"]
+
+    def test_sentiment_distribution(self, client, monkeypatch):
+        """Test sentiment counts, with ties resolved towards positive."""
+        articles = {
+            "AAPL": [_article("AAPL", "Shares rally"), _article("AAPL", "Quiet day")],
+            "MSFT": [_article("MSFT", "Shares plunge")],
+        }
+        monkeypatch.setattr(client, "_fetch_news", articles.__getitem__)
+
+        summary = client.get_news_summary(["AAPL", "MSFT"])
+
+        assert summary["sentiment_distribution"] == {"positive": 1, "negative": 1, "neutral": 1}
+        assert summary["overall_sentiment"] == "positive"
+        assert summary["sentiment_score"] == 0.0
+
+
+class TestFetchNews:
+    """Tests for parsing Yahoo news items."""
+
+    def test_parses_items(self, client, monkeypatch):
+        """Test that Yahoo items become articles, tolerating missing fields."""
+        items = [
+            {
+                "title": "Apple rallies",
+                "publisher": "Wire",
+                "link": "u",
+                "providerPublishTime": 1e9,
+            },
+            {"title": "No date", "providerPublishTime": "soon"},
+        ]
+        monkeypatch.setattr(client._rate_limiter, "call", lambda source, fn, *args: items)
+
+        articles = client._fetch_news.__wrapped__(client, "AAPL")
+
+        assert [a.title for a in articles] == ["Apple rallies", "No date"]
+        assert articles[0].published_at == datetime.fromtimestamp(1e9)
+        assert articles[0].published_ts == 1e9
+        assert articles[1].published_at is None
+        assert articles[1].source == "Unknown"
+
+    def test_zero_limit_skips_fetch(self, client, monkeypatch):
+        """Test that asking for no articles makes no request."""
+        monkeypatch.setattr(client, "_fetch_news", lambda symbol: pytest.fail("fetched"))
+
+        assert client.get_news_for_symbol("AAPL", limit=0) == []
+        assert client.get_news_for_symbols(["AAPL", "MSFT"], limit=0) == {"AAPL": [], "MSFT": []}
+
+    def test_articles_round_trip_through_cache(self, tmp_path):
+        """Test that slotted articles survive the disk cache."""
+        from argent.tools.cache import Cache
+
+        article = _article("AAPL", "Apple rallies", datetime(2024, 1, 2))
+        Cache(cache_dir=tmp_path).set("articles", [article])
+
+        other = Cache(cache_dir=tmp_path)
+        other.register_dataclass(NewsArticle)
+
+        assert other.get("articles") == [article]
@@ -0,0 +1,33 @@
+"""Tests for prompt token budgets."""
+
+import json
+
+from argent.prompts import trim_json_to_budget
+from argent.prompts._budget import CHARS_PER_TOKEN
+
+
+class TestTrimJsonToBudget:
+    """Tests for data-level trimming of JSON context."""
+
+    def test_fitting_context_unchanged(self):
+        """Test that context within budget is encoded as is."""
+        context = {"symbols": ["AAPL", "MSFT"], "horizon": "short"}
+
+        assert json.loads(trim_json_to_budget(context, 1000)) == context
+
+    def test_trimmed_context_is_valid_json(self):
+        """Test that oversized context is trimmed to parseable JSON within budget."""
+        context = {
+            "symbols": ["AAPL"],
+            "closes": [100.0 + i for i in range(5000)],
+            "news": ["headline " * 200 for _ in range(50)],
+        }
+
+        text = trim_json_to_budget(context, 500)
+        trimmed = json.loads(text)
+
+        assert len(text) <= 500 * CHARS_PER_TOKEN
+        assert trimmed["symbols"] == ["AAPL"]
+        assert trimmed["closes"][0] == 100.0
+        assert trimmed["closes"][-1] == 5099.0
+        assert any("truncated" in str(item) for item in trimmed["closes"])
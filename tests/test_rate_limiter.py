@@ -1,16 +1,34 @@
 """Tests for rate limiter."""
 
+import asyncio
+import dataclasses
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
+
 import pytest
+import requests
 
+from argent.tools import rate_limiter
+from argent.tools.http_session import _create_session, get_json
 from argent.tools.rate_limiter import (
-    RateLimiter,
-    DataSource,
     RATE_LIMITS,
+    DataSource,
+    RateLimiter,
     get_rate_limiter,
 )
 
 
+class ThrottledError(Exception):
+    """HTTP error carrying a 429 response."""
+
+    def __init__(self, retry_after: str = "0"):
+        super().__init__("429 Too Many Requests")
+        self.response = SimpleNamespace(status_code=429, headers={"Retry-After": retry_after})
+
+
 class TestRateLimiter:
     """Tests for the rate limiter."""
 
@@ -27,20 +45,67 @@ class TestRateLimiter:
         # Alpha Vantage: 0.083 req/sec = ~12 sec interval
         assert abs(RATE_LIMITS[DataSource.ALPHA_VANTAGE].min_interval - 12.048) < 0.1
 
+    def test_config_is_immutable(self):
+        """Test that configs are frozen, so the precomputed interval stays in sync."""
+        config = RATE_LIMITS[DataSource.FRED]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.requests_per_second = 100.0
+
+    def test_sync_acquire_burst(self):
+        """Test that up to burst_limit requests go through without waiting."""
+        limiter = RateLimiter()
+        burst = RATE_LIMITS[DataSource.YAHOO_FINANCE].burst_limit
+
+        start = time.monotonic()
+        for _ in range(burst):
+            limiter.acquire_sync(DataSource.YAHOO_FINANCE)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.1
+
     def test_sync_acquire_timing(self):
-        """Test that sync acquire respects rate limits."""
+        """Test that sync acquire respects rate limits once the burst is spent."""
         limiter = RateLimiter()
+        burst = RATE_LIMITS[DataSource.YAHOO_FINANCE].burst_limit
 
-        # Make two requests to Yahoo Finance
+        # Make one request more than the burst allows
         start = time.monotonic()
-        limiter.acquire_sync(DataSource.YAHOO_FINANCE)
-        limiter.acquire_sync(DataSource.YAHOO_FINANCE)
+        for _ in range(burst + 1):
+            limiter.acquire_sync(DataSource.YAHOO_FINANCE)
         elapsed = time.monotonic() - start
 
         # Should have waited at least the minimum interval
         min_interval = RATE_LIMITS[DataSource.YAHOO_FINANCE].min_interval
         assert elapsed >= min_interval * 0.9  # Allow 10% tolerance
 
+    def test_sync_acquire_threads_spaced(self):
+        """Test that concurrent sync acquires past the burst each get their own slot."""
+        limiter = RateLimiter()
+        burst = RATE_LIMITS[DataSource.YAHOO_FINANCE].burst_limit
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for _ in range(burst + 2):
+                executor.submit(limiter.acquire_sync, DataSource.YAHOO_FINANCE)
+        elapsed = time.monotonic() - start
+
+        min_interval = RATE_LIMITS[DataSource.YAHOO_FINANCE].min_interval
+        assert elapsed >= 2 * min_interval * 0.9
+
+    def test_tokens_refill(self):
+        """Test that tokens come back at requests_per_second after a pause."""
+        limiter = RateLimiter()
+        config = RATE_LIMITS[DataSource.YAHOO_FINANCE]
+
+        for _ in range(config.burst_limit):
+            limiter.acquire_sync(DataSource.YAHOO_FINANCE)
+        time.sleep(config.min_interval)
+
+        start = time.monotonic()
+        limiter.acquire_sync(DataSource.YAHOO_FINANCE)
+        assert time.monotonic() - start < 0.1
+
     def test_different_sources_independent(self):
         """Test that different sources have independent rate limits."""
         limiter = RateLimiter()
@@ -64,22 +129,184 @@ class TestRateLimiter:
         assert limiter1 is limiter2
 
 
+class TestBackpressure:
+    """Tests for AIMD backpressure in RateLimiter.call."""
+
+    @pytest.fixture
+    def limiter(self, monkeypatch):
+        """Limiter without request spacing, so only concurrency control applies."""
+        limiter = RateLimiter()
+        monkeypatch.setattr(limiter, "_acquire_sync", lambda source, config: None)
+        return limiter
+
+    def test_call_returns_result(self, limiter):
+        """Test that successful calls pass arguments and results through."""
+        assert limiter.call(DataSource.COINGECKO, lambda x, y=0: x + y, 1, y=2) == 3
+
+    def test_throttled_call_retried_and_limit_halved(self, limiter):
+        """Test that a 429 halves concurrency and the call is retried."""
+        attempts = []
+
+        def fetch():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ThrottledError()
+            return "ok"
+
+        limit = limiter.concurrency(DataSource.COINGECKO)
+        assert limiter.call(DataSource.COINGECKO, fetch) == "ok"
+        assert len(attempts) == 2
+        assert limiter.concurrency(DataSource.COINGECKO) == limit * 0.5 + 0.5
+
+    def test_throttling_gives_up_after_retries(self, limiter):
+        """Test that persistent throttling is raised to the caller."""
+
+        def fetch():
+            raise ThrottledError()
+
+        with pytest.raises(ThrottledError):
+            limiter.call(DataSource.FRED, fetch)
+        assert limiter.concurrency(DataSource.FRED) < RATE_LIMITS[DataSource.FRED].burst_limit
+
+    def test_long_retry_after_raised_without_waiting(self, limiter):
+        """Test that a Retry-After beyond THROTTLE_MAX_DELAY is not slept on."""
+        attempts = []
+
+        def fetch():
+            attempts.append(1)
+            raise ThrottledError(retry_after="3600")
+
+        start = time.monotonic()
+        with pytest.raises(ThrottledError):
+            limiter.call(DataSource.FRED, fetch)
+
+        assert time.monotonic() - start < 1.0
+        assert len(attempts) == 1
+
+    def test_http_throttling_retried_only_by_limiter(self, monkeypatch):
+        """Test that a 429 from the shared session is retried by call alone."""
+        requests_seen = []
+
+        class TooManyRequests(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_seen.append(self.path)
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), TooManyRequests)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setattr(RateLimiter, "_acquire_sync", lambda self, source, config: None)
+        try:
+            with pytest.raises(requests.HTTPError):
+                RateLimiter().call(
+                    DataSource.COINGECKO,
+                    get_json,
+                    f"http://127.0.0.1:{server.server_port}/",
+                    session=_create_session(),
+                )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(requests_seen) == rate_limiter.THROTTLE_RETRIES + 1
+
+    def test_other_errors_not_retried(self, limiter):
+        """Test that non-throttling errors propagate immediately."""
+        attempts = []
+
+        def fetch():
+            attempts.append(1)
+            raise ValueError("bad symbol")
+
+        with pytest.raises(ValueError):
+            limiter.call(DataSource.COINGECKO, fetch)
+        assert len(attempts) == 1
+
+    def test_pycoingecko_error_body_recognised(self, limiter, monkeypatch):
+        """Test that pycoingecko's ValueError with a 429 body counts as throttling."""
+        monkeypatch.setattr(rate_limiter, "THROTTLE_BACKOFF", 0.0)
+        attempts = []
+
+        def fetch():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError({"status": {"error_code": 429}})
+            return "ok"
+
+        limiter.call(DataSource.COINGECKO, fetch)
+        assert len(attempts) == 2
+
+    def test_concurrency_limit_enforced(self, limiter, monkeypatch):
+        """Test that no more than the concurrency limit run at once."""
+        monkeypatch.setattr(rate_limiter, "AIMD_INCREASE", 0.0)
+        limiter._concurrency[DataSource.YAHOO_FINANCE] = 2.0
+        running = []
+        peak = []
+
+        def fetch():
+            running.append(1)
+            peak.append(len(running))
+            time.sleep(0.05)
+            running.pop()
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            for _ in range(6):
+                executor.submit(limiter.call, DataSource.YAHOO_FINANCE, fetch)
+
+        assert max(peak) == 2
+
+
 @pytest.mark.asyncio
 class TestAsyncRateLimiter:
     """Async tests for rate limiter."""
 
     async def test_async_acquire_timing(self):
-        """Test that async acquire respects rate limits."""
+        """Test that async acquire respects rate limits once the burst is spent."""
         limiter = RateLimiter()
+        burst = RATE_LIMITS[DataSource.YAHOO_FINANCE].burst_limit
 
         start = time.monotonic()
-        await limiter.acquire(DataSource.YAHOO_FINANCE)
-        await limiter.acquire(DataSource.YAHOO_FINANCE)
+        for _ in range(burst + 1):
+            await limiter.acquire(DataSource.YAHOO_FINANCE)
         elapsed = time.monotonic() - start
 
         min_interval = RATE_LIMITS[DataSource.YAHOO_FINANCE].min_interval
         assert elapsed >= min_interval * 0.9
 
 
+    async def test_async_acquire_concurrent_spaced(self):
+        """Test that concurrent coroutines past the burst each get their own slot."""
+        limiter = RateLimiter()
+        burst = RATE_LIMITS[DataSource.YAHOO_FINANCE].burst_limit
+
+        start = time.monotonic()
+        await asyncio.gather(
+            *(limiter.acquire(DataSource.YAHOO_FINANCE) for _ in range(burst + 2))
+        )
+        elapsed = time.monotonic() - start
+
+        min_interval = RATE_LIMITS[DataSource.YAHOO_FINANCE].min_interval
+        assert elapsed >= 2 * min_interval * 0.9
+
+
+def test_async_acquire_across_event_loops():
+    """Test that one limiter can be used from successive event loops."""
+    limiter = RateLimiter()
+    burst = RATE_LIMITS[DataSource.YAHOO_FINANCE].burst_limit
+
+    async def spend():
+        await asyncio.gather(
+            *(limiter.acquire(DataSource.YAHOO_FINANCE) for _ in range(burst))
+        )
+
+    asyncio.run(spend())
+    asyncio.run(limiter.acquire(DataSource.FRED))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,335 @@
+"""Tests for the scratchpad manager."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from argent.schemas.outputs import Signal, SignalOutput, TechnicalAnalysisOutput
+from argent.scratchpad import manager
+from argent.scratchpad.manager import Scratchpad, get_scratchpad
+from argent.scratchpad.semantic import fingerprint, semantic_lookup, semantic_store
+
+
+@pytest.fixture
+def scratchpad(tmp_path):
+    """Scratchpad rooted in a temporary directory."""
+    return Scratchpad(session_id="test_session", scratchpad_dir=tmp_path)
+
+
+class TestScratchpad:
+    """Tests for scratchpad reads and writes."""
+
+    def test_round_trip(self, scratchpad):
+        """Test that written data is read back unchanged."""
+        when = datetime(2024, 1, 15, 9, 30)
+        scratchpad.write("market_data", "AAPL", {"close": [1.0, 2.5], "asof": when})
+
+        data = scratchpad.read("market_data", "AAPL")
+
+        assert data == {"close": [1.0, 2.5], "asof": when}
+
+    def test_missing_entry(self, scratchpad):
+        """Test that missing entries read as None."""
+        assert scratchpad.read("market_data", "MSFT") is None
+        assert scratchpad.read_with_metadata("market_data", "MSFT") == (None, {})
+
+    def test_overwrite_visible_after_cached_read(self, scratchpad):
+        """Test that a rewrite is seen even after the entry was cached."""
+        scratchpad.write("market_data", "AAPL", {"close": 1.0})
+        assert scratchpad.read("market_data", "AAPL") == {"close": 1.0}
+
+        scratchpad.write("market_data", "AAPL", {"close": 2.0})
+        assert scratchpad.read("market_data", "AAPL") == {"close": 2.0}
+
+    def test_cached_reads_return_fresh_objects(self, scratchpad):
+        """Test that mutating a read result does not affect later reads."""
+        closes = [100.0 + i * 0.25 for i in range(1000)]
+        scratchpad.write("market_data", "AAPL", {"close": [1.0]})
+        scratchpad.write("market_data", "MSFT", {"close": closes})
+
+        for key, expected in (("AAPL", [1.0]), ("MSFT", closes)):
+            first = scratchpad.read("market_data", key)
+            first["close"].append(0.0)
+            first["extra"] = True
+
+            assert scratchpad.read("market_data", key) == {"close": expected}
+
+    def test_write_from_other_instance(self, scratchpad, tmp_path):
+        """Test that writes from another instance invalidate the memory cache."""
+        scratchpad.write("market_data", "AAPL", {"close": 1.0})
+        assert scratchpad.read("market_data", "AAPL") == {"close": 1.0}
+
+        other = Scratchpad(session_id="test_session", scratchpad_dir=tmp_path)
+        other.write("market_data", "AAPL", {"close": 3.0, "extra": True})
+
+        assert scratchpad.read("market_data", "AAPL") == {"close": 3.0, "extra": True}
+
+    def test_metadata(self, scratchpad):
+        """Test that metadata and timestamp are returned."""
+        scratchpad.write("news", "AAPL", ["headline"], metadata={"source": "yahoo"})
+
+        data, metadata = scratchpad.read_with_metadata("news", "AAPL")
+
+        assert data == ["headline"]
+        assert metadata["source"] == "yahoo"
+        assert "_timestamp" in metadata
+
+    def test_delete_and_clear(self, scratchpad):
+        """Test that deleted entries are no longer readable."""
+        scratchpad.write("market_data", "AAPL", 1)
+        scratchpad.write("market_data", "MSFT", 2)
+        scratchpad.read("market_data", "AAPL")
+
+        assert scratchpad.delete("market_data", "AAPL")
+        assert scratchpad.read("market_data", "AAPL") is None
+
+        assert scratchpad.clear_category("market_data") == 1
+        assert scratchpad.list_keys("market_data") == []
+
+        scratchpad.write("risk_analysis", "AAPL", 3)
+        scratchpad.clear_session()
+        assert scratchpad.list_categories() == []
+
+    def test_write_many(self, scratchpad):
+        """Test batch writes of several keys."""
+        count = scratchpad.write_many(
+            "market_data",
+            {"AAPL": {"close": 1.0}, "BRK.B": {"close": 2.0}},
+            metadata={"source": "yahoo"},
+        )
+
+        assert count == 2
+        assert sorted(scratchpad.list_keys("market_data")) == ["AAPL", "BRK.B"]
+        data, metadata = scratchpad.read_with_metadata("market_data", "BRK.B")
+        assert data == {"close": 2.0}
+        assert metadata["source"] == "yahoo"
+
+    def test_large_payloads_deduplicated(self, scratchpad):
+        """Test that identical large payloads are stored once."""
+        closes = [100.0 + i * 0.25 for i in range(1000)]
+        scratchpad.write("market_data", "AAPL", {"close": closes})
+        scratchpad.write("technical_analysis", "AAPL", {"close": closes})
+
+        objects = list((scratchpad.session_dir / "_objects").glob("*.json"))
+        assert len(objects) == 1
+        assert scratchpad.read("technical_analysis", "AAPL") == {"close": closes}
+        assert sorted(scratchpad.list_categories()) == ["market_data", "technical_analysis"]
+
+    def test_unreferenced_objects_removed(self, scratchpad, monkeypatch):
+        """Test that objects are removed once no entry references them."""
+        objects_dir = scratchpad.session_dir / "_objects"
+        closes = [100.0 + i * 0.25 for i in range(1000)]
+        monkeypatch.setattr(manager, "OBJECT_SWEEP_INTERVAL", 1)
+        scratchpad.write("market_data", "AAPL", {"close": closes})
+        scratchpad.write("technical_analysis", "AAPL", {"close": closes})
+
+        assert scratchpad.delete("market_data", "AAPL")
+        assert len(list(objects_dir.glob("*.json"))) == 1
+        assert scratchpad.clear_category("technical_analysis") == 1
+        assert list(objects_dir.glob("*.json")) == []
+
+        scratchpad.write("market_data", "AAPL", {"close": closes})
+        scratchpad.write("market_data", "AAPL", {"close": closes[::-1]})
+        assert len(list(objects_dir.glob("*.json"))) == 1
+        assert scratchpad.read("market_data", "AAPL") == {"close": closes[::-1]}
+
+    def test_deletes_sweep_in_batches(self, scratchpad, monkeypatch):
+        """Test that object-backed deletes only sweep every OBJECT_SWEEP_INTERVAL changes."""
+        monkeypatch.setattr(manager, "OBJECT_SWEEP_INTERVAL", 4)
+        for i in range(2):
+            scratchpad.write("market_data", f"K{i}", {"close": [float(i)] * 2000})
+        sweeps = []
+        monkeypatch.setattr(Scratchpad, "sweep_objects", lambda self: sweeps.append(1))
+        assert scratchpad.delete("market_data", "K0")
+        assert sweeps == []
+
+        assert scratchpad.delete("market_data", "K1")
+        assert sweeps == [1]
+
+    def test_inline_entry_encoded_once(self, scratchpad):
+        """Test that inline payloads are spliced into valid entry JSON."""
+        scratchpad.write("market_data", "AAPL", {"close": 1.0}, metadata={"source": "yahoo"})
+
+        raw = manager._loads((scratchpad.session_dir / "market_data" / "AAPL.json").read_bytes())
+
+        assert raw["data"] == {"close": 1.0}
+        assert raw["metadata"] == {"source": "yahoo"}
+
+    def test_reserved_category_rejected(self, scratchpad):
+        """Test that the object store directory cannot be used as a category."""
+        with pytest.raises(ValueError):
+            scratchpad.write("_objects", "AAPL", 1)
+        with pytest.raises(ValueError):
+            scratchpad.write_many("_objects", {"AAPL": 1})
+        with pytest.raises(ValueError):
+            scratchpad.clear_category("_objects")
+
+    def test_write_leaves_no_temp_files(self, scratchpad):
+        """Test that atomic writes clean up their temporary files."""
+        scratchpad.write("market_data", "AAPL", {"close": 1.0})
+        scratchpad.write("market_data", "AAPL", {"close": 2.0})
+        scratchpad.write_many("market_data", {"MSFT": 3.0, "GOOG": 4.0})
+
+        names = sorted(p.name for p in (scratchpad.session_dir / "market_data").iterdir())
+        assert names == ["AAPL.json", "GOOG.json", "MSFT.json"]
+        assert scratchpad.read("market_data", "AAPL") == {"close": 2.0}
+
+    def test_failed_write_removes_temp_file(self, scratchpad, monkeypatch):
+        """Test that a write failing part way leaves no temporary file behind."""
+        scratchpad.write("market_data", "AAPL", {"close": 1.0})
+
+        def fail(src, dst):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(manager.os, "replace", fail)
+        with pytest.raises(OSError):
+            scratchpad.write("market_data", "AAPL", {"close": 2.0})
+        monkeypatch.undo()
+
+        names = [p.name for p in (scratchpad.session_dir / "market_data").iterdir()]
+        assert names == ["AAPL.json"]
+        assert scratchpad.read("market_data", "AAPL") == {"close": 1.0}
+
+    def test_cached_read_survives_concurrent_delete(self, scratchpad):
+        """Test that an entry dropped right after its cache lookup is still returned."""
+        scratchpad.write("market_data", "AAPL", {"close": 1.0})
+        scratchpad.read("market_data", "AAPL")
+
+        class RacingDict(OrderedDict):
+            def get(self, key, default=None):
+                # Another thread pops the entry between get and move_to_end
+                return self.pop(key, default)
+
+        scratchpad._mem = RacingDict(scratchpad._mem)
+
+        assert scratchpad.read("market_data", "AAPL") == {"close": 1.0}
+
+class TestGetScratchpad:
+    """Tests for scratchpad instance lookup."""
+
+    def test_same_session_shares_instance(self, tmp_path, monkeypatch):
+        """Test that one session id resolves to one live instance."""
+        monkeypatch.setattr(manager, "SCRATCHPAD_DIR", tmp_path)
+
+        first = get_scratchpad("shared_session")
+
+        assert get_scratchpad("shared_session") is first
+        assert get_scratchpad("other_session") is not first
+        assert first.session_dir == tmp_path / "shared_session"
+
+
+class TestReadOrFetch:
+    """Tests for fetch deduplication through the scratchpad."""
+
+    def test_fetches_once(self, scratchpad):
+        """Test that the fetcher only runs on a miss."""
+        calls = []
+
+        def fetcher():
+            calls.append(1)
+            return {"close": 1.0}
+
+        assert scratchpad.read_or_fetch("market_data", "AAPL", fetcher) == {"close": 1.0}
+        assert scratchpad.read_or_fetch("market_data", "AAPL", fetcher) == {"close": 1.0}
+        assert len(calls) == 1
+
+    def test_concurrent_threads_share_fetch(self, scratchpad):
+        """Test that concurrent threads for one key trigger a single fetch."""
+        calls = []
+
+        def fetcher():
+            calls.append(1)
+            time.sleep(0.05)
+            return [1, 2, 3]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda _: scratchpad.read_or_fetch("market_data", "AAPL", fetcher),
+                    range(4),
+                )
+            )
+
+        assert results == [[1, 2, 3]] * 4
+        assert len(calls) == 1
+
+    async def test_async_concurrent_share_fetch(self, scratchpad):
+        """Test that concurrent coroutines for one key trigger a single fetch."""
+        calls = []
+
+        async def fetcher():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"score": 0.5}
+
+        results = await asyncio.gather(
+            *(scratchpad.aread_or_fetch("news", "AAPL", fetcher) for _ in range(3))
+        )
+
+        assert results == [{"score": 0.5}] * 3
+        assert len(calls) == 1
+
+
+class TestSemanticCache:
+    """Tests for fingerprint-keyed output reuse."""
+
+    def test_fingerprint_tolerates_small_moves(self):
+        """Test that nearby prices share a fingerprint and distant ones do not."""
+        base = fingerprint({"close": [100.0, 101.0], "news": ["a1"]})
+
+        assert fingerprint({"close": [100.01, 101.01], "news": ["a1"]}) == base
+        assert fingerprint({"close": [103.0, 101.0], "news": ["a1"]}) != base
+        assert fingerprint({"close": [100.0, 101.0], "news": ["a2"]}) != base
+
+    def test_lookup_requires_matching_fingerprint(self, scratchpad):
+        """Test that stored outputs are only returned for the same state."""
+        state_fp = fingerprint({"close": [100.0]})
+        semantic_store(scratchpad, "technical_analysis", "AAPL", state_fp, {"trend": "up"})
+
+        assert semantic_lookup(scratchpad, "technical_analysis", "AAPL", state_fp) == {
+            "trend": "up"
+        }
+        other_fp = fingerprint({"close": [120.0]})
+        assert semantic_lookup(scratchpad, "technical_analysis", "AAPL", other_fp) is None
+
+
+class TestReadAs:
+    """Tests for typed reads into output schemas."""
+
+    def _output(self, interpretation="Uptrend intact"):
+        return TechnicalAnalysisOutput(
+            symbol="AAPL",
+            signal=SignalOutput(signal="buy", confidence=0.7),
+            current_price=190.5,
+            trend="uptrend",
+            trend_strength=0.6,
+            interpretation=interpretation,
+        )
+
+    def test_inline_round_trip(self, scratchpad):
+        """Test that a small model is read back as the same model."""
+        output = self._output()
+        scratchpad.write("technical_analysis", "AAPL", output)
+
+        read = scratchpad.read_as(TechnicalAnalysisOutput, "technical_analysis", "AAPL")
+        assert read == output
+        assert read.signal.signal is Signal.BUY
+
+    def test_object_store_round_trip(self, scratchpad):
+        """Test that a large model stored by hash is read back unchanged."""
+        output = self._output(interpretation="x" * 5000)
+        scratchpad.write("technical_analysis", "AAPL", output)
+
+        read = scratchpad.read_as(TechnicalAnalysisOutput, "technical_analysis", "AAPL")
+        assert read == output
+
+    def test_missing_or_invalid(self, scratchpad):
+        """Test that missing or non-matching entries read as None."""
+        assert scratchpad.read_as(TechnicalAnalysisOutput, "technical_analysis", "MSFT") is None
+
+        scratchpad.write("technical_analysis", "MSFT", {"symbol": "MSFT"})
+        assert scratchpad.read_as(TechnicalAnalysisOutput, "technical_analysis", "MSFT") is None
@@ -0,0 +1,477 @@
+"""Tests for the storage repository."""
+
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from argent.storage import TechnicalAnalysisResult, repository
+from argent.storage.models import AnalysisPhase, AssetType
+from argent.storage.repository import AsyncRepository, Repository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository backed by a temporary SQLite database."""
+    repository = Repository(f"sqlite:///{tmp_path / 'argent.db'}")
+    yield repository
+    repository.close()
+
+
+def _prices(count: int, start: datetime = datetime(2024, 1, 1)) -> list[dict]:
+    return [
+        {
+            "timestamp": start + timedelta(days=i),
+            "open": 100.0 + i,
+            "high": 101.0 + i,
+            "low": 99.0 + i,
+            "close": 100.5 + i,
+            "volume": 1000 + i,
+        }
+        for i in range(count)
+    ]
+
+
+class TestRepository:
+    """Tests for engine and schema setup."""
+
+    def test_sqlite_uses_wal(self, repo):
+        """Test that SQLite connections are switched to WAL journaling."""
+        with repo._engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+    def test_second_instance_shares_schema(self, tmp_path):
+        """Test that a second repository on the same URL sees existing data."""
+        url = f"sqlite:///{tmp_path / 'shared.db'}"
+        first = Repository(url)
+        first.save_price_history("AAPL", _prices(3))
+
+        second = Repository(url)
+        assert len(second.get_price_history("AAPL")) == 3
+
+        first.close()
+        second.close()
+
+
+    def test_schema_creation_can_be_deferred(self, tmp_path):
+        """Test that create_schema=False leaves a new database untouched."""
+        url = f"sqlite:///{tmp_path / 'deferred.db'}"
+        repo = Repository(url, create_schema=False)
+
+        with repo._engine.connect() as connection:
+            tables = connection.exec_driver_sql("SELECT name FROM sqlite_master").all()
+        assert tables == []
+
+        repo.create_schema()
+        assert repo.save_price_history("AAPL", _prices(2)) == 2
+        repo.close()
+
+    def test_reads_use_replica(self, tmp_path):
+        """Test that get_* methods read from the replica when one is configured."""
+        primary_url = f"sqlite:///{tmp_path / 'primary.db'}"
+        replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+        Repository(replica_url).close()
+
+        repo = Repository(primary_url, read_database_url=replica_url)
+        repo.save_price_history("AAPL", _prices(3))
+
+        assert repo.get_price_history("AAPL") == []
+        assert len(Repository(primary_url).get_price_history("AAPL")) == 3
+        repo.close()
+
+
+class TestPriceHistory:
+    """Tests for price history persistence."""
+
+    def test_save_and_read(self, repo):
+        """Test that saved prices are read back newest first."""
+        assert repo.save_price_history("AAPL", _prices(30)) == 30
+
+        history = repo.get_price_history("AAPL", limit=10)
+
+        assert len(history) == 10
+        assert history[0]["timestamp"] == datetime(2024, 1, 30)
+        assert history[0]["close"] == pytest.approx(129.5)
+        assert history[0]["source"] == "yahoo_finance"
+
+    def test_date_range(self, repo):
+        """Test that start and end dates bound the returned rows."""
+        repo.save_price_history("AAPL", _prices(30))
+
+        history = repo.get_price_history(
+            "AAPL", start_date=datetime(2024, 1, 10), end_date=datetime(2024, 1, 14)
+        )
+        assert [p["timestamp"].day for p in history] == [14, 13, 12, 11, 10]
+        assert len(repo.get_price_history("AAPL", start_date=datetime(2024, 1, 25))) == 6
+
+    def test_iter_in_batches(self, repo):
+        """Test that streamed history is complete and oldest first."""
+        repo.save_price_history("AAPL", _prices(25))
+
+        rows = list(repo.iter_price_history("AAPL", start_date=datetime(2024, 1, 3), batch_size=4))
+
+        assert len(rows) == 23
+        assert rows[0]["timestamp"] == datetime(2024, 1, 3)
+        assert rows[-1]["timestamp"] == datetime(2024, 1, 25)
+        assert list(repo.iter_price_history("MSFT")) == []
+
+    def test_save_empty(self, repo):
+        """Test that an empty batch writes nothing."""
+        assert repo.save_price_history("AAPL", []) == 0
+        assert repo.get_price_history("AAPL") == []
+
+
+class TestPriceChunks:
+    """Tests for columnar price chunks."""
+
+    def test_round_trip(self, repo):
+        """Test that a chunk decodes back to the original columns in time order."""
+        prices = _prices(20)
+        assert repo.save_price_chunk("AAPL", list(reversed(prices))) == 20
+
+        arrays = repo.get_price_arrays("AAPL")
+
+        assert arrays["timestamp"][0] == np.datetime64("2024-01-01T00:00:00")
+        np.testing.assert_array_equal(arrays["close"], [p["close"] for p in prices])
+        np.testing.assert_array_equal(arrays["volume"], [p["volume"] for p in prices])
+
+    def test_range_across_chunks(self, repo):
+        """Test that a date range spanning two chunks is trimmed exactly."""
+        repo.save_price_chunk("AAPL", _prices(10))
+        repo.save_price_chunk("AAPL", _prices(10, start=datetime(2024, 1, 11)))
+
+        arrays = repo.get_price_arrays(
+            "AAPL", start_date=datetime(2024, 1, 8), end_date=datetime(2024, 1, 12)
+        )
+
+        assert len(arrays["open"]) == 5
+        np.testing.assert_array_equal(arrays["open"], [107.0, 108.0, 109.0, 100.0, 101.0])
+
+    def test_missing_symbol(self, repo):
+        """Test that an unknown symbol yields empty arrays."""
+        arrays = repo.get_price_arrays("MSFT")
+
+        assert all(len(values) == 0 for values in arrays.values())
+        assert arrays["timestamp"].dtype == np.dtype("datetime64[s]")
+
+
+class TestEconomicData:
+    """Tests for economic data persistence."""
+
+    def test_save_and_read(self, repo):
+        """Test that indicator points are read back newest first."""
+        points = [
+            {
+                "series_id": "FEDFUNDS",
+                "name": "Federal Funds Rate",
+                "date": datetime(2024, month, 1),
+                "value": 5.0 + month / 100,
+                "frequency": "monthly",
+            }
+            for month in range(1, 7)
+        ]
+
+        assert repo.save_economic_data(points) == 6
+
+        data = repo.get_economic_data("FEDFUNDS", limit=3)
+        assert [d["date"].month for d in data] == [6, 5, 4]
+        assert data[0]["units"] is None
+
+    def test_save_in_chunks(self, repo, monkeypatch):
+        """Test that batches larger than one chunk are fully written."""
+        monkeypatch.setattr(repository, "BULK_INSERT_CHUNK", 4)
+        points = [
+            {
+                "series_id": "DGS10",
+                "name": "10-Year Treasury",
+                "date": datetime(2024, 1, 1) + timedelta(days=i),
+                "value": 4.0,
+                "frequency": "daily",
+                "units": "percent",
+            }
+            for i in range(10)
+        ]
+
+        assert repo.save_economic_data(points) == 10
+        assert len(repo.get_economic_data("DGS10")) == 10
+
+
+class TestAnalysisSessions:
+    """Tests for analysis session tracking."""
+
+    def test_create_and_update(self, repo):
+        """Test that returned sessions stay readable after their session closes."""
+        created = repo.create_analysis_session("s1", "analyze AAPL", ["AAPL"], "short")
+        assert created.id is not None
+        assert created.status == "in_progress"
+        assert repo.get_analysis_session("s1").symbols == ["AAPL"]
+
+        updated = repo.update_analysis_session(
+            "s1", status="completed", final_report="# Report", input_tokens=10, output_tokens=5
+        )
+
+        assert updated.status == "completed"
+        assert updated.completed_at is not None
+        assert updated.total_input_tokens == 10
+        assert repo.get_analysis_session("s1").final_report == "# Report"
+        assert repo.update_analysis_session("s1", input_tokens=3).total_input_tokens == 13
+        assert repo.get_analysis_session("s1").status == "completed"
+        assert repo.update_analysis_session("missing", status="failed") is None
+
+    def test_get_or_create_symbol(self, repo):
+        """Test that a symbol is created once and then reused."""
+        first = repo.get_or_create_symbol("BTC", name="Bitcoin")
+        second = repo.get_or_create_symbol("BTC")
+
+        assert first.id == second.id
+        assert second.name == "Bitcoin"
+
+    def test_enum_columns_store_plain_values(self, repo):
+        """Test that enum columns load as strings and reject unknown values."""
+        assert repo.get_or_create_symbol("ETH", asset_type=AssetType.CRYPTO).asset_type == "crypto"
+        repo.create_analysis_session("s1", "analyze", ["ETH"], "short")
+
+        updated = repo.update_analysis_session("s1", phase=AnalysisPhase.REPORT)
+        assert type(updated.phase) is str
+        assert updated.phase == AnalysisPhase.REPORT
+
+        with pytest.raises(IntegrityError):
+            repo.get_or_create_symbol("GLD", asset_type="commodity")
+
+    def test_enum_names_migrated(self, tmp_path):
+        """Test that member names stored by the old Enum columns become values."""
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        legacy = Repository(url, create_schema=False)
+        with legacy._engine.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE TABLE symbols (id INTEGER PRIMARY KEY, symbol VARCHAR(20) UNIQUE, "
+                "name VARCHAR(255), asset_type VARCHAR(6), sector VARCHAR(100), "
+                "industry VARCHAR(100), exchange VARCHAR(50), created_at DATETIME, "
+                "updated_at DATETIME)"
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO symbols (symbol, asset_type) "
+                "VALUES ('AAPL', 'STOCK'), ('BTC', 'crypto')"
+            )
+        legacy.close()
+
+        repo = Repository(url)
+
+        assert repo.get_symbol("AAPL").asset_type == AssetType.STOCK.value
+        assert repo.get_symbol("BTC").asset_type == AssetType.CRYPTO.value
+        repo.close()
+
+    def test_lookups_are_cached(self, repo):
+        """Test that repeat lookups return cached rows and updates refresh them."""
+        repo.get_or_create_symbol("AAPL", name="Apple")
+        repo.create_analysis_session("s1", "analyze AAPL", ["AAPL"], "short")
+
+        assert repo.get_symbol("AAPL") is repo.get_symbol("AAPL")
+        assert repo.get_analysis_session("s1") is repo.get_analysis_session("s1")
+
+        repo.update_analysis_session("s1", status="completed")
+        assert repo.get_analysis_session("s1").status == "completed"
+
+    def test_lru_cache_evicts_oldest(self):
+        """Test that the object cache keeps only the most recently used entries."""
+        cache = repository._LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert list(cache) == ["a", "c"]
+
+    def test_lru_cache_concurrent_access(self):
+        """Test that concurrent gets, puts and pops never raise."""
+        cache = repository._LRUCache(4)
+
+        def churn(offset: int) -> None:
+            for i in range(20000):
+                key = (i + offset) % 8
+                cache.put(key, i)
+                cache.get(key)
+                cache.pop((key + 1) % 8)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(churn, offset) for offset in range(4)]:
+                future.result()
+
+        assert len(cache) <= 4
+
+    def test_failed_write_does_not_cache_symbol(self, repo):
+        """Test that a symbol from a rolled back write is neither stored nor cached."""
+        with pytest.raises(KeyError):
+            repo.save_price_history("NVDA", [{"timestamp": datetime(2024, 1, 1)}])
+
+        assert repo.get_symbol("NVDA") is None
+        assert "NVDA" not in repo._symbol_ids
+
+        assert repo.save_price_history("NVDA", _prices(2)) == 2
+        assert repo._symbol_ids["NVDA"] == repo.get_symbol("NVDA").id
+
+
+class TestAnalysisResults:
+    """Tests for per-session analysis results."""
+
+    def test_technical_result_requires_session_and_symbol(self, repo):
+        """Test that technical results need an existing session and symbol."""
+        assert repo.save_technical_result("missing", "AAPL", {"rsi": 55.0}) is None
+
+        repo.create_analysis_session("s1", "analyze AAPL", ["AAPL"], "medium")
+        assert repo.save_technical_result("s1", "AAPL", {"rsi": 55.0}) is None
+
+        repo.save_price_history("AAPL", _prices(5))
+        result = repo.save_technical_result("s1", "AAPL", {"rsi": 55.0, "support_levels": [95.0]})
+
+        assert result is not None
+        assert result.rsi == 55.0
+        assert result.support_levels == [95.0]
+
+    def test_levels_round_trip(self, repo):
+        """Test that support and resistance levels survive packing."""
+        repo.create_analysis_session("s1", "analyze AAPL", ["AAPL"], "medium")
+        repo.save_price_history("AAPL", _prices(5))
+        indicators = {
+            "support_levels": [97.5, 95.25],
+            "resistance_levels": [101.37999725341797] + [100.0 + i / 4 for i in range(40)],
+            "rsi": 40.0,
+        }
+
+        result = repo.save_technical_result("s1", "AAPL", indicators)
+
+        with repo._get_session() as session:
+            stored = session.get(TechnicalAnalysisResult, result.id)
+            assert stored.support_levels == [97.5, 95.25]
+            assert stored.resistance_levels == indicators["resistance_levels"]
+
+    def test_large_levels_round_trip(self, repo):
+        """Test that values too large for the fixed-point path are stored exactly."""
+        repo.create_analysis_session("s1", "analyze AAPL", ["AAPL"], "medium")
+        repo.save_price_history("AAPL", _prices(5))
+        indicators = {
+            "support_levels": [1e15, 95.0],
+            "resistance_levels": [2e18, -2e18],
+        }
+
+        result = repo.save_technical_result("s1", "AAPL", indicators)
+
+        with repo._get_session() as session:
+            stored = session.get(TechnicalAnalysisResult, result.id)
+            assert stored.support_levels == [1e15, 95.0]
+            assert stored.resistance_levels == [2e18, -2e18]
+
+    def test_non_finite_levels_round_trip(self, repo):
+        """Test that NaN and infinite levels are stored rather than rejected."""
+        repo.create_analysis_session("s1", "analyze AAPL", ["AAPL"], "medium")
+        repo.save_price_history("AAPL", _prices(5))
+        indicators = {
+            "support_levels": [95.0, float("nan")],
+            "resistance_levels": [float("inf"), 101.5, float("-inf")],
+        }
+
+        result = repo.save_technical_result("s1", "AAPL", indicators)
+
+        with repo._get_session() as session:
+            stored = session.get(TechnicalAnalysisResult, result.id)
+            assert stored.support_levels[0] == 95.0
+            assert math.isnan(stored.support_levels[1])
+            assert stored.resistance_levels == indicators["resistance_levels"]
+
+    def test_recommendations_round_trip(self, repo):
+        """Test that recommendations are stored per session, creating symbols."""
+        repo.create_analysis_session("s1", "analyze", ["AAPL", "MSFT"], "long")
+
+        for symbol in ("AAPL", "MSFT"):
+            rec = repo.save_recommendation(
+                "s1", symbol, {"action": "buy", "rationale": f"{symbol} looks cheap"}
+            )
+            assert rec is not None
+
+        recommendations = repo.get_recommendations("s1")
+
+        assert sorted(r["rationale"] for r in recommendations) == [
+            "AAPL looks cheap",
+            "MSFT looks cheap",
+        ]
+        assert repo.get_symbol("MSFT") is not None
+        assert repo.get_recommendations("missing") == []
+        assert len(list(repo.iter_recommendations("s1", batch_size=1))) == 2
+
+    def test_result_saves_use_few_statements(self, repo):
+        """Test that result saves resolve keys in one query, then hit the caches."""
+        repo.create_analysis_session("s1", "analyze", ["AAPL"], "long")
+        repo.get_or_create_symbol("AAPL")
+        repo2 = Repository(str(repo._engine.url))
+        statements = []
+        event.listen(
+            repo2._engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        repo2.save_technical_result("s1", "AAPL", {"rsi": 50.0})
+        assert len(statements) == 2
+
+        statements.clear()
+        repo2.save_recommendation("s1", "AAPL", {"action": "hold", "rationale": "range bound"})
+        assert len(statements) == 1
+        repo2.close()
+
+    def test_iter_recommendations_unknown_session(self, repo):
+        """Test that streaming recommendations for an unknown session yields nothing."""
+        assert list(repo.iter_recommendations("missing")) == []
+
+    def test_streaming_reads_use_transactional_session(self, repo):
+        """Test that streamed queries run outside the autocommit read engine."""
+        repo.create_analysis_session("s1", "analyze", ["AAPL"], "long")
+        repo.save_recommendation("s1", "AAPL", {"action": "hold", "rationale": "range bound"})
+        repo.save_price_history("AAPL", _prices(3))
+        levels = []
+
+        def record(conn, *args):
+            levels.append(conn.get_execution_options().get("isolation_level"))
+
+        event.listen(repo._engine, "before_cursor_execute", record)
+
+        assert len(list(repo.iter_recommendations("s1"))) == 1
+        assert len(list(repo.iter_price_history("AAPL"))) == 3
+        assert levels and "AUTOCOMMIT" not in levels
+
+
+class TestAsyncRepository:
+    """Tests for the awaitable repository facade."""
+
+    def test_concurrent_calls(self, repo):
+        """Test that repository methods can be awaited concurrently."""
+        async_repo = AsyncRepository(repo)
+
+        async def run():
+            await asyncio.gather(
+                *(async_repo.save_price_history(s, _prices(5)) for s in ("AAPL", "MSFT", "GOOG"))
+            )
+            return await asyncio.gather(
+                *(async_repo.get_price_history(s) for s in ("AAPL", "MSFT", "GOOG"))
+            )
+
+        assert [len(history) for history in asyncio.run(run())] == [5, 5, 5]
+
+    def test_in_memory_database_shared_across_threads(self):
+        """Test that worker threads see the same in-memory database."""
+        async_repo = AsyncRepository(Repository("sqlite://"))
+
+        async def run():
+            await async_repo.save_price_history("AAPL", _prices(5))
+            return await async_repo.get_price_history("AAPL")
+
+        assert len(asyncio.run(run())) == 5
+
+    def test_private_attributes_hidden(self, repo):
+        """Test that only public repository methods are exposed."""
+        with pytest.raises(AttributeError):
+            AsyncRepository(repo)._get_session